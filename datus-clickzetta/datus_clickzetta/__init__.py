@@ -26,7 +26,24 @@ def register():
                 vcluster=config.get('vcluster', 'DEFAULT_AP'),
                 secure=config.get('secure', None),
                 hints=config.get('hints', None),
-                extra=config.get('extra', None)
+                extra=config.get('extra', None),
+                pool_min_size=config.get('pool_min_size', 1),
+                pool_max_size=config.get('pool_max_size', 4),
+                pool_timeout=config.get('pool_timeout', 30.0),
+                pool_idle_timeout=config.get('pool_idle_timeout', 600.0),
+                metadata_cache_ttl=config.get('metadata_cache_ttl', 300.0),
+                metadata_cache_size=config.get('metadata_cache_size', 256),
+                column_cache_size=config.get('column_cache_size', 8192),
+                volume_cache_dir=config.get('volume_cache_dir', None),
+                volume_cache_max_bytes=config.get('volume_cache_max_bytes', 256 * 1024 * 1024),
+                incremental_metadata_sync=config.get('incremental_metadata_sync', False),
+                metadata_snapshot_dir=config.get('metadata_snapshot_dir', None),
+                hint_profiles=config.get('hint_profiles', None),
+                metrics_sink=config.get('metrics_sink', None),
+                result_cache_max_bytes=config.get('result_cache_max_bytes', 0),
+                result_cache_ttl=config.get('result_cache_ttl', 300.0),
+                spill_threshold_bytes=config.get('spill_threshold_bytes', 0),
+                spill_dir=config.get('spill_dir', None),
             )
         else:
             # Handle other config types (like Pydantic models)
@@ -40,7 +57,24 @@ def register():
                 vcluster=getattr(config, 'vcluster', 'DEFAULT_AP'),
                 secure=getattr(config, 'secure', None),
                 hints=getattr(config, 'hints', None),
-                extra=getattr(config, 'extra', None)
+                extra=getattr(config, 'extra', None),
+                pool_min_size=getattr(config, 'pool_min_size', 1),
+                pool_max_size=getattr(config, 'pool_max_size', 4),
+                pool_timeout=getattr(config, 'pool_timeout', 30.0),
+                pool_idle_timeout=getattr(config, 'pool_idle_timeout', 600.0),
+                metadata_cache_ttl=getattr(config, 'metadata_cache_ttl', 300.0),
+                metadata_cache_size=getattr(config, 'metadata_cache_size', 256),
+                column_cache_size=getattr(config, 'column_cache_size', 8192),
+                volume_cache_dir=getattr(config, 'volume_cache_dir', None),
+                volume_cache_max_bytes=getattr(config, 'volume_cache_max_bytes', 256 * 1024 * 1024),
+                incremental_metadata_sync=getattr(config, 'incremental_metadata_sync', False),
+                metadata_snapshot_dir=getattr(config, 'metadata_snapshot_dir', None),
+                hint_profiles=getattr(config, 'hint_profiles', None),
+                metrics_sink=getattr(config, 'metrics_sink', None),
+                result_cache_max_bytes=getattr(config, 'result_cache_max_bytes', 0),
+                result_cache_ttl=getattr(config, 'result_cache_ttl', 300.0),
+                spill_threshold_bytes=getattr(config, 'spill_threshold_bytes', 0),
+                spill_dir=getattr(config, 'spill_dir', None),
             )
 
     # Register directly with factory - the ClickZetta connector is self-contained
@@ -0,0 +1,333 @@
+# Copyright 2025-present DatusAI, Inc.
+# Licensed under the Apache License, Version 2.0.
+# See http://www.apache.org/licenses/LICENSE-2.0 for details.
+
+from __future__ import annotations
+
+import hashlib
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, FrozenSet, Generic, Hashable, Iterable, Optional, Tuple, TypeVar
+
+from datus.utils.loggings import get_logger
+
+logger = get_logger(__name__)
+
+V = TypeVar("V")
+
+_MISSING = object()
+
+
+class TTLCache(Generic[V]):
+    """
+    Thread-safe LRU cache whose entries expire ``ttl`` seconds after they are stored.
+
+    ``maxsize`` bounds the number of entries; the least recently used entry is evicted first.
+    A ``ttl`` of ``0`` or less disables expiry.
+    """
+
+    def __init__(self, maxsize: int = 128, ttl: float = 300.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._data: "OrderedDict[Hashable, Tuple[float, V]]" = OrderedDict()
+        self._stats: Dict[str, int] = {"hits": 0, "misses": 0, "evictions": 0, "invalidations": 0}
+
+    def get(self, key: Hashable, default: Optional[V] = None) -> Optional[V]:
+        with self._lock:
+            entry = self._data.get(key, _MISSING)
+            if entry is _MISSING:
+                self._stats["misses"] += 1
+                return default
+            stored_at, value = entry
+            if self.ttl > 0 and time.monotonic() - stored_at > self.ttl:
+                del self._data[key]
+                self._stats["misses"] += 1
+                return default
+            self._data.move_to_end(key)
+            self._stats["hits"] += 1
+            return value
+
+    def put(self, key: Hashable, value: V) -> None:
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            self._data[key] = (time.monotonic(), value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self._stats["evictions"] += 1
+
+    def get_or_load(self, key: Hashable, loader: Callable[[], V]) -> V:
+        """Return the cached value for ``key``, calling ``loader`` and caching its result on a miss."""
+        value = self.get(key, _MISSING)  # type: ignore[arg-type]
+        if value is not _MISSING:
+            return value  # type: ignore[return-value]
+        value = loader()
+        self.put(key, value)
+        return value
+
+    def invalidate(self, key: Hashable) -> bool:
+        with self._lock:
+            removed = self._data.pop(key, _MISSING) is not _MISSING
+            if removed:
+                self._stats["invalidations"] += 1
+            return removed
+
+    def invalidate_where(self, predicate: Callable[[Hashable], bool]) -> int:
+        """Drop every entry whose key matches ``predicate``. Returns the number of entries removed."""
+        with self._lock:
+            keys = [key for key in self._data if predicate(key)]
+            for key in keys:
+                del self._data[key]
+            self._stats["invalidations"] += len(keys)
+            return len(keys)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._stats["invalidations"] += len(self._data)
+            self._data.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats: Dict[str, Any] = dict(self._stats)
+            stats["size"] = len(self._data)
+        return stats
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._data)
+
+
+class ResultCache(Generic[V]):
+    """
+    Thread-safe LRU cache of query results bounded by their total size in bytes; entries expire after ``ttl``.
+
+    Each entry remembers the tables it was read from (``None`` when unknown), so writes can drop exactly
+    the results they may have changed. A ``max_bytes`` of ``0`` or less disables the cache and a ``ttl`` of
+    ``0`` or less disables expiry.
+    """
+
+    def __init__(self, max_bytes: int = 0, ttl: float = 300.0):
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        # key -> (stored_at, value, size in bytes, source tables)
+        self._data: "OrderedDict[Hashable, Tuple[float, V, int, Optional[FrozenSet[str]]]]" = OrderedDict()
+        self._total_bytes = 0
+        self._stats: Dict[str, int] = {"hits": 0, "misses": 0, "evictions": 0, "invalidations": 0}
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_bytes > 0
+
+    def get(self, key: Hashable) -> Optional[V]:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self._stats["misses"] += 1
+                return None
+            stored_at, value, _, _ = entry
+            if self.ttl > 0 and time.monotonic() - stored_at > self.ttl:
+                self._remove(key)
+                self._stats["misses"] += 1
+                return None
+            self._data.move_to_end(key)
+            self._stats["hits"] += 1
+            return value
+
+    def put(self, key: Hashable, value: V, size: int, tables: Optional[Iterable[str]] = None) -> bool:
+        """Store ``value``; results larger than the whole budget are not cached. Returns whether it was stored."""
+        if not self.enabled or size > self.max_bytes:
+            return False
+        with self._lock:
+            self._remove(key)
+            self._data[key] = (time.monotonic(), value, size, frozenset(tables) if tables is not None else None)
+            self._total_bytes += size
+            while self._total_bytes > self.max_bytes:
+                old_key = next(iter(self._data))
+                self._remove(old_key)
+                self._stats["evictions"] += 1
+        return True
+
+    def invalidate_tables(self, tables: Iterable[str]) -> int:
+        """Drop entries read from any of ``tables`` or from unknown tables. Returns the number removed."""
+        tables = frozenset(tables)
+        with self._lock:
+            keys = [key for key, entry in self._data.items() if entry[3] is None or entry[3] & tables]
+            for key in keys:
+                self._remove(key)
+            self._stats["invalidations"] += len(keys)
+            return len(keys)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._stats["invalidations"] += len(self._data)
+            self._data.clear()
+            self._total_bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats: Dict[str, Any] = dict(self._stats)
+            stats.update(size=len(self._data), bytes=self._total_bytes, max_bytes=self.max_bytes)
+        return stats
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._data)
+
+    def _remove(self, key: Hashable) -> None:
+        """Drop ``key`` if present. Caller holds the lock."""
+        entry = self._data.pop(key, None)
+        if entry is not None:
+            self._total_bytes -= entry[2]
+
+
+class DiskLRUCache:
+    """
+    Content-addressed on-disk cache with a byte budget and least-recently-used eviction.
+
+    Entries are stored as ``<sha256(key)>.bin`` files under ``directory``, so callers should fold every input
+    that identifies the content (URI, size, modification time, ...) into the key. Recency is tracked through
+    file modification times, which lets a new process pick up an existing cache directory.
+    """
+
+    SUFFIX = ".bin"
+
+    def __init__(self, directory: str | Path, max_bytes: int = 256 * 1024 * 1024):
+        self.directory = Path(directory).expanduser()
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._index: Optional["OrderedDict[str, int]"] = None
+        self._total_bytes = 0
+        self._stats: Dict[str, int] = {"hits": 0, "misses": 0, "evictions": 0}
+
+    @staticmethod
+    def make_key(*parts: Any) -> str:
+        return hashlib.sha256("\x1f".join(str(part) for part in parts).encode("utf-8")).hexdigest()
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_bytes > 0
+
+    def path_for(self, key: str) -> Path:
+        return self.directory / f"{key}{self.SUFFIX}"
+
+    def get(self, key: str) -> Optional[bytes]:
+        path = self.get_path(key)
+        if path is None:
+            return None
+        try:
+            return path.read_bytes()
+        except OSError:
+            self._forget(key)
+            return None
+
+    def get_path(self, key: str) -> Optional[Path]:
+        """Return the cached file for ``key`` (marking it recently used), or ``None`` on a miss."""
+        if not self.enabled:
+            return None
+        with self._lock:
+            index = self._load_index()
+            if key not in index:
+                self._stats["misses"] += 1
+                return None
+            index.move_to_end(key)
+            self._stats["hits"] += 1
+        path = self.path_for(key)
+        try:
+            os.utime(path)
+        except OSError:
+            self._forget(key)
+            with self._lock:
+                self._stats["hits"] -= 1
+                self._stats["misses"] += 1
+            return None
+        return path
+
+    def put(self, key: str, data: bytes) -> None:
+        if not self.enabled or len(data) > self.max_bytes:
+            return
+        tmp_name = None
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            with os.fdopen(fd, "wb") as handle:
+                handle.write(data)
+            self._commit(key, Path(tmp_name), len(data))
+        except OSError as exc:
+            logger.debug(f"Failed to write volume cache entry: {exc}")
+            if tmp_name is not None:
+                Path(tmp_name).unlink(missing_ok=True)
+
+    def put_file(self, key: str, source: str | Path) -> Optional[Path]:
+        """Copy ``source`` into the cache in chunks, without reading it into memory. Returns the cached path."""
+        source = Path(source)
+        size = source.stat().st_size
+        if not self.enabled or size > self.max_bytes:
+            return None
+        tmp_name = None
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            os.close(fd)
+            # Copy then rename so the entry appears atomically even across filesystems
+            with source.open("rb") as src, open(tmp_name, "wb") as dst:
+                while chunk := src.read(1024 * 1024):
+                    dst.write(chunk)
+            self._commit(key, Path(tmp_name), size)
+        except OSError as exc:
+            logger.debug(f"Failed to write volume cache entry: {exc}")
+            if tmp_name is not None:
+                Path(tmp_name).unlink(missing_ok=True)
+            return None
+        return self.path_for(key)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            index = self._load_index()
+            stats = dict(self._stats)
+            stats.update(entries=len(index), bytes=self._total_bytes)
+        return stats
+
+    def _commit(self, key: str, tmp_path: Path, size: int) -> None:
+        os.replace(tmp_path, self.path_for(key))
+        with self._lock:
+            index = self._load_index()
+            self._total_bytes -= index.pop(key, 0)
+            index[key] = size
+            self._total_bytes += size
+            evicted = []
+            while self._total_bytes > self.max_bytes and len(index) > 1:
+                old_key, old_size = index.popitem(last=False)
+                self._total_bytes -= old_size
+                self._stats["evictions"] += 1
+                evicted.append(old_key)
+        for old_key in evicted:
+            self.path_for(old_key).unlink(missing_ok=True)
+
+    def _forget(self, key: str) -> None:
+        with self._lock:
+            index = self._load_index()
+            self._total_bytes -= index.pop(key, 0)
+
+    def _load_index(self) -> "OrderedDict[str, int]":
+        """Build the LRU index from the cache directory on first use. Caller holds the lock."""
+        if self._index is not None:
+            return self._index
+        entries = []
+        if self.directory.is_dir():
+            for path in self.directory.glob(f"*{self.SUFFIX}"):
+                try:
+                    stat = path.stat()
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, path.name[: -len(self.SUFFIX)], stat.st_size))
+        entries.sort()
+        self._index = OrderedDict((key, size) for _, key, size in entries)
+        self._total_bytes = sum(self._index.values())
+        return self._index
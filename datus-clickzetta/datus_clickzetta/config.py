@@ -2,7 +2,7 @@
 # Licensed under the Apache License, Version 2.0.
 # See http://www.apache.org/licenses/LICENSE-2.0 for details.
 
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, Optional
 
 from pydantic import BaseModel, ConfigDict, Field, field_validator
 
@@ -22,6 +22,39 @@ class ClickZettaConfig(BaseModel):
     secure: Optional[bool] = Field(default=None, description="Enable secure connection")
     hints: Optional[Dict[str, Any]] = Field(default=None, description="Additional connection hints")
     extra: Optional[Dict[str, Any]] = Field(default=None, description="Extra connection parameters")
+    pool_min_size: int = Field(default=1, ge=0, description="Sessions kept open in the session pool")
+    pool_max_size: int = Field(default=4, ge=1, description="Maximum concurrent sessions in the session pool")
+    pool_timeout: float = Field(default=30.0, gt=0, description="Seconds to wait for a free pooled session")
+    pool_idle_timeout: float = Field(
+        default=600.0, gt=0, description="Seconds before an idle session above pool_min_size is closed"
+    )
+    metadata_cache_ttl: float = Field(default=300.0, description="Seconds cached table inventories stay valid")
+    metadata_cache_size: int = Field(default=256, ge=0, description="Schemas kept in the table inventory cache")
+    column_cache_size: int = Field(default=8192, ge=0, description="Tables whose columns are kept in the column cache")
+    volume_cache_dir: Optional[str] = Field(default=None, description="Directory for cached volume file downloads")
+    volume_cache_max_bytes: int = Field(
+        default=256 * 1024 * 1024, ge=0, description="Byte budget of the volume file cache (0 disables it)"
+    )
+    incremental_metadata_sync: bool = Field(
+        default=False, description="Only re-read definitions of tables changed since the previous sync"
+    )
+    metadata_snapshot_dir: Optional[str] = Field(
+        default=None, description="Directory where metadata sync snapshots are persisted across processes"
+    )
+    hint_profiles: Optional[Dict[str, Dict[str, Any]]] = Field(
+        default=None, description="Per-workload hint overrides (metadata, sampling, analytical, dml)"
+    )
+    metrics_sink: Optional[Callable[..., Any]] = Field(
+        default=None, description="Callable receiving QueryExecutionStats for every executed statement"
+    )
+    result_cache_max_bytes: int = Field(
+        default=0, ge=0, description="Byte budget of the SELECT result cache (0 disables it)"
+    )
+    result_cache_ttl: float = Field(default=300.0, description="Seconds a cached SELECT result stays valid")
+    spill_threshold_bytes: int = Field(
+        default=0, ge=0, description="Arrow results larger than this are spilled to a memory-mapped file (0 disables)"
+    )
+    spill_dir: Optional[str] = Field(default=None, description="Directory for spilled Arrow result files")
 
     @field_validator('service', 'username', 'password', 'instance', 'workspace')
     @classmethod
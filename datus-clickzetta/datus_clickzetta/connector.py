@@ -4,29 +4,82 @@
 
 from __future__ import annotations
 
+import csv
+import io
+import itertools
+import re
+import shutil
 import tempfile
+import threading
 import time
+import uuid
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextlib import contextmanager
+from importlib import import_module
 from pathlib import Path
-from typing import Any, Dict, List, Literal, Optional, override
-
-import pandas as pd
-import pyarrow as pa
+from types import ModuleType
+from typing import Any, Callable, Dict, Iterator, List, Literal, NamedTuple, Optional, Tuple, Union, override
 
 from datus.schemas.base import TABLE_TYPE
 from datus.schemas.node_models import ExecuteSQLResult
-# Legacy connector - does not inherit from BaseSqlConnector directly
 from datus.utils.constants import DBType, SQLType
 from datus.utils.exceptions import DatusException, ErrorCode
 from datus.utils.loggings import get_logger
 from datus.utils.sql_utils import metadata_identifier, parse_context_switch, parse_sql_type
 
-try:
-    from clickzetta.zettapark.session import Session
-except ImportError as exc:  # pragma: no cover - optional dependency
-    Session = None  # type: ignore[assignment]
-    _CLICKZETTA_IMPORT_ERROR: Optional[Exception] = exc
-else:
-    _CLICKZETTA_IMPORT_ERROR = None
+from .cache import DiskLRUCache, ResultCache, TTLCache
+from .metrics import MetricsSink, QueryExecutionStats
+from .pool import ClickZettaSessionPool, PooledSession
+from .snapshot import DefinitionSnapshotStore
+
+
+class _LazyModule:
+    """Stands in for a module and imports it on first attribute access."""
+
+    def __init__(self, name: str):
+        self._name = name
+        self._module: Optional[ModuleType] = None
+
+    def __getattr__(self, attr: str) -> Any:
+        module = self._module
+        if module is None:
+            module = self._module = import_module(self._name)
+        return getattr(module, attr)
+
+    def __repr__(self) -> str:
+        state = "loaded" if self._module is not None else "not loaded"
+        return f"<lazy module {self._name!r} ({state})>"
+
+
+# pandas, pyarrow and numpy (and zettapark, which pulls all of them in) dominate the import time of this module.
+# They are loaded on first use so that discovering and registering the adapter stays cheap.
+np = _LazyModule("numpy")
+pd = _LazyModule("pandas")
+pa = _LazyModule("pyarrow")
+pc = _LazyModule("pyarrow.compute")
+ds = _LazyModule("pyarrow.dataset")
+pq = _LazyModule("pyarrow.parquet")
+pacsv = _LazyModule("pyarrow.csv")
+
+# Marks a Session class that has not been imported yet; None means the SDK is unavailable (or patched out)
+_UNLOADED: Any = object()
+Session: Any = _UNLOADED
+_CLICKZETTA_IMPORT_ERROR: Optional[Exception] = None
+
+
+def _load_session_class() -> Any:
+    """Import ``clickzetta.zettapark`` on first use and return its ``Session`` class, or ``None`` if missing."""
+    global Session, _CLICKZETTA_IMPORT_ERROR
+    if Session is _UNLOADED:
+        try:
+            from clickzetta.zettapark.session import Session as session_class
+        except ImportError as exc:  # pragma: no cover - optional dependency
+            Session = None
+            _CLICKZETTA_IMPORT_ERROR = exc
+        else:
+            Session = session_class
+    return Session
+
 
 logger = get_logger(__name__)
 
@@ -43,6 +96,99 @@ _DEFAULT_HINTS: Dict[str, Any] = {
     "cz.storage.parquet.enable.io.prefetch": "false",
 }
 
+# Per-statement overrides of the connection hints, keyed by workload class. "analytical" keeps the
+# connection defaults, which are tuned for large scans.
+_HINT_PROFILES: Dict[str, Dict[str, Any]] = {
+    "metadata": {
+        "sdk.job.timeout": 60,
+        "query_tag": "Metadata query from Datus Agent",
+        "cz.storage.always.prefetch.internal": "false",
+    },
+    "sampling": {
+        "sdk.job.timeout": 60,
+        "query_tag": "Sample query from Datus Agent",
+        "cz.storage.always.prefetch.internal": "false",
+    },
+    "analytical": {},
+    "dml": {
+        "sdk.job.timeout": 1800,
+        "query_tag": "DML from Datus Agent",
+        "cz.storage.always.prefetch.internal": "false",
+    },
+}
+
+DEFAULT_VOLUME_CACHE_DIR = "~/.cache/datus/clickzetta/volumes"
+# On disk rather than the temp directory, which is often a RAM-backed tmpfs
+DEFAULT_SPILL_DIR = "~/.cache/datus/clickzetta/spill"
+
+_TABLE_TYPES = {"MANAGED_TABLE", "EXTERNAL_TABLE", "BASE TABLE", "TABLE"}
+_VIEW_TYPES = {"VIEW", "DYNAMIC_TABLE"}
+_MATERIALIZED_VIEW_TYPES = {"MATERIALIZED_VIEW"}
+
+# DDL that can add, remove or rename objects, capturing the (possibly qualified) object name
+_DDL_OBJECT_PATTERN = re.compile(
+    r"^\s*(?:CREATE|DROP|ALTER|UNDROP|RENAME)\s+(?:OR\s+REPLACE\s+)?"
+    r"(?:(?:EXTERNAL|DYNAMIC|MATERIALIZED|TEMPORARY|TRANSIENT)\s+)*"
+    r"(?P<kind>TABLE|VIEW|SCHEMA)\s+(?:IF\s+(?:NOT\s+)?EXISTS\s+)?"
+    r"(?P<name>(?:`[^`]+`|[\w$]+)(?:\s*\.\s*(?:`[^`]+`|[\w$]+))*)",
+    re.IGNORECASE,
+)
+
+_IDENTIFIER = r"(?:`[^`]+`|[\w$]+)(?:\s*\.\s*(?:`[^`]+`|[\w$]+))*"
+# Tables a query reads from, for result cache invalidation
+_READ_TABLE_PATTERN = re.compile(rf"\b(?:FROM|JOIN)\s+(?P<name>{_IDENTIFIER})", re.IGNORECASE)
+# Table a DML statement writes to
+_WRITE_TABLE_PATTERN = re.compile(
+    rf"^\s*(?:INSERT\s+(?:INTO|OVERWRITE)(?:\s+TABLE)?|UPDATE|DELETE\s+FROM|MERGE\s+INTO|TRUNCATE(?:\s+TABLE)?)"
+    rf"\s+(?:IF\s+EXISTS\s+)?(?P<name>{_IDENTIFIER})",
+    re.IGNORECASE,
+)
+# Queries whose result changes between runs and must never be served from the result cache
+_NONDETERMINISTIC_PATTERN = re.compile(
+    r"\b(?:current_timestamp|current_date|current_time|now|rand|random|uuid|sysdate|localtimestamp)\b"
+    r"|\binformation_schema\b",
+    re.IGNORECASE,
+)
+# Statements that change session state or volume files but no table data
+_NO_TABLE_CHANGE_PATTERN = re.compile(
+    r"^\s*(?:USE|SET|LIST|GET|PUT|REMOVE|COPY\s+INTO\s+(?:USER\s+|TABLE\s+)?VOLUME)\b", re.IGNORECASE
+)
+# Volume URIs accepted as server-side unload targets: volume:user://..., volume:table://<table>, volume://<name>
+_UNLOAD_VOLUME_PATTERN = re.compile(r"^volume:(?:(?P<kind>user|table):)?//(?P<name>[^/]*)", re.IGNORECASE)
+# Session settings and virtual cluster switches, which pooled sessions replay when borrowed
+_SET_STATEMENT_PATTERN = re.compile(r"^\s*SET\s+(?P<key>[\w.$]+)\s*=", re.IGNORECASE)
+_USE_VCLUSTER_PATTERN = re.compile(r"^\s*USE\s+VCLUSTER\s+(?P<name>`[^`]+`|[\w$]+)\s*;?\s*$", re.IGNORECASE)
+# Whitespace outside string literals and quoted identifiers
+_SQL_WHITESPACE_PATTERN = re.compile(r"('(?:[^'\\]|\\.|'')*'|`[^`]*`)|\s+")
+
+
+class _VolumeEntry(NamedTuple):
+    name: str
+    relative_path: str
+    size: Optional[int]
+    last_modified: Optional[str]
+
+
+class ParquetExport(NamedTuple):
+    """Outcome of ``export_parquet``."""
+
+    path: Path
+    files: List[Path]
+    rows: int
+    bytes: int
+    # True when the server unloaded the result into a volume and the files were downloaded with one GET
+    server_side: bool
+
+
+class StatementTiming(NamedTuple):
+    """Wall-clock time of one statement of an ``execute_queries`` / ``execute_queries_arrow`` batch."""
+
+    index: int
+    sql: str
+    seconds: float
+    # True when the statement ran alongside other read-only statements of the same batch
+    concurrent: bool
+
 
 def _safe_escape(value: Optional[str]) -> str:
     """Escape single quotes in string values for SQL literals."""
@@ -65,6 +211,22 @@ class ClickZettaConnector:
     """
 
     AUTH_EXPIRATION_SECONDS = 3600
+    # Sessions are rebuilt in the background this many seconds before they expire
+    AUTH_REFRESH_MARGIN_SECONDS = 300
+    # Per-table client-side budget for get_sample_rows before a table is skipped
+    SAMPLE_TIMEOUT_SECONDS = 60.0
+    # read_volume_files returns files larger than this as paths on disk instead of strings
+    VOLUME_STREAM_THRESHOLD_BYTES = 8 * 1024 * 1024
+    # information_schema.tables column used to detect changed tables during incremental metadata sync
+    LAST_MODIFIED_COLUMN = "last_modify_time"
+    # Upper bound of table names per IN (...) list when fetching columns for changed tables
+    METADATA_IN_LIST_CHUNK = 500
+    # information_schema.columns rows processed per Arrow batch when streaming whole-schema DDL
+    DDL_BATCH_ROWS = 50000
+    # Rows per record batch fetched (and written) while a result may spill to disk
+    SPILL_BATCH_ROWS = 65536
+    # Volume subdirectory receiving server-side unloads of export_parquet
+    UNLOAD_DIRECTORY = "datus_export"
 
     def __init__(
         self,
@@ -78,6 +240,23 @@ class ClickZettaConnector:
         secure: Optional[bool] = None,
         hints: Optional[Dict[str, Any]] = None,
         extra: Optional[Dict[str, Any]] = None,
+        pool_min_size: int = 1,
+        pool_max_size: int = 4,
+        pool_timeout: float = 30.0,
+        pool_idle_timeout: float = 600.0,
+        metadata_cache_ttl: float = 300.0,
+        metadata_cache_size: int = 256,
+        column_cache_size: int = 8192,
+        volume_cache_dir: Optional[str] = None,
+        volume_cache_max_bytes: int = 256 * 1024 * 1024,
+        incremental_metadata_sync: bool = False,
+        metadata_snapshot_dir: Optional[str] = None,
+        hint_profiles: Optional[Dict[str, Dict[str, Any]]] = None,
+        metrics_sink: Optional[MetricsSink] = None,
+        result_cache_max_bytes: int = 0,
+        result_cache_ttl: float = 300.0,
+        spill_threshold_bytes: int = 0,
+        spill_dir: Optional[str] = None,
     ):
         # Initialize minimal attributes without calling parent's __init__
         from datus.tools.db_tools.config import ConnectionConfig
@@ -88,7 +267,7 @@ class ClickZettaConnector:
         self.db_type = DBType.CLICKZETTA
         schema = schema or "PUBLIC"
         vcluster = vcluster or "DEFAULT_AP"
-        if Session is None:
+        if _load_session_class() is None:
             raise DatusException(
                 ErrorCode.COMMON_MISSING_DEPENDENCY,
                 message=(
@@ -141,51 +320,185 @@ class ClickZettaConnector:
             "vcluster": self.vcluster,
             "hints": merged_hints,
         }
+        self._base_hints = merged_hints
+        self._hint_profiles: Dict[str, Dict[str, Any]] = {
+            name: dict(overrides) for name, overrides in _HINT_PROFILES.items()
+        }
+        for name, overrides in (hint_profiles or {}).items():
+            self._hint_profiles.setdefault(name, {}).update(overrides)
+
         if secure is not None:
             connection_config["secure"] = secure
         if extra:
             connection_config.update(extra)
 
         self._connection_config = connection_config
-        # Note: avoid referencing Session in type annotations to prevent runtime/type issues when optional dep missing
-        self._session: Optional[Any] = None
-        self._auth_timestamp = 0.0
+        # Sessions are pooled so one connector can serve concurrent callers. The pool re-authenticates
+        # sessions in the background ahead of AUTH_EXPIRATION_SECONDS and closes the ones it replaces.
+        self._pool = ClickZettaSessionPool(
+            factory=self._create_session,
+            min_size=pool_min_size,
+            max_size=pool_max_size,
+            checkout_timeout=pool_timeout,
+            idle_timeout=pool_idle_timeout,
+            max_lifetime=self.AUTH_EXPIRATION_SECONDS,
+            health_check=self._check_session,
+            refresh_margin=self.AUTH_REFRESH_MARGIN_SECONDS,
+        )
+        # (workspace, SCHEMA) -> [(table_name, TABLE_TYPE)] shared by get_tables/get_views/get_materialized_views
+        self._table_inventory_cache: TTLCache[List[Tuple[str, str]]] = TTLCache(
+            maxsize=metadata_cache_size, ttl=metadata_cache_ttl
+        )
+        # (workspace, SCHEMA, table_name) -> information_schema.columns rows, shared by get_schema,
+        # get_table_schemas and the DDL collection path
+        self._column_cache: TTLCache[List[Dict[str, Any]]] = TTLCache(
+            maxsize=column_cache_size, ttl=metadata_cache_ttl
+        )
+        # Downloaded volume files, keyed by URI plus the size/last-modified reported by LIST
+        self._volume_cache = DiskLRUCache(
+            volume_cache_dir or DEFAULT_VOLUME_CACHE_DIR, max_bytes=volume_cache_max_bytes
+        )
+        # Definitions from the previous get_*_with_ddl call; only changed tables are re-read when enabled
+        self.incremental_metadata_sync = incremental_metadata_sync
+        self._definition_snapshots = DefinitionSnapshotStore(metadata_snapshot_dir)
+        self._definition_sync_lock = threading.Lock()
+        self.last_metadata_sync: Dict[str, int] = {}
+        self.last_batch_timings: List[StatementTiming] = []
+        # Receives QueryExecutionStats for every statement; the stats are also attached to results
+        self.metrics_sink = metrics_sink
+        self._execution_local = threading.local()
+        # SET statements run through execute_content_set, keyed by lower-cased setting name, with a version
+        # that tells a borrowed session whether it has replayed the latest ones
+        self._session_settings: Tuple[int, Dict[str, str]] = (0, {})
+        self._session_settings_lock = threading.Lock()
+        # Opt-in cache of SELECT results as Arrow tables, keyed by normalized SQL and session context
+        self._result_cache: ResultCache[Tuple[pa.Table, bool]] = ResultCache(
+            max_bytes=result_cache_max_bytes, ttl=result_cache_ttl
+        )
+        # Arrow results growing beyond this many bytes are streamed into a memory-mapped IPC file (0 disables)
+        self.spill_threshold_bytes = spill_threshold_bytes
+        self._spill_dir = Path(spill_dir or DEFAULT_SPILL_DIR).expanduser()
 
     # ------------------------------------------------------------------ #
     # Helpers
     # ------------------------------------------------------------------ #
-    def _ensure_connection(self) -> Any:
-        if self._session is None or (time.time() - self._auth_timestamp) > self.AUTH_EXPIRATION_SECONDS:
-            self.connect()
-        return self._session  # type: ignore[return-value]
-
-    def connect(self):
-        """Initialize or refresh the ClickZetta session."""
+    def _create_session(self, context: Dict[str, Any]) -> Any:
+        """Build a new session and run the USE SCHEMA / USE VCLUSTER handshake."""
         try:
-            self._session = Session.builder.configs(self._connection_config).create()
-            self._auth_timestamp = time.time()
-            self.connection = self._session  # Maintain BaseSqlConnector.connection reference
+            session = Session.builder.configs(self._connection_config).create()
             if self.schema_name:
                 escaped_schema = _safe_escape_identifier(self.schema_name.upper())
-                self._session.sql(f"USE SCHEMA `{escaped_schema}`")
+                session.sql(f"USE SCHEMA `{escaped_schema}`")
+                context["schema"] = self.schema_name
             if self.vcluster:
                 escaped_vc = _safe_escape_identifier(self.vcluster.upper())
-                self._session.sql(f"USE VCLUSTER `{escaped_vc}`")
+                session.sql(f"USE VCLUSTER `{escaped_vc}`")
+                context["vcluster"] = self.vcluster
+            return session
         except (ImportError, ConnectionError, OSError, ValueError) as exc:
             raise DatusException(
                 ErrorCode.DB_CONNECTION_FAILED,
                 message_args={"error_message": str(exc)},
             ) from exc
 
-    def close(self):
-        if self._session:
+    @staticmethod
+    def _check_session(session: Any) -> None:
+        result = session.sql("SELECT 1")
+        if hasattr(result, "to_pandas"):
+            result.to_pandas()
+
+    @contextmanager
+    def _borrow_session(self, hint_profile: Optional[str] = None) -> Iterator[Any]:
+        """Check a session out of the pool, aligned with the connector's current schema and virtual cluster.
+
+        SET statements run through :meth:`execute_content_set` are replayed on sessions that have not seen
+        them yet. When ``hint_profile`` is given, the session's hints are switched to that profile first. A
+        ``session_tracker`` set on the calling thread is told about the borrowed session, and about its
+        return (with ``None``) before it goes back to the pool.
+        """
+        tracker: Optional[Callable[[Optional[PooledSession]], None]] = getattr(
+            self._execution_local, "session_tracker", None
+        )
+        with self._pool.session() as pooled:
+            if tracker is not None:
+                tracker(pooled)
             try:
-                self._session.close()
-            except Exception as exc:  # pragma: no cover - defensive cleanup
-                logger.debug(f"Failed to close ClickZetta session cleanly: {exc}")
+                if self.schema_name and pooled.context.get("schema") != self.schema_name:
+                    escaped_schema = _safe_escape_identifier(self.schema_name.upper())
+                    pooled.session.sql(f"USE SCHEMA `{escaped_schema}`")
+                    pooled.context["schema"] = self.schema_name
+                if self.vcluster and pooled.context.get("vcluster") != self.vcluster:
+                    escaped_vc = _safe_escape_identifier(self.vcluster.upper())
+                    pooled.session.sql(f"USE VCLUSTER `{escaped_vc}`")
+                    pooled.context["vcluster"] = self.vcluster
+                version, settings = self._session_settings
+                if pooled.context.get("settings_version", 0) != version:
+                    for statement in settings.values():
+                        pooled.session.sql(statement)
+                    pooled.context["settings_version"] = version
+                if hint_profile is not None:
+                    self._apply_hint_profile(pooled.context, pooled.session, hint_profile)
+                yield pooled.session
             finally:
-                self._session = None
-                self.connection = None
+                if tracker is not None:
+                    tracker(None)
+
+    def _profile_hints(self, hint_profile: str) -> Dict[str, Any]:
+        if hint_profile not in self._hint_profiles:
+            raise ValueError(
+                f"Unknown hint profile '{hint_profile}', expected one of {sorted(self._hint_profiles)}"
+            )
+        hints = dict(self._base_hints)
+        hints.update(self._hint_profiles[hint_profile])
+        return hints
+
+    def _apply_hint_profile(self, context: Dict[str, Any], session: Any, hint_profile: str) -> None:
+        """Issue ``SET`` for every hint that differs from what the session currently runs with."""
+        if context.get("hint_profile", "analytical") == hint_profile:
+            return
+        current: Dict[str, Any] = context.get("hints") or dict(self._base_hints)
+        user_settings = self._session_settings[1]
+        for key, value in self._profile_hints(hint_profile).items():
+            # Settings the caller SET explicitly take precedence over profiles
+            if current.get(key) == value or key.lower() in user_settings:
+                continue
+            if isinstance(value, (int, float)) and not isinstance(value, bool):
+                rendered = str(value)
+            else:
+                rendered = f"'{_safe_escape(str(value))}'"
+            session.sql(f"SET {key} = {rendered}")
+            current[key] = value
+        context["hints"] = current
+        context["hint_profile"] = hint_profile
+
+    def _classify_workload(self, sql: str) -> Optional[str]:
+        """Map a statement to a hint profile via ``parse_sql_type``; ``None`` keeps the session's hints."""
+        try:
+            sql_type = parse_sql_type(sql, self.dialect)
+        except Exception as exc:
+            logger.debug(f"Could not classify statement for hint profile: {exc}")
+            return None
+        if sql_type == SQLType.SELECT:
+            return "analytical"
+        if sql_type in (SQLType.INSERT, SQLType.UPDATE, SQLType.DELETE, SQLType.DDL, getattr(SQLType, "MERGE", None)):
+            return "dml"
+        if sql_type in (getattr(SQLType, "METADATA_SHOW", None), getattr(SQLType, "EXPLAIN", None)):
+            return "metadata"
+        return None
+
+    def connect(self):
+        """Initialize or refresh the ClickZetta session pool."""
+        self._pool.close()
+        self._pool.warm()
+        self.connection = self._pool  # Maintain BaseSqlConnector.connection reference
+
+    def close(self):
+        self._pool.close()
+        self.connection = None
+
+    def connection_stats(self) -> Dict[str, Any]:
+        """Return session pool counters, including background auth refresh counts and durations."""
+        return self._pool.stats()
 
     def do_switch_context(self, catalog_name: str = "", database_name: str = "", schema_name: str = ""):
         """Execute context switching in ClickZetta session.
@@ -195,8 +508,6 @@ class ClickZettaConnector:
         - Only schema switching within the same workspace is supported
         - VCluster switching is supported via USE VCLUSTER command
         """
-        session = self._ensure_connection()
-
         # Reject workspace switching requests
         if database_name and database_name != self.database_name:
             raise DatusException(
@@ -214,8 +525,11 @@ class ClickZettaConnector:
         if schema_name and schema_name != self.schema_name:
             try:
                 escaped_schema = _safe_escape_identifier(schema_name.upper())
-                session.sql(f"USE SCHEMA `{escaped_schema}`")
-                # Update the connector's schema state after successful execution
+                with self._pool.session() as pooled:
+                    pooled.session.sql(f"USE SCHEMA `{escaped_schema}`")
+                    pooled.context["schema"] = schema_name
+                # Update the connector's schema state after successful execution; other pooled
+                # sessions pick up the new schema the next time they are borrowed
                 self.schema_name = schema_name
                 logger.info(f"Switched to schema: {schema_name}")
             except (OSError, ValueError, RuntimeError) as exc:
@@ -227,29 +541,397 @@ class ClickZettaConnector:
             raise exc
         raise DatusException(error_code, message_args={"error_message": str(exc), "sql": sql}) from exc
 
-    def _run_query(self, sql: str) -> pd.DataFrame:
+    def _resolve_hint_profile(self, sql: str, hint_profile: Optional[str]) -> Optional[str]:
+        if hint_profile is not None:
+            self._profile_hints(hint_profile)
+            return hint_profile
+        return self._classify_workload(sql)
+
+    # ------------------------------------------------------------------ #
+    # Execution statistics
+    # ------------------------------------------------------------------ #
+    @property
+    def last_execution_stats(self) -> Optional[QueryExecutionStats]:
+        """Stats of the last statement finished by the calling thread."""
+        return getattr(self._execution_local, "last", None)
+
+    @contextmanager
+    def _track_execution(self, sql: str, hint_profile: Optional[str] = None) -> Iterator[QueryExecutionStats]:
+        """Collect phase timings for ``sql``. Nested calls share the outermost stats, which is reported once."""
+        outer: Optional[QueryExecutionStats] = getattr(self._execution_local, "stats", None)
+        stats = outer or QueryExecutionStats(sql=sql, hint_profile=hint_profile)
+        if outer is None:
+            self._execution_local.stats = stats
+        started = time.perf_counter()
         try:
-            session = self._ensure_connection()
-            result = session.sql(sql)
-            if hasattr(result, "to_pandas"):
-                return result.to_pandas()
-            # Fallback to empty DataFrame if result has no tabular output
-            return pd.DataFrame()
-        except (OSError, ValueError, RuntimeError) as exc:
-            self._wrap_exception(exc, sql)
+            yield stats
+        except BaseException as exc:
+            if stats.error is None:
+                stats.error = str(exc) or type(exc).__name__
+            raise
+        finally:
+            if outer is None:
+                self._execution_local.stats = None
+                stats.total_seconds = time.perf_counter() - started
+                self._execution_local.last = stats
+                self._emit_execution_stats(stats)
+
+    def _emit_execution_stats(self, stats: QueryExecutionStats) -> None:
+        if stats.success:
+            logger.debug(
+                f"ClickZetta job {stats.job_id or '-'}: submit {stats.submit_seconds:.3f}s, "
+                f"fetch {stats.fetch_seconds:.3f}s, convert {stats.conversion_seconds:.3f}s, {stats.rows} rows"
+            )
+        if self.metrics_sink is None:
+            return
+        try:
+            self.metrics_sink(stats)
+        except Exception as exc:
+            logger.warning(f"ClickZetta metrics sink failed: {exc}")
 
-    def _run_command(self, sql: str) -> pd.DataFrame:
+    @staticmethod
+    def _attach_execution_stats(result: ExecuteSQLResult, stats: Optional[QueryExecutionStats]) -> ExecuteSQLResult:
+        """Set ``result.execution_stats`` to ``stats`` as a dict, the type the result model declares for it."""
         try:
-            session = self._ensure_connection()
-            result = session.sql(sql)
-            if hasattr(result, "to_pandas"):
-                try:
-                    return result.to_pandas()
-                except (AttributeError, TypeError, ValueError):
-                    return pd.DataFrame()
-            return pd.DataFrame()
-        except (OSError, ValueError, RuntimeError) as exc:
-            self._wrap_exception(exc, sql)
+            result.execution_stats = stats.as_dict() if stats is not None else None
+        except (AttributeError, TypeError, ValueError) as exc:
+            # Result models without the field still expose the stats via last_execution_stats
+            logger.debug(f"Execution stats not attached to the result: {exc}")
+        return result
+
+    @staticmethod
+    def _job_id(*sources: Any) -> Optional[str]:
+        """Return the server job ID if the SDK exposes one on the result or the session."""
+        for source in sources:
+            for attribute in ("job_id", "query_id", "last_job_id", "last_query_id"):
+                value = getattr(source, attribute, None)
+                if isinstance(value, str) and value:
+                    return value
+        return None
+
+    def _submit(self, session: Any, sql: str, stats: QueryExecutionStats, started: float) -> Any:
+        """Run ``session.sql`` and book the time since ``started`` (checkout included) as the submit phase."""
+        result = session.sql(sql)
+        stats.submit_seconds += time.perf_counter() - started
+        stats.job_id = stats.job_id or self._job_id(result, session)
+        return result
+
+    @staticmethod
+    def _fetch_pandas(result: Any, stats: Optional[QueryExecutionStats] = None) -> pd.DataFrame:
+        started = time.perf_counter()
+        df = result.to_pandas()
+        if stats is not None and isinstance(df, pd.DataFrame):
+            stats.fetch_seconds += time.perf_counter() - started
+            stats.rows = len(df)
+            stats.result_bytes = int(df.memory_usage(index=False).sum())
+        return df
+
+    def _limit_sql(self, sql: str, max_rows: Optional[int]) -> Optional[str]:
+        """Wrap a SELECT so the server returns at most ``max_rows + 1`` rows (the extra row flags truncation).
+
+        Returns ``None`` for statements that cannot be wrapped in a subquery.
+        """
+        if max_rows is None:
+            return None
+        if max_rows < 0:
+            raise ValueError("max_rows must not be negative")
+        try:
+            if parse_sql_type(sql, self.dialect) != SQLType.SELECT:
+                return None
+        except Exception:
+            return None
+        body = sql.strip().rstrip(";").rstrip()
+        # Newlines keep a trailing line comment in the statement from swallowing the closing parenthesis
+        return f"SELECT * FROM (\n{body}\n) AS datus_limited LIMIT {max_rows + 1}"
+
+    def _run_query(
+        self, sql: str, hint_profile: Optional[str] = None, max_rows: Optional[int] = None
+    ) -> pd.DataFrame:
+        """Run ``sql`` and return its result as a DataFrame, sharing row caps, spilling and the result cache with
+        :meth:`_run_query_arrow`.
+
+        Results the SDK returns as pandas are used as they are; Arrow results (native, batched or cached) are
+        converted.
+        """
+        with self._track_execution(sql, hint_profile) as stats:
+            data = self._fetch_query(sql, hint_profile, max_rows, as_pandas=True)
+            if isinstance(data, pd.DataFrame):
+                return data
+            started = time.perf_counter()
+            df = data.to_pandas()
+            stats.conversion_seconds += time.perf_counter() - started
+            return df
+
+    @staticmethod
+    def _native_arrow(result: Any, stats: Optional[QueryExecutionStats] = None) -> Optional[pa.Table]:
+        """Fetch a zettapark result through the SDK's own Arrow API, or return ``None`` if it has none."""
+        started = time.perf_counter()
+        to_arrow = getattr(result, "to_arrow", None)
+        if not callable(to_arrow):
+            return None
+        try:
+            table = to_arrow()
+        except (AttributeError, NotImplementedError, TypeError) as exc:
+            logger.debug(f"Native Arrow fetch unavailable, falling back to pandas: {exc}")
+            return None
+        if not isinstance(table, pa.Table):
+            return None
+        if stats is not None:
+            stats.fetch_seconds += time.perf_counter() - started
+            stats.rows, stats.result_bytes = table.num_rows, table.nbytes
+        return table
+
+    @classmethod
+    def _result_to_arrow(cls, result: Any, stats: Optional[QueryExecutionStats] = None) -> pa.Table:
+        """Materialize a zettapark result as an Arrow table, skipping pandas when the SDK allows it."""
+        table = cls._native_arrow(result, stats)
+        if table is not None:
+            return table
+        if hasattr(result, "to_pandas"):
+            df = cls._fetch_pandas(result, stats)
+            started = time.perf_counter()
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            if stats is not None:
+                stats.conversion_seconds += time.perf_counter() - started
+            return table
+        # Fallback to empty table if result has no tabular output
+        return pa.table({})
+
+    def _run_query_arrow(
+        self, sql: str, hint_profile: Optional[str] = None, max_rows: Optional[int] = None
+    ) -> pa.Table:
+        return self._fetch_query(sql, hint_profile, max_rows, as_pandas=False)
+
+    def _fetch_query(
+        self, sql: str, hint_profile: Optional[str], max_rows: Optional[int], as_pandas: bool
+    ) -> Union[pa.Table, pd.DataFrame]:
+        """Run ``sql`` and fetch its result as an Arrow table.
+
+        With ``as_pandas``, a plain fetch from an SDK without native Arrow support returns the SDK's
+        DataFrame instead, saving a pandas -> Arrow -> pandas round trip.
+        """
+        with self._track_execution(sql, hint_profile) as stats:
+            try:
+                started = time.perf_counter()
+                cache_key = self._result_cache_key(sql, hint_profile, max_rows)
+                cached = self._cached_result(cache_key, stats)
+                if cached is not None:
+                    return cached
+                hint_profile = self._resolve_hint_profile(sql, hint_profile)
+                stats.hint_profile = stats.hint_profile or hint_profile
+                limited_sql = self._limit_sql(sql, max_rows)
+                with self._borrow_session(hint_profile) as session:
+                    result = self._submit(session, limited_sql or sql, stats, started)
+                    if hint_profile == "dml":
+                        self._invalidate_results_for_write(sql)
+                    if max_rows is not None and limited_sql is None:
+                        # Not wrappable: stop pulling batches once the cap is exceeded
+                        data = self._fetch_arrow_capped(result, max_rows, stats)
+                    elif self.spill_threshold_bytes > 0:
+                        data = self._fetch_arrow_spilling(result, stats)
+                    elif as_pandas and hasattr(result, "to_pandas"):
+                        data = self._native_arrow(result, stats)
+                        if data is None:
+                            data = self._fetch_pandas(result, stats)
+                    else:
+                        data = self._result_to_arrow(result, stats)
+                if max_rows is not None and len(data) > max_rows:
+                    data = data.slice(0, max_rows) if isinstance(data, pa.Table) else data.iloc[:max_rows]
+                    stats.truncated = True
+                    stats.rows = max_rows
+                if cache_key is not None:
+                    table = data if isinstance(data, pa.Table) else pa.Table.from_pandas(data, preserve_index=False)
+                    self._store_result(cache_key, sql, table, stats.truncated)
+                return data
+            except (OSError, ValueError, RuntimeError) as exc:
+                stats.error = stats.error or str(exc)
+                self._wrap_exception(exc, sql)
+
+    def _fetch_arrow_capped(self, result: Any, max_rows: int, stats: QueryExecutionStats) -> pa.Table:
+        started = time.perf_counter()
+        batches: List[pa.RecordBatch] = []
+        fetched = 0
+        for batch in self._iter_result_batches(result, max(max_rows, 1)):
+            batches.append(batch)
+            fetched += batch.num_rows
+            if fetched > max_rows:
+                break
+        table = pa.Table.from_batches(batches, schema=batches[0].schema)
+        stats.fetch_seconds += time.perf_counter() - started
+        stats.rows, stats.result_bytes = table.num_rows, table.nbytes
+        return table
+
+    def _fetch_arrow_spilling(self, result: Any, stats: QueryExecutionStats) -> pa.Table:
+        """Fetch a result batch by batch, moving it to a memory-mapped Arrow IPC file once it outgrows
+        ``spill_threshold_bytes`` so that at most about one threshold's worth of batches is held in memory."""
+        started = time.perf_counter()
+        buffered: List[pa.RecordBatch] = []
+        buffered_bytes = 0
+        writer = None
+        spill_path: Optional[Path] = None
+        try:
+            for batch in self._iter_result_batches(result, self.SPILL_BATCH_ROWS):
+                if writer is not None:
+                    writer.write_batch(batch)
+                    continue
+                buffered.append(batch)
+                buffered_bytes += batch.nbytes
+                if buffered_bytes > self.spill_threshold_bytes:
+                    spill_path = self._new_spill_path()
+                    writer = pa.ipc.new_file(str(spill_path), buffered[0].schema)
+                    for pending in buffered:
+                        writer.write_batch(pending)
+                    buffered = []
+            if writer is None:
+                table = pa.Table.from_batches(buffered, schema=buffered[0].schema)
+            else:
+                writer.close()
+                writer = None
+                table = self._map_spill_file(spill_path)
+                stats.spilled = True
+        except BaseException:
+            if writer is not None:
+                writer.close()
+            if spill_path is not None:
+                spill_path.unlink(missing_ok=True)
+            raise
+        stats.fetch_seconds += time.perf_counter() - started
+        stats.rows, stats.result_bytes = table.num_rows, table.nbytes
+        return table
+
+    def _new_spill_path(self) -> Path:
+        self._spill_dir.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            dir=self._spill_dir, prefix="result-", suffix=".arrow", delete=False
+        ) as handle:
+            return Path(handle.name)
+
+    @staticmethod
+    def _map_spill_file(spill_path: Path) -> pa.Table:
+        """Open a spill file as a zero-copy, memory-mapped table and unlink it.
+
+        The mapping keeps the data readable until the table is garbage collected; on platforms that cannot
+        delete a mapped file it stays in the spill directory.
+        """
+        table = pa.ipc.open_file(pa.memory_map(str(spill_path), "r")).read_all()
+        try:
+            spill_path.unlink()
+        except OSError as exc:
+            logger.debug(f"Spill file {spill_path} kept while mapped: {exc}")
+        return table
+
+    @staticmethod
+    def _arrow_to_csv(table: pa.Table) -> str:
+        """Render ``table`` as CSV with Arrow's writer, without a pandas copy of the result.
+
+        The header is written with minimal quoting (``id,name``); types the Arrow writer cannot render (nested
+        lists, maps, structs) fall back to pandas.
+        """
+        header = io.StringIO()
+        csv.writer(header, lineterminator="\n").writerow(table.column_names)
+        if table.num_rows == 0:
+            return header.getvalue()
+        buffer = pa.BufferOutputStream()
+        try:
+            pacsv.write_csv(table, buffer, write_options=pacsv.WriteOptions(include_header=False))
+        except (pa.ArrowNotImplementedError, pa.ArrowInvalid, pa.ArrowTypeError):
+            return table.to_pandas().to_csv(index=False)
+        return header.getvalue() + buffer.getvalue().to_pybytes().decode("utf-8")
+
+    def _run_command(self, sql: str, hint_profile: Optional[str] = None) -> pd.DataFrame:
+        with self._track_execution(sql, hint_profile) as stats:
+            try:
+                started = time.perf_counter()
+                hint_profile = self._resolve_hint_profile(sql, hint_profile)
+                stats.hint_profile = stats.hint_profile or hint_profile
+                with self._borrow_session(hint_profile) as session:
+                    result = self._submit(session, sql, stats, started)
+                    self._invalidate_results_for_write(sql)
+                    if hasattr(result, "to_pandas"):
+                        try:
+                            return self._fetch_pandas(result, stats)
+                        except (AttributeError, TypeError, ValueError):
+                            return pd.DataFrame()
+                return pd.DataFrame()
+            except (OSError, ValueError, RuntimeError) as exc:
+                stats.error = stats.error or str(exc)
+                self._wrap_exception(exc, sql)
+
+    # ------------------------------------------------------------------ #
+    # Result cache
+    # ------------------------------------------------------------------ #
+    @staticmethod
+    def _normalize_sql(sql: str) -> str:
+        """Collapse whitespace outside literals so formatting differences share a cache entry."""
+        body = sql.strip().rstrip(";")
+        return _SQL_WHITESPACE_PATTERN.sub(lambda match: match.group(1) or " ", body).strip()
+
+    @staticmethod
+    def _table_names(identifiers: List[str]) -> set:
+        """Unqualified, lower-cased table names of (possibly qualified) identifiers."""
+        names = set()
+        for identifier in identifiers:
+            parts = [quoted or bare for quoted, bare in re.findall(r"`([^`]+)`|([\w$]+)", identifier)]
+            if parts:
+                names.add(parts[-1].lower())
+        return names
+
+    def _result_cache_key(self, sql: str, hint_profile: Optional[str], max_rows: Optional[int]) -> Optional[Tuple]:
+        """Cache key of a cacheable SELECT in the current context, or ``None`` when the result must not be cached."""
+        if not self._result_cache.enabled or hint_profile == "metadata" or _NONDETERMINISTIC_PATTERN.search(sql):
+            return None
+        try:
+            if parse_sql_type(sql, self.dialect) != SQLType.SELECT:
+                return None
+        except Exception:
+            return None
+        return (
+            self._normalize_sql(sql),
+            (self.database_name or "").lower(),
+            (self.schema_name or "").upper(),
+            (self.vcluster or "").upper(),
+            max_rows,
+        )
+
+    def _cached_result(self, cache_key: Optional[Tuple], stats: QueryExecutionStats) -> Optional[pa.Table]:
+        if cache_key is None:
+            return None
+        cached = self._result_cache.get(cache_key)
+        if cached is None:
+            return None
+        table, truncated = cached
+        stats.cache_hit = True
+        stats.rows, stats.result_bytes, stats.truncated = table.num_rows, table.nbytes, truncated
+        return table
+
+    def _store_result(self, cache_key: Tuple, sql: str, table: Optional[pa.Table], truncated: bool) -> None:
+        if table is None:
+            return
+        tables = self._table_names([match.group("name") for match in _READ_TABLE_PATTERN.finditer(sql)])
+        # Without a recognizable source table the entry is dropped on every write
+        self._result_cache.put(cache_key, (table, truncated), table.nbytes, tables or None)
+
+    def _invalidate_results_for_write(self, sql: str) -> None:
+        """Drop cached results a write may have changed: those read from its target table, or all if unknown."""
+        if len(self._result_cache) == 0 or _NO_TABLE_CHANGE_PATTERN.match(sql):
+            return
+        match = _WRITE_TABLE_PATTERN.match(sql) or _DDL_OBJECT_PATTERN.match(sql)
+        if match is None or (match.groupdict().get("kind") or "").upper() == "SCHEMA":
+            self._result_cache.clear()
+            return
+        self._result_cache.invalidate_tables(self._table_names([match.group("name")]))
+
+    def invalidate_result_cache(self, tables: Optional[List[str]] = None) -> int:
+        """Drop cached results read from ``tables``, or all of them. Returns the number of entries removed."""
+        if tables is None:
+            removed = len(self._result_cache)
+            self._result_cache.clear()
+            return removed
+        return self._result_cache.invalidate_tables(self._table_names(tables))
+
+    def result_cache_stats(self) -> Dict[str, Any]:
+        """Return hit/miss/eviction/invalidation counters plus the current size of the result cache."""
+        return self._result_cache.stats()
 
     @staticmethod
     def _normalize_volume_uri(volume: str, relative_path: str) -> str:
@@ -266,36 +948,50 @@ class ClickZettaConnector:
         raise ValueError(f"Unsupported volume/stage format: {volume}")
 
     def read_volume_file(self, volume: str, relative_path: str) -> str:
-        """Download and return the contents of a file stored inside a ClickZetta volume or stage."""
+        """Download and return the contents of a file stored inside a ClickZetta volume or stage.
+
+        Files are served from the local volume cache when LIST reports the same size and last-modified
+        time as the cached copy, so unchanged files are not downloaded again.
+        """
         source_uri = self._normalize_volume_uri(volume, relative_path)
-        session = self._ensure_connection()
+
+        cache_key = None
+        if self._volume_cache.enabled:
+            file_stat = self._volume_file_stat(volume, relative_path)
+            if file_stat is not None:
+                cache_key = self._volume_cache_key(source_uri, *file_stat)
+                cached = self._volume_cache.get(cache_key)
+                if cached is not None:
+                    return cached.decode("utf-8")
 
         with tempfile.TemporaryDirectory() as tmp_dir:
-            session.file.get(source_uri, tmp_dir)
+            with self._borrow_session() as session:
+                session.file.get(source_uri, tmp_dir)
 
-            candidate = Path(tmp_dir) / Path(relative_path).name
-            if not candidate.exists():
-                nested_candidate = Path(tmp_dir) / Path(relative_path)
-                if nested_candidate.exists():
-                    candidate = nested_candidate
-                else:
-                    matches = list(Path(tmp_dir).rglob(Path(relative_path).name))
-                    if not matches:
-                        raise FileNotFoundError(f"File '{relative_path}' not found in {volume}")
-                    candidate = matches[0]
+            candidate = self._locate_download(Path(tmp_dir), relative_path)
+            if candidate is None:
+                raise FileNotFoundError(f"File '{relative_path}' not found in {volume}")
+            content = candidate.read_text(encoding="utf-8")
 
-            return candidate.read_text(encoding="utf-8")
+        if cache_key is not None:
+            self._volume_cache.put(cache_key, content.encode("utf-8"))
+        return content
 
-    def list_volume_files(
-        self,
-        volume: str,
-        directory: str = "",
-        suffixes: tuple[str, ...] = (".yaml", ".yml"),
-    ) -> List[str]:
-        """List files stored inside a ClickZetta volume or legacy stage."""
+    @staticmethod
+    def _locate_download(download_dir: Path, relative_path: str) -> Optional[Path]:
+        candidate = download_dir / Path(relative_path).name
+        if candidate.exists():
+            return candidate
+        nested_candidate = download_dir / Path(relative_path)
+        if nested_candidate.exists():
+            return nested_candidate
+        matches = list(download_dir.rglob(Path(relative_path).name))
+        return matches[0] if matches else None
+
+    def _list_volume(self, volume: str, directory: str = "") -> pd.DataFrame:
+        """Run LIST for a volume directory and return the raw listing."""
         directory = directory.strip().lstrip("/").rstrip("/")
         volume_uri = self._normalize_volume_uri(volume, directory or "")
-        session = self._ensure_connection()
 
         if volume.lower().startswith("volume:user://"):
             list_sql = "LIST USER VOLUME"
@@ -306,36 +1002,199 @@ class ClickZettaConnector:
         else:
             list_sql = f"LIST {volume_uri}"
 
-        result = session.sql(list_sql)
-        try:
-            df = result.to_pandas()
-        except (AttributeError, TypeError, ValueError):
-            df = pd.DataFrame()
+        with self._borrow_session() as session:
+            result = session.sql(list_sql)
+            try:
+                return result.to_pandas()
+            except (AttributeError, TypeError, ValueError):
+                return pd.DataFrame()
 
-        if df.empty:
+    @staticmethod
+    def _find_column(df: pd.DataFrame, candidates: tuple[str, ...]) -> Optional[str]:
+        lowered = {str(column).lower(): column for column in df.columns}
+        for candidate in candidates:
+            if candidate in lowered:
+                return lowered[candidate]
+        return None
+
+    @classmethod
+    def _volume_entries(cls, df: pd.DataFrame) -> List[_VolumeEntry]:
+        """Parse a LIST result into entries; size/last_modified are ``None`` when LIST does not report them."""
+        if df is None or df.empty:
             return []
-
-        column_name = None
-        for candidate in ("relative_path", "name", "path"):
-            if candidate in df.columns:
-                column_name = candidate
-                break
-        if column_name is None:
-            column_name = df.columns[0]
-
-        discovered: List[str] = []
-        for value in df[column_name].tolist():
+        path_column = cls._find_column(df, ("relative_path", "name", "path")) or df.columns[0]
+        size_column = cls._find_column(df, ("size", "length", "content_length", "bytes"))
+        modified_column = cls._find_column(
+            df, ("last_modified", "last_modified_time", "last_modified_at", "modified", "mtime")
+        )
+        entries: List[_VolumeEntry] = []
+        for row in df.to_dict(orient="records"):
+            value = row.get(path_column)
             if not value:
                 continue
             path_str = str(value).strip()
-            candidate_name = path_str.split("/")[-1]
-            lower = candidate_name.lower()
+            size: Optional[int] = None
+            last_modified: Optional[str] = None
+            if size_column is not None and modified_column is not None:
+                try:
+                    size, last_modified = int(row[size_column]), str(row[modified_column])
+                except (TypeError, ValueError):
+                    size, last_modified = None, None
+            entries.append(_VolumeEntry(path_str.split("/")[-1], path_str, size, last_modified))
+        return entries
+
+    def _volume_cache_key(self, source_uri: str, size: int, last_modified: str) -> str:
+        return self._volume_cache.make_key(
+            self.service, self.instance, self.workspace, self.user, source_uri, size, last_modified
+        )
+
+    def _volume_file_stat(self, volume: str, relative_path: str) -> Optional[Tuple[int, str]]:
+        """Return ``(size, last_modified)`` for a volume file as reported by LIST, or ``None`` if unknown."""
+        relative_path = (relative_path or "").strip().lstrip("/")
+        directory = relative_path.rpartition("/")[0]
+        try:
+            df = self._list_volume(volume, directory)
+        except (DatusException, OSError, ValueError, RuntimeError) as exc:
+            logger.debug(f"Unable to revalidate volume file {relative_path}: {exc}")
+            return None
+        for entry in self._volume_entries(df):
+            # LIST is recursive, so files of the same name in subdirectories are listed too
+            if entry.relative_path.strip("/") == relative_path:
+                if entry.size is None:
+                    return None
+                return entry.size, entry.last_modified
+        return None
+
+    @staticmethod
+    def _prefer_directory_get(missing: List[_VolumeEntry], listed: List[_VolumeEntry]) -> bool:
+        """Whether the missing files make up at least half of the directory, by the sizes LIST reports.
+
+        The file count decides when LIST does not report every size.
+        """
+        sizes = [entry.size for entry in listed]
+        if any(size is None for size in sizes):
+            return len(missing) * 2 >= len(listed)
+        return sum(entry.size for entry in missing) * 2 >= sum(sizes)
+
+    def list_volume_files(
+        self,
+        volume: str,
+        directory: str = "",
+        suffixes: tuple[str, ...] = (".yaml", ".yml"),
+    ) -> List[str]:
+        """List files stored inside a ClickZetta volume or legacy stage."""
+        discovered: List[str] = []
+        for entry in self._volume_entries(self._list_volume(volume, directory)):
+            lower = entry.name.lower()
             if suffixes and not any(lower.endswith(suffix) for suffix in suffixes):
                 continue
-            if candidate_name not in discovered:
-                discovered.append(candidate_name)
+            if entry.name not in discovered:
+                discovered.append(entry.name)
         return sorted(discovered)
 
+    def read_volume_files(
+        self,
+        volume: str,
+        directory: str = "",
+        suffixes: tuple[str, ...] = (".yaml", ".yml"),
+        max_workers: Optional[int] = None,
+        target_dir: Optional[str] = None,
+        stream_threshold_bytes: Optional[int] = None,
+    ) -> Dict[str, Union[str, Path]]:
+        """Download every matching file of a volume directory in bulk and return a name -> content mapping.
+
+        One LIST drives the whole operation. Files still valid in the local volume cache are not downloaded.
+        When the missing files make up most of the directory's bytes it is fetched with a single directory-level
+        GET; otherwise the missing files are fetched concurrently over ``max_workers`` pooled sessions. Files
+        larger than ``stream_threshold_bytes`` are not loaded into memory: they are written to ``target_dir`` (a
+        new temporary directory owned by the caller when omitted) and returned as ``Path`` objects.
+        """
+        directory = (directory or "").strip().strip("/")
+        threshold = self.VOLUME_STREAM_THRESHOLD_BYTES if stream_threshold_bytes is None else stream_threshold_bytes
+        listed = self._volume_entries(self._list_volume(volume, directory))
+        wanted: Dict[str, _VolumeEntry] = {}
+        for entry in listed:
+            lower = entry.name.lower()
+            if suffixes and not any(lower.endswith(suffix) for suffix in suffixes):
+                continue
+            wanted.setdefault(entry.name, entry)
+        if not wanted:
+            return {}
+
+        large_dir: Optional[Path] = Path(target_dir) if target_dir else None
+
+        def deliver(entry: _VolumeEntry, path: Path, move: bool) -> Union[str, Path]:
+            nonlocal large_dir
+            size = path.stat().st_size
+            if size <= threshold:
+                return path.read_text(encoding="utf-8")
+            if large_dir is None:
+                large_dir = Path(tempfile.mkdtemp(prefix="datus-clickzetta-volume-"))
+            large_dir.mkdir(parents=True, exist_ok=True)
+            destination = large_dir / entry.name
+            if move:
+                shutil.move(str(path), destination)
+            else:
+                shutil.copyfile(path, destination)
+            return destination
+
+        results: Dict[str, Union[str, Path]] = {}
+        missing: List[Tuple[_VolumeEntry, str, Optional[str]]] = []
+        for name, entry in wanted.items():
+            relative = f"{directory}/{name}" if directory else name
+            source_uri = self._normalize_volume_uri(volume, relative)
+            cache_key = None
+            if self._volume_cache.enabled and entry.size is not None:
+                cache_key = self._volume_cache_key(source_uri, entry.size, entry.last_modified)
+                cached_path = self._volume_cache.get_path(cache_key)
+                if cached_path is not None:
+                    results[name] = deliver(entry, cached_path, move=False)
+                    continue
+            missing.append((entry, source_uri, cache_key))
+        if not missing:
+            return results
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            downloads: Dict[str, Path] = {}
+            if self._prefer_directory_get([entry for entry, _, _ in missing], listed):
+                # Most of the directory is needed: one GET for the whole directory
+                with self._borrow_session() as session:
+                    session.file.get(self._normalize_volume_uri(volume, directory), tmp_dir)
+                for entry, _, _ in missing:
+                    relative = f"{directory}/{entry.name}" if directory else entry.name
+                    located = self._locate_download(Path(tmp_dir), relative)
+                    if located is not None:
+                        downloads[entry.name] = located
+            else:
+
+                def fetch(index: int, entry: _VolumeEntry, source_uri: str) -> Tuple[str, Optional[Path]]:
+                    file_dir = Path(tmp_dir) / str(index)
+                    file_dir.mkdir()
+                    with self._borrow_session() as session:
+                        session.file.get(source_uri, str(file_dir))
+                    return entry.name, self._locate_download(file_dir, entry.name)
+
+                workers = max(1, min(max_workers or self._pool.max_size, len(missing)))
+                with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="clickzetta-volume") as executor:
+                    futures = [
+                        executor.submit(fetch, index, entry, source_uri)
+                        for index, (entry, source_uri, _) in enumerate(missing)
+                    ]
+                    for future in futures:
+                        name, located = future.result()
+                        if located is not None:
+                            downloads[name] = located
+
+            for entry, _, cache_key in missing:
+                located = downloads.get(entry.name)
+                if located is None:
+                    logger.warning(f"File '{entry.name}' was listed but not downloaded from {volume}")
+                    continue
+                if cache_key is not None:
+                    self._volume_cache.put_file(cache_key, located)
+                results[entry.name] = deliver(entry, located, move=True)
+        return results
+
     @staticmethod
     def _extract_row_count(df: pd.DataFrame) -> int:
         if df is None or df.empty:
@@ -370,6 +1229,19 @@ class ClickZettaConnector:
             column_lines.append(col_def)
 
         columns_section = ",\n  ".join(column_lines) if column_lines else ""
+        return self._definition_from_section(
+            workspace, schema_name, table_name, columns_section, table_comment=table_comment, table_type=table_type
+        )
+
+    @staticmethod
+    def _definition_from_section(
+        workspace: str,
+        schema_name: str,
+        table_name: str,
+        columns_section: str,
+        table_comment: Optional[str] = "",
+        table_type: str = "table",
+    ) -> str:
         # Build table name parts
         escaped_workspace = _safe_escape_identifier(workspace)
         escaped_schema = _safe_escape_identifier(schema_name)
@@ -381,7 +1253,8 @@ class ClickZettaConnector:
             if columns_section
             else f"CREATE {table_type.upper()} {table_full_name}"
         )
-        if table_comment:
+        # Missing comments come back from pandas as NaN
+        if table_comment and not pd.isna(table_comment):
             definition += f"\nCOMMENT = '{_safe_escape(str(table_comment))}'"
         return definition
 
@@ -392,14 +1265,15 @@ class ClickZettaConnector:
         try:
             df = self._run_command(sql)
             row_count = self._extract_row_count(df)
-            return ExecuteSQLResult(
+            result = ExecuteSQLResult(
                 success=True,
                 sql_query=sql,
                 sql_return=str(row_count),
                 row_count=row_count,
             )
         except DatusException as exc:
-            return ExecuteSQLResult(success=False, error=str(exc), sql_query=sql, sql_return="", row_count=0)
+            result = ExecuteSQLResult(success=False, error=str(exc), sql_query=sql, sql_return="", row_count=0)
+        return self._attach_execution_stats(result, self.last_execution_stats)
 
     def execute_update(self, sql: str) -> ExecuteSQLResult:
         return self.execute_insert(sql)
@@ -408,48 +1282,71 @@ class ClickZettaConnector:
         return self.execute_insert(sql)
 
     def execute_query(
-        self, sql: str, result_format: Literal["csv", "arrow", "pandas", "list"] = "csv"
+        self,
+        sql: str,
+        result_format: Literal["csv", "arrow", "pandas", "list"] = "csv",
+        hint_profile: Optional[str] = None,
+        max_rows: Optional[int] = None,
     ) -> ExecuteSQLResult:
-        try:
-            df = self._run_query(sql)
-            row_count = len(df)
-            if result_format == "csv":
-                sql_return: Any = df.to_csv(index=False)
-            elif result_format == "arrow":
-                sql_return = pa.Table.from_pandas(df)
-            elif result_format == "list":
-                sql_return = df.to_dict(orient="records")
-            else:
-                sql_return = df
+        """Execute a query and return it in ``result_format``.
 
-            return ExecuteSQLResult(
-                success=True,
-                sql_query=sql,
-                sql_return=sql_return,
-                row_count=row_count,
-                result_format=result_format,
-            )
-        except DatusException as exc:
-            return ExecuteSQLResult(success=False, error=str(exc), sql_query=sql)
-        except Exception as exc:  # Ensure unexpected errors are also surfaced in result
-            # Surface unexpected errors in logs while keeping graceful result contract
-            logger.error(f"Unexpected error in execute_query: {exc}", exc_info=True)
-            return ExecuteSQLResult(success=False, error=str(exc), sql_query=sql)
-
-    def execute_pandas(self, sql: str) -> ExecuteSQLResult:
-        result = self.execute_query(sql, result_format="pandas")
+        ``max_rows`` is enforced at the source: SELECTs are wrapped in a LIMIT and other statements stop
+        fetching once the cap is exceeded. ``result.execution_stats["truncated"]`` tells whether rows were cut off.
+        """
+        with self._track_execution(sql, hint_profile) as stats:
+            try:
+                table = self._run_query_arrow(sql, hint_profile, max_rows)
+                row_count = table.num_rows
+                started = time.perf_counter()
+                if result_format == "csv":
+                    sql_return: Any = self._arrow_to_csv(table)
+                elif result_format == "arrow":
+                    sql_return = table
+                elif result_format == "list":
+                    sql_return = table.to_pylist()
+                else:
+                    sql_return = table.to_pandas()
+                stats.conversion_seconds += time.perf_counter() - started
+
+                result = ExecuteSQLResult(
+                    success=True,
+                    sql_query=sql,
+                    sql_return=sql_return,
+                    row_count=row_count,
+                    result_format=result_format,
+                )
+            except DatusException as exc:
+                result = ExecuteSQLResult(success=False, error=str(exc), sql_query=sql)
+            except Exception as exc:  # Ensure unexpected errors are also surfaced in result
+                # Surface unexpected errors in logs while keeping graceful result contract
+                logger.error(f"Unexpected error in execute_query: {exc}", exc_info=True)
+                stats.error = stats.error or str(exc)
+                result = ExecuteSQLResult(success=False, error=str(exc), sql_query=sql)
+        # Attached once the tracking block has closed, so the snapshot includes total_seconds
+        return self._attach_execution_stats(result, stats)
+
+    def execute_pandas(
+        self, sql: str, hint_profile: Optional[str] = None, max_rows: Optional[int] = None
+    ) -> ExecuteSQLResult:
+        result = self.execute_query(sql, result_format="pandas", hint_profile=hint_profile, max_rows=max_rows)
         if not result.success:
             return result
         if hasattr(result.sql_return, "empty"):
             result.row_count = len(result.sql_return)
         return result
 
-    def execute_query_to_df(self, sql: str, max_rows: Optional[int] = None) -> pd.DataFrame:
-        """Execute query and directly return pandas DataFrame for convenience."""
+    def execute_query_to_df(
+        self, sql: str, max_rows: Optional[int] = None, hint_profile: Optional[str] = None
+    ) -> pd.DataFrame:
+        """Execute query and directly return pandas DataFrame for convenience.
+
+        ``max_rows`` is pushed down as a LIMIT; ``df.attrs["truncated"]`` tells whether rows were cut off.
+        """
         try:
-            df = self._run_query(sql)
-            if max_rows is not None and len(df) > max_rows:
-                df = df.head(max_rows)
+            df = self._run_query(sql, hint_profile, max_rows)
+            if max_rows is not None:
+                stats = self.last_execution_stats
+                df.attrs["truncated"] = bool(stats and stats.truncated)
             return df
         except Exception as e:
             logger.error(f"Error executing query to DataFrame: {sql}, error: {str(e)}")
@@ -458,14 +1355,22 @@ class ClickZettaConnector:
                 message=f"Failed to execute query to DataFrame: {str(e)}"
             ) from e
 
-    def execute_query_to_dict(self, sql: str) -> List[Dict[str, Any]]:
-        """Execute query and return result as list of dictionaries for JSON serialization."""
+    def execute_query_to_dict(
+        self, sql: str, hint_profile: Optional[str] = None, max_rows: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """Execute query and return result as list of dictionaries for JSON serialization.
+
+        With ``max_rows``, ``last_execution_stats.truncated`` tells whether rows were cut off.
+        """
         try:
-            df = self._run_query(sql)
-            if df.empty:
-                return []
-            # Convert DataFrame to list of dictionaries with records orientation
-            return df.to_dict(orient="records")
+            with self._track_execution(sql, hint_profile) as stats:
+                table = self._run_query_arrow(sql, hint_profile, max_rows)
+                if table.num_rows == 0:
+                    return []
+                started = time.perf_counter()
+                rows = table.to_pylist()
+                stats.conversion_seconds += time.perf_counter() - started
+                return rows
         except Exception as e:
             logger.error(f"Error executing query to dict: {sql}, error: {str(e)}")
             raise DatusException(
@@ -476,33 +1381,30 @@ class ClickZettaConnector:
     def execute_ddl(self, sql: str) -> ExecuteSQLResult:
         try:
             self._run_command(sql)
-            return ExecuteSQLResult(success=True, sql_query=sql, sql_return="Successful", row_count=0)
+            self._invalidate_for_ddl(sql)
+            result = ExecuteSQLResult(success=True, sql_query=sql, sql_return="Successful", row_count=0)
         except DatusException as exc:
-            return ExecuteSQLResult(success=False, error=str(exc), sql_query=sql)
+            result = ExecuteSQLResult(success=False, error=str(exc), sql_query=sql)
+        return self._attach_execution_stats(result, self.last_execution_stats)
 
-    def execute_csv(self, sql: str) -> ExecuteSQLResult:
-        result = self.execute_query(sql, result_format="csv")
+    def execute_csv(
+        self, sql: str, hint_profile: Optional[str] = None, max_rows: Optional[int] = None
+    ) -> ExecuteSQLResult:
+        result = self.execute_query(sql, result_format="csv", hint_profile=hint_profile, max_rows=max_rows)
         return result
 
-    def execute_arrow(self, sql: str) -> ExecuteSQLResult:
+    def execute_arrow(
+        self, sql: str, hint_profile: Optional[str] = None, max_rows: Optional[int] = None
+    ) -> ExecuteSQLResult:
         """Execute query and return result with Arrow data format for high performance."""
         try:
-            df = self._run_query(sql)
-            if df.empty:
-                return ExecuteSQLResult(
-                    success=True,
-                    data=pa.Table.from_pandas(df),
-                    row_count=0
-                )
-
-            # Convert pandas DataFrame to Arrow Table
-            arrow_table = pa.Table.from_pandas(df)
-
-            return ExecuteSQLResult(
+            arrow_table = self._run_query_arrow(sql, hint_profile, max_rows)
+            result = ExecuteSQLResult(
                 success=True,
                 data=arrow_table,
-                row_count=len(df)
+                row_count=arrow_table.num_rows
             )
+            return self._attach_execution_stats(result, self.last_execution_stats)
         except Exception as e:
             logger.error(f"Error executing Arrow query: {sql}, error: {str(e)}")
             raise DatusException(
@@ -513,49 +1415,118 @@ class ClickZettaConnector:
     def test_connection(self):
         self._run_query("SELECT 1")
 
-    def execute_queries(self, queries: List[str]) -> List[Any]:
-        results: List[Any] = []
-        for query in queries:
-            if parse_sql_type(query, self.dialect) == SQLType.SELECT:
-                df = self._run_query(query)
-                results.append(df.to_dict(orient="records"))
-            else:
+    def execute_queries(self, queries: List[str], max_workers: int = 1) -> List[Any]:
+        """Execute ``queries`` and return rows for SELECTs and affected row counts for other statements.
+
+        With ``max_workers`` above 1, consecutive SELECTs run concurrently on separate pooled sessions while
+        every other statement waits for the preceding ones and runs alone. Results keep the input order and
+        per-statement timings are left in ``last_batch_timings``. The first failure is raised.
+        """
+
+        def run_select(query: str) -> Any:
+            return self._run_query_arrow(query).to_pylist()
+
+        def run_command(query: str) -> Any:
+            return self._extract_row_count(self._run_command(query))
+
+        return self._run_batch(queries, run_select, run_command, max_workers)
+
+    def execute_queries_arrow(self, queries: List[str], max_workers: int = 1) -> List[ExecuteSQLResult]:
+        """Execute multiple queries and return results in Arrow format for batch processing performance.
+
+        ``max_workers`` works as in :meth:`execute_queries`; a failing statement yields a failed result
+        instead of stopping the batch.
+        """
+
+        def failed(query: str, exc: Exception) -> ExecuteSQLResult:
+            logger.error(f"Error executing query in batch: {query}, error: {str(exc)}")
+            # Add failed result to maintain query order
+            return ExecuteSQLResult(success=False, data=None, row_count=0, error_message=str(exc))
+
+        def run_select(query: str) -> ExecuteSQLResult:
+            try:
+                # Use execute_arrow for SELECT queries to get Arrow data
+                return self.execute_arrow(query)
+            except Exception as e:
+                return failed(query, e)
+
+        def run_command(query: str) -> ExecuteSQLResult:
+            try:
+                # For non-SELECT queries, use standard execution
                 command_df = self._run_command(query)
-                results.append(self._extract_row_count(command_df))
-        return results
+                row_count = self._extract_row_count(command_df)
+                return ExecuteSQLResult(
+                    success=True,
+                    data=None,  # No data for non-SELECT queries
+                    row_count=row_count
+                )
+            except Exception as e:
+                return failed(query, e)
+
+        return self._run_batch(queries, run_select, run_command, max_workers)
 
-    def execute_queries_arrow(self, queries: List[str]) -> List[ExecuteSQLResult]:
-        """Execute multiple queries and return results in Arrow format for batch processing performance."""
-        results: List[ExecuteSQLResult] = []
-        for query in queries:
+    def _run_batch(
+        self,
+        queries: List[str],
+        run_select: Callable[[str], Any],
+        run_command: Callable[[str], Any],
+        max_workers: int,
+    ) -> List[Any]:
+        """Run a statement batch, overlapping runs of consecutive SELECTs; other statements act as barriers."""
+        is_select = [parse_sql_type(query, self.dialect) == SQLType.SELECT for query in queries]
+        results: List[Any] = [None] * len(queries)
+        timings: List[Optional[StatementTiming]] = [None] * len(queries)
+        self.last_batch_timings = []
+
+        def timed(index: int, concurrent: bool) -> Any:
+            started = time.perf_counter()
             try:
-                if parse_sql_type(query, self.dialect) == SQLType.SELECT:
-                    # Use execute_arrow for SELECT queries to get Arrow data
-                    result = self.execute_arrow(query)
-                    results.append(result)
+                return (run_select if is_select[index] else run_command)(queries[index])
+            finally:
+                timings[index] = StatementTiming(index, queries[index], time.perf_counter() - started, concurrent)
+
+        workers = max(1, min(max_workers, self._pool.max_size))
+        executor = (
+            ThreadPoolExecutor(max_workers=workers, thread_name_prefix="clickzetta-batch") if workers > 1 else None
+        )
+        try:
+            index = 0
+            while index < len(queries):
+                end = index + 1
+                while executor is not None and is_select[index] and end < len(queries) and is_select[end]:
+                    end += 1
+                if end - index == 1:
+                    results[index] = timed(index, False)
                 else:
-                    # For non-SELECT queries, use standard execution
-                    command_df = self._run_command(query)
-                    row_count = self._extract_row_count(command_df)
-                    results.append(ExecuteSQLResult(
-                        success=True,
-                        data=None,  # No data for non-SELECT queries
-                        row_count=row_count
-                    ))
-            except Exception as e:
-                logger.error(f"Error executing query in batch: {query}, error: {str(e)}")
-                # Add failed result to maintain query order
-                results.append(ExecuteSQLResult(
-                    success=False,
-                    data=None,
-                    row_count=0,
-                    error_message=str(e)
-                ))
+                    futures = [executor.submit(timed, position, True) for position in range(index, end)]
+                    for position, future in zip(range(index, end), futures):
+                        results[position] = future.result()
+                index = end
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=True)
+            self.last_batch_timings = [timing for timing in timings if timing is not None]
         return results
 
     def execute_content_set(self, sql_query: str) -> ExecuteSQLResult:
+        """Run a USE or SET statement and carry its effect over to every pooled session.
+
+        Schema and virtual cluster switches update the connector's state, and SET statements are recorded;
+        each pooled session catches up the next time it is borrowed. Temporary tables and views still live
+        on the single session that created them, so workloads relying on them need ``pool_max_size=1``.
+        """
         try:
             self._run_command(sql_query)
+            if set_match := _SET_STATEMENT_PATTERN.match(sql_query):
+                with self._session_settings_lock:
+                    version, settings = self._session_settings
+                    settings = dict(settings)
+                    settings[set_match.group("key").lower()] = sql_query.strip().rstrip(";").strip()
+                    self._session_settings = (version + 1, settings)
+                return ExecuteSQLResult(success=True, sql_query=sql_query, sql_return="Successful", row_count=0)
+            if vcluster_match := _USE_VCLUSTER_PATTERN.match(sql_query):
+                self.vcluster = vcluster_match.group("name").strip("`")
+                return ExecuteSQLResult(success=True, sql_query=sql_query, sql_return="Successful", row_count=0)
             switch_context = parse_context_switch(sql=sql_query, dialect=self.dialect)
             if switch_context:
                 if catalog_name := switch_context.get("catalog_name"):
@@ -568,6 +1539,211 @@ class ClickZettaConnector:
         except DatusException as exc:
             return ExecuteSQLResult(success=False, error=str(exc), sql_query=sql_query)
 
+    # ------------------------------------------------------------------ #
+    # Streaming
+    # ------------------------------------------------------------------ #
+    def execute_arrow_iterator(
+        self, sql: str, max_rows: int = 10000, hint_profile: Optional[str] = None
+    ) -> Iterator[pa.RecordBatch]:
+        """Execute a query and yield Arrow record batches of at most ``max_rows`` rows as they are fetched.
+
+        A pooled session is held until the iterator is exhausted or closed. At least one (possibly empty)
+        batch is always yielded so callers can read the result schema.
+        """
+        if max_rows <= 0:
+            raise ValueError("max_rows must be a positive integer")
+        try:
+            with self._borrow_session(self._resolve_hint_profile(sql, hint_profile)) as session:
+                yield from self._iter_result_batches(session.sql(sql), max_rows)
+        except (OSError, ValueError, RuntimeError) as exc:
+            self._wrap_exception(exc, sql)
+
+    def execute_csv_iterator(
+        self, sql: str, max_rows: int = 100, with_header: bool = True, hint_profile: Optional[str] = None
+    ) -> Iterator[Tuple]:
+        """Execute a query and yield the column names followed by one tuple per row, fetched in batches."""
+        header_sent = not with_header
+        for batch in self.execute_arrow_iterator(sql, max_rows=max_rows, hint_profile=hint_profile):
+            if not header_sent:
+                yield tuple(batch.schema.names)
+                header_sent = True
+            yield from zip(*(column.to_pylist() for column in batch.columns))
+
+    def _iter_result_batches(self, result: Any, max_rows: int) -> Iterator[pa.RecordBatch]:
+        """Yield bounded record batches, streaming from the SDK's batch APIs when it exposes them."""
+        for method_name in ("to_arrow_batches", "to_pandas_batches"):
+            method = getattr(result, method_name, None)
+            if not callable(method):
+                continue
+            try:
+                chunks = iter(method())
+                first = next(chunks, None)
+            except (AttributeError, NotImplementedError, TypeError) as exc:
+                logger.debug(f"Streaming via {method_name} unavailable: {exc}")
+                continue
+            if not isinstance(first, (pa.RecordBatch, pa.Table, pd.DataFrame)):
+                continue
+            for chunk in itertools.chain([first], chunks):
+                yield from self._split_batch(chunk, max_rows)
+            return
+
+        # No streaming support: fetch once and slice (zero-copy) into bounded batches
+        yield from self._split_batch(self._result_to_arrow(result), max_rows)
+
+    @staticmethod
+    def _split_batch(chunk: Any, max_rows: int) -> Iterator[pa.RecordBatch]:
+        if isinstance(chunk, pd.DataFrame):
+            chunk = pa.Table.from_pandas(chunk, preserve_index=False)
+        if isinstance(chunk, pa.Table):
+            # An empty table has no batches; keep its schema visible to the consumer
+            batches = chunk.to_batches(max_chunksize=max_rows)
+            yield from batches or [pa.RecordBatch.from_pylist([], schema=chunk.schema)]
+            return
+        if chunk.num_rows == 0:
+            yield chunk
+            return
+        for offset in range(0, chunk.num_rows, max_rows):
+            yield chunk.slice(offset, max_rows)
+
+    # ------------------------------------------------------------------ #
+    # Export
+    # ------------------------------------------------------------------ #
+    def export_parquet(
+        self,
+        sql: str,
+        target_dir: str,
+        partition_by: Optional[List[str]] = None,
+        compression: str = "zstd",
+        rows_per_file: int = 1_000_000,
+        rows_per_group: int = 128 * 1024,
+        overwrite: bool = False,
+        hint_profile: Optional[str] = None,
+        unload_volume: Optional[str] = None,
+    ) -> ParquetExport:
+        """Write the result of ``sql`` as Parquet files into the local directory ``target_dir``.
+
+        Record batches are streamed from the SDK's batch API into ``pyarrow.dataset.write_dataset``, which
+        encodes and compresses files on multiple threads and applies backpressure, so memory stays bounded by
+        a few row groups per open file. ``partition_by`` writes a hive-partitioned tree (``col=value/part-0.parquet``);
+        ``rows_per_file`` splits large results so files are compressed in parallel.
+
+        With ``unload_volume`` the server writes the files instead (``COPY INTO <volume> ... FILE_FORMAT =
+        (TYPE = PARQUET)``) and they are downloaded with one directory ``GET``, so no rows pass through the
+        client. Partitioning and compression are then left to the server.
+        """
+        if rows_per_group <= 0 or rows_per_file < rows_per_group:
+            raise ValueError("rows_per_group must be positive and not larger than rows_per_file")
+        if unload_volume and partition_by:
+            raise ValueError("partition_by is not supported with server-side unload")
+        target = Path(target_dir).expanduser()
+        if target.exists() and any(target.iterdir()):
+            if not overwrite:
+                raise FileExistsError(f"Export directory {target} is not empty")
+            shutil.rmtree(target)
+        target.mkdir(parents=True, exist_ok=True)
+
+        if unload_volume:
+            self._unload_parquet(sql, target, unload_volume)
+        else:
+            self._write_parquet_dataset(
+                sql, target, partition_by, compression, rows_per_file, rows_per_group, hint_profile
+            )
+        files = sorted(target.rglob("*.parquet"))
+        return ParquetExport(
+            path=target,
+            files=files,
+            # Footers only: row counts are read without scanning the data
+            rows=sum(pq.ParquetFile(str(path)).metadata.num_rows for path in files),
+            bytes=sum(path.stat().st_size for path in files),
+            server_side=bool(unload_volume),
+        )
+
+    def _write_parquet_dataset(
+        self,
+        sql: str,
+        target: Path,
+        partition_by: Optional[List[str]],
+        compression: str,
+        rows_per_file: int,
+        rows_per_group: int,
+        hint_profile: Optional[str],
+    ) -> None:
+        with self._track_execution(sql, hint_profile) as stats:
+            try:
+                started = time.perf_counter()
+                hint_profile = self._resolve_hint_profile(sql, hint_profile)
+                stats.hint_profile = stats.hint_profile or hint_profile
+                with self._borrow_session(hint_profile) as session:
+                    result = self._submit(session, sql, stats, started)
+                    batches = self._iter_result_batches(result, rows_per_group)
+                    first = next(batches)
+                    missing = [column for column in partition_by or [] if column not in first.schema.names]
+                    if missing:
+                        raise ValueError(f"Partition columns not in the result: {', '.join(missing)}")
+
+                    def counted() -> Iterator[pa.RecordBatch]:
+                        for batch in itertools.chain([first], batches):
+                            stats.rows += batch.num_rows
+                            stats.result_bytes += batch.nbytes
+                            yield batch
+
+                    fetch_started = time.perf_counter()
+                    ds.write_dataset(
+                        counted(),
+                        str(target),
+                        schema=first.schema,
+                        format="parquet",
+                        file_options=ds.ParquetFileFormat().make_write_options(compression=compression),
+                        partitioning=partition_by or None,
+                        partitioning_flavor="hive" if partition_by else None,
+                        basename_template="part-{i}.parquet",
+                        max_rows_per_file=rows_per_file,
+                        max_rows_per_group=rows_per_group,
+                        existing_data_behavior="overwrite_or_ignore",
+                        use_threads=True,
+                    )
+                    # Fetching and encoding overlap, so the whole streaming write is booked as fetch time
+                    stats.fetch_seconds += time.perf_counter() - fetch_started
+            except (OSError, ValueError, RuntimeError) as exc:
+                stats.error = stats.error or str(exc)
+                self._wrap_exception(exc, sql)
+
+    @staticmethod
+    def _unload_target(volume: str) -> str:
+        """Translate a volume URI into the target clause of ``COPY INTO`` / ``REMOVE``."""
+        match = _UNLOAD_VOLUME_PATTERN.match(volume.strip())
+        if match is None:
+            raise ValueError(f"Unsupported unload volume: {volume}")
+        kind, name = (match.group("kind") or "").lower(), match.group("name")
+        if kind == "user":
+            return "USER VOLUME"
+        if not name:
+            raise ValueError(f"Unload volume {volume} does not name a volume")
+        escaped = _safe_escape_identifier(name)
+        return f"TABLE VOLUME `{escaped}`" if kind == "table" else f"VOLUME `{escaped}`"
+
+    def _unload_parquet(self, sql: str, target: Path, volume: str) -> None:
+        """Have the server write the result into ``volume`` as Parquet, then download it with one GET."""
+        target_clause = self._unload_target(volume)
+        directory = f"{self.UNLOAD_DIRECTORY}/{uuid.uuid4().hex}"
+        body = sql.strip().rstrip(";").rstrip()
+        # Newlines keep a trailing line comment in the query from swallowing the closing parenthesis
+        self._run_command(
+            f"COPY INTO {target_clause} SUBDIRECTORY '{directory}/' FROM (\n{body}\n) "
+            f"FILE_FORMAT = (TYPE = PARQUET)",
+            hint_profile="dml",
+        )
+        try:
+            with self._borrow_session() as session:
+                session.file.get(self._normalize_volume_uri(volume, directory), str(target))
+        except (OSError, ValueError, RuntimeError) as exc:
+            self._wrap_exception(exc, f"GET {volume}/{directory}")
+        finally:
+            try:
+                self._run_command(f"REMOVE {target_clause} SUBDIRECTORY '{directory}/'", hint_profile="dml")
+            except DatusException as exc:
+                logger.warning(f"Failed to remove unloaded files under {directory} in {volume}: {exc}")
+
     # ------------------------------------------------------------------ #
     # Metadata helpers
     # ------------------------------------------------------------------ #
@@ -587,7 +1763,7 @@ class ClickZettaConnector:
 
     def get_catalogs(self) -> List[str]:
         try:
-            df = self._run_query("SHOW CATALOGS")
+            df = self._run_query("SHOW CATALOGS", hint_profile="metadata")
             if "catalog_name" in df.columns:
                 return df["catalog_name"].dropna().tolist()
             if "name" in df.columns:
@@ -609,7 +1785,7 @@ class ClickZettaConnector:
         info_schema = self._info_schema(workspace)
         sql = f"SELECT DISTINCT table_schema FROM {info_schema}.tables"
         try:
-            df = self._run_query(sql)
+            df = self._run_query(sql, hint_profile="metadata")
             schemas = df["table_schema"].dropna().tolist()
             if not include_sys:
                 schemas = [s for s in schemas if not str(s).startswith("INFORMATION_SCHEMA")]
@@ -617,58 +1793,71 @@ class ClickZettaConnector:
         except DatusException:
             return [self.schema_name] if self.schema_name else []
 
-    def get_tables(self, catalog_name: str = "", database_name: str = "", schema_name: str = "") -> List[str]:
+    def _table_inventory(self, workspace: str, schema: str) -> List[Tuple[str, str]]:
+        """Return ``(table_name, TABLE_TYPE)`` pairs for a schema, cached per (workspace, schema)."""
+
+        def load() -> List[Tuple[str, str]]:
+            info_schema = self._info_schema(workspace)
+            sql = (
+                f"SELECT table_name, table_type FROM {info_schema}.tables "
+                f"WHERE upper(table_schema) = '{_safe_escape(schema)}'"
+            )
+            df = self._run_query(sql, hint_profile="metadata")
+            if df.empty:
+                return []
+            return [(row.table_name, str(row.table_type).upper()) for row in df.itertuples()]
+
+        return self._table_inventory_cache.get_or_load((workspace, schema), load)
+
+    def invalidate_metadata_cache(self, database_name: str = "", schema_name: str = "") -> None:
+        """Drop cached metadata for one schema, a whole workspace, or everything when called without arguments."""
+        workspace = database_name.lower()
+        schema = schema_name.upper() if schema_name else ""
+
+        def matches(key: Any) -> bool:
+            key_workspace, key_schema = key[0], key[1]
+            if workspace and key_workspace.lower() != workspace:
+                return False
+            return not schema or key_schema == schema
+
+        self._table_inventory_cache.invalidate_where(matches)
+        self._column_cache.invalidate_where(matches)
+
+    def _invalidate_for_ddl(self, sql: str) -> None:
+        """Invalidate cached metadata for the schema touched by a DDL statement."""
+        match = _DDL_OBJECT_PATTERN.match(sql or "")
+        if not match:
+            return
+        parts = [quoted or bare for quoted, bare in re.findall(r"`([^`]+)`|([\w$]+)", match.group("name"))]
+        if match.group("kind").upper() == "SCHEMA":
+            workspace = parts[-2] if len(parts) > 1 else self.database_name
+            self.invalidate_metadata_cache(database_name=workspace, schema_name=parts[-1])
+            return
+        schema = parts[-2] if len(parts) > 1 else self.schema_name
+        workspace = parts[-3] if len(parts) > 2 else self.database_name
+        self.invalidate_metadata_cache(database_name=workspace, schema_name=schema)
+
+    def _inventory_names(self, database_name: str, schema_name: str, table_types: set) -> List[str]:
         workspace = database_name or self.database_name
         schema = self._normalized_schema(schema_name)
         if not workspace or not schema:
             return []
-        info_schema = self._info_schema(workspace)
-        sql = (
-            f"SELECT table_name, table_type FROM {info_schema}.tables "
-            f"WHERE upper(table_schema) = '{_safe_escape(schema)}'"
-        )
-        df = self._run_query(sql)
-        if df.empty:
-            return []
-        valid_types = {"MANAGED_TABLE", "EXTERNAL_TABLE", "BASE TABLE", "TABLE"}
-        return [row.table_name for row in df.itertuples() if str(row.table_type).upper() in valid_types]
+        return [name for name, table_type in self._table_inventory(workspace, schema) if table_type in table_types]
+
+    def get_tables(self, catalog_name: str = "", database_name: str = "", schema_name: str = "") -> List[str]:
+        return self._inventory_names(database_name, schema_name, _TABLE_TYPES)
 
     def get_views(self, catalog_name: str = "", database_name: str = "", schema_name: str = "") -> List[str]:
-        workspace = database_name or self.database_name
-        schema = self._normalized_schema(schema_name)
-        if not workspace or not schema:
-            return []
-        info_schema = self._info_schema(workspace)
-        sql = (
-            f"SELECT table_name, table_type FROM {info_schema}.tables "
-            f"WHERE upper(table_schema) = '{_safe_escape(schema)}'"
-        )
         try:
-            df = self._run_query(sql)
-            if df.empty:
-                return []
-            view_types = {"VIEW", "DYNAMIC_TABLE"}
-            return [row.table_name for row in df.itertuples() if str(row.table_type).upper() in view_types]
+            return self._inventory_names(database_name, schema_name, _VIEW_TYPES)
         except DatusException:
             return []
 
     def get_materialized_views(
         self, catalog_name: str = "", database_name: str = "", schema_name: str = ""
     ) -> List[str]:
-        workspace = database_name or self.database_name
-        schema = self._normalized_schema(schema_name)
-        if not workspace or not schema:
-            return []
-        info_schema = self._info_schema(workspace)
-        sql = (
-            f"SELECT table_name, table_type FROM {info_schema}.tables "
-            f"WHERE upper(table_schema) = '{_safe_escape(schema)}'"
-        )
         try:
-            df = self._run_query(sql)
-            if df.empty:
-                return []
-            return [row.table_name for row in df.itertuples() if str(row.table_type).upper() == "MATERIALIZED_VIEW"]
+            return self._inventory_names(database_name, schema_name, _MATERIALIZED_VIEW_TYPES)
         except DatusException:
             return []
 
@@ -695,31 +1884,50 @@ class ClickZettaConnector:
             include_views=True,
         )
 
-    def _collect_table_definitions(
+    def iter_tables_with_ddl(
         self,
+        catalog_name: str = "",
         database_name: str = "",
         schema_name: str = "",
         tables: Optional[List[str]] = None,
-        include_views: bool = False,
-    ) -> List[Dict[str, str]]:
-        workspace = database_name or self.database_name
-        schema = self._normalized_schema(schema_name)
-        if not workspace or not schema:
-            return []
+    ) -> Iterator[Dict[str, str]]:
+        """Yield the records of :meth:`get_tables_with_ddl` one at a time.
 
-        info_schema = self._info_schema(workspace)
-        base_query = (
-            f"SELECT table_name, comment, table_type "
-            f"FROM {info_schema}.tables WHERE upper(table_schema) = '{_safe_escape(schema)}'"
+        For a whole schema the columns are streamed in Arrow batches, so only the definitions of the
+        current batch are held in memory. A pooled session is held until the generator is exhausted or closed.
+        """
+        return self._iter_table_definitions(
+            database_name=database_name, schema_name=schema_name, tables=tables, include_views=False
         )
-        if tables:
-            table_list = ",".join(f"'{_safe_escape(tbl)}'" for tbl in tables)
-            base_query += f" AND table_name IN ({table_list})"
-        try:
-            tables_df = self._run_query(base_query)
-        except DatusException:
-            return []
 
+    def iter_views_with_ddl(
+        self, catalog_name: str = "", database_name: str = "", schema_name: str = ""
+    ) -> Iterator[Dict[str, str]]:
+        """Yield the records of :meth:`get_views_with_ddl` one at a time."""
+        return self._iter_table_definitions(database_name=database_name, schema_name=schema_name, include_views=True)
+
+    @staticmethod
+    def _classify_table_type(table_type_raw: Any) -> str:
+        table_type_raw = str(table_type_raw or "").upper()
+        if table_type_raw in _VIEW_TYPES:
+            return "view"
+        if table_type_raw in _MATERIALIZED_VIEW_TYPES:
+            return "mv"
+        return "table"
+
+    @staticmethod
+    def _matches_definition_kind(table_type: str, include_views: bool) -> bool:
+        # Materialized views are reported by neither get_tables_with_ddl nor get_views_with_ddl
+        return table_type == "view" if include_views else table_type == "table"
+
+    def _fetch_columns_map(
+        self, workspace: str, schema: str, tables: Optional[List[str]] = None, strict: bool = False
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """Read columns of ``tables`` (or the whole schema) with one query and refresh the column cache.
+
+        Query failures yield an empty map unless ``strict`` is set.
+        """
+        info_schema = self._info_schema(workspace)
         column_query = (
             f"SELECT table_name, column_name, data_type, comment "
             f"FROM {info_schema}.columns WHERE upper(table_schema) = '{_safe_escape(schema)}'"
@@ -730,8 +1938,10 @@ class ClickZettaConnector:
         column_query += " ORDER BY table_name, column_name"
 
         try:
-            columns_df = self._run_query(column_query)
+            columns_df = self._run_query(column_query, hint_profile="metadata")
         except DatusException:
+            if strict:
+                raise
             columns_df = pd.DataFrame()
 
         columns_map: Dict[str, List[Dict[str, Any]]] = {}
@@ -741,81 +1951,354 @@ class ClickZettaConnector:
                 if not table_name:
                     continue
                 columns_map.setdefault(table_name, []).append(item)
+        for table_name, columns in columns_map.items():
+            self._column_cache.put((workspace, schema, table_name), columns)
+        return columns_map
+
+    def _cached_columns_map(
+        self, workspace: str, schema: str, tables: List[str], strict: bool = False
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """Columns of ``tables`` from the column cache, fetching all misses in chunked bulk queries."""
+        columns_map: Dict[str, List[Dict[str, Any]]] = {}
+        missing: List[str] = []
+        for table_name in dict.fromkeys(tables):
+            columns = self._column_cache.get((workspace, schema, table_name))
+            if columns is None:
+                missing.append(table_name)
+            else:
+                columns_map[table_name] = columns
+        for offset in range(0, len(missing), self.METADATA_IN_LIST_CHUNK):
+            chunk = missing[offset : offset + self.METADATA_IN_LIST_CHUNK]
+            columns_map.update(self._fetch_columns_map(workspace, schema, chunk, strict=strict))
+        return columns_map
 
-        records: List[Dict[str, str]] = []
-        for table_item in tables_df.to_dict(orient="records"):
-            table_name = table_item.get("table_name")
-            if not table_name:
-                continue
-            table_type_raw = str(table_item.get("table_type", "")).upper()
-            is_view = table_type_raw in {"VIEW", "DYNAMIC_TABLE"}
-            is_mv = table_type_raw == "MATERIALIZED_VIEW"
-            if include_views and not is_view:
-                continue
-            if not include_views and (is_view or is_mv):
-                continue
-            table_type = "view" if is_view else "table"
-            if is_mv:
-                table_type = "mv"
+    def _build_table_record(
+        self,
+        workspace: str,
+        schema: str,
+        table_item: Dict[str, Any],
+        columns: Optional[List[Dict[str, Any]]] = None,
+        columns_section: Optional[str] = None,
+    ) -> Dict[str, str]:
+        table_name = table_item["table_name"]
+        table_type = self._classify_table_type(table_item.get("table_type"))
+        ddl_type = table_type if table_type != "mv" else "table"
+        if columns_section is not None:
+            definition = self._definition_from_section(
+                workspace,
+                schema,
+                table_name,
+                columns_section,
+                table_comment=table_item.get("comment"),
+                table_type=ddl_type,
+            )
+        else:
             definition = self._build_definition(
                 workspace=workspace,
                 schema_name=schema,
                 table_name=table_name,
-                columns=columns_map.get(table_name, []),
+                columns=columns or [],
                 table_comment=table_item.get("comment"),
-                table_type=table_type if table_type != "mv" else "table",
+                table_type=ddl_type,
             )
-            records.append(
-                {
-                    "identifier": metadata_identifier(
-                        database_name=workspace,
-                        schema_name=schema,
-                        table_name=table_name,
-                        dialect=self.dialect,
-                    ),
-                    "catalog_name": "",
-                    "database_name": workspace,
-                    "schema_name": schema,
-                    "table_name": table_name,
-                    "definition": definition,
-                    "table_type": table_type,
-                }
+        return {
+            "identifier": metadata_identifier(
+                database_name=workspace,
+                schema_name=schema,
+                table_name=table_name,
+                dialect=self.dialect,
+            ),
+            "catalog_name": "",
+            "database_name": workspace,
+            "schema_name": schema,
+            "table_name": table_name,
+            "definition": definition,
+            "table_type": table_type,
+        }
+
+    def _collect_table_definitions(
+        self,
+        database_name: str = "",
+        schema_name: str = "",
+        tables: Optional[List[str]] = None,
+        include_views: bool = False,
+    ) -> List[Dict[str, str]]:
+        return list(
+            self._iter_table_definitions(
+                database_name=database_name, schema_name=schema_name, tables=tables, include_views=include_views
             )
-        return records
+        )
 
-    def get_schema(
-        self, catalog_name: str = "", database_name: str = "", schema_name: str = "", table_name: str = ""
-    ) -> List[Dict[str, Any]]:
-        if not table_name:
-            return []
+    def _iter_table_definitions(
+        self,
+        database_name: str = "",
+        schema_name: str = "",
+        tables: Optional[List[str]] = None,
+        include_views: bool = False,
+    ) -> Iterator[Dict[str, str]]:
         workspace = database_name or self.database_name
         schema = self._normalized_schema(schema_name)
         if not workspace or not schema:
+            return
+
+        if self.incremental_metadata_sync:
+            records = self._sync_table_definitions(workspace, schema, tables)
+            if records is not None:
+                for record in records:
+                    if self._matches_definition_kind(record["table_type"], include_views):
+                        yield record
+                return
+
+        info_schema = self._info_schema(workspace)
+        base_query = (
+            f"SELECT table_name, comment, table_type "
+            f"FROM {info_schema}.tables WHERE upper(table_schema) = '{_safe_escape(schema)}'"
+        )
+        if tables:
+            table_list = ",".join(f"'{_safe_escape(tbl)}'" for tbl in tables)
+            base_query += f" AND table_name IN ({table_list})"
+        try:
+            tables_df = self._run_query(base_query, hint_profile="metadata")
+        except DatusException:
+            return
+
+        table_items: Dict[str, Dict[str, Any]] = {}
+        for table_item in tables_df.to_dict(orient="records"):
+            table_name = table_item.get("table_name")
+            if not table_name:
+                continue
+            table_type = self._classify_table_type(table_item.get("table_type"))
+            if self._matches_definition_kind(table_type, include_views):
+                table_items[table_name] = table_item
+        if not table_items:
+            return
+
+        if tables:
+            # A handful of tables: go through the shared column cache
+            columns_map = self._cached_columns_map(workspace, schema, list(table_items))
+            for table_name, table_item in table_items.items():
+                yield self._build_table_record(workspace, schema, table_item, columns_map.get(table_name, []))
+            return
+
+        # Whole schema: stream the columns and assemble definitions columnar, one batch at a time
+        column_query = (
+            f"SELECT table_name, column_name, data_type, comment "
+            f"FROM {info_schema}.columns WHERE upper(table_schema) = '{_safe_escape(schema)}' "
+            f"ORDER BY table_name, column_name"
+        )
+        wanted = pa.array(list(table_items), type=pa.string())
+        try:
+            for table_name, columns_section, columns in self._iter_column_sections(column_query, wanted):
+                table_item = table_items.pop(table_name, None)
+                if table_item is not None:
+                    # Keep get_schema/get_table_schemas answering from cache after a whole-schema read
+                    self._column_cache.put((workspace, schema, table_name), columns)
+                    yield self._build_table_record(workspace, schema, table_item, columns_section=columns_section)
+        except DatusException as exc:
+            logger.warning(f"Failed to read columns of {workspace}.{schema}: {exc}")
+        # Tables without any column rows (or left over after a failed read)
+        for table_item in table_items.values():
+            yield self._build_table_record(workspace, schema, table_item, [])
+
+    def _iter_column_sections(
+        self, column_query: str, wanted: pa.Array
+    ) -> Iterator[Tuple[str, str, List[Dict[str, Any]]]]:
+        """Yield ``(table_name, columns_section, column_rows)`` from a columns query ordered by table name.
+
+        A table whose rows straddle two batches is held back until its last row has arrived.
+        """
+        pending: Optional[pa.Table] = None
+        for batch in self.execute_arrow_iterator(column_query, max_rows=self.DDL_BATCH_ROWS, hint_profile="metadata"):
+            chunk = self._normalize_column_batch(batch)
+            chunk = chunk.filter(pc.fill_null(pc.is_in(chunk["table_name"], value_set=wanted), False))
+            if pending is not None:
+                chunk = pa.concat_tables([pending, chunk])
+            starts = self._run_starts(chunk["table_name"])
+            if not starts:
+                pending = chunk
+                continue
+            yield from self._column_sections(chunk.slice(0, starts[-1]))
+            pending = chunk.slice(starts[-1])
+        if pending is not None:
+            yield from self._column_sections(pending)
+
+    @staticmethod
+    def _normalize_column_batch(batch: pa.RecordBatch) -> pa.Table:
+        table = pa.Table.from_batches([batch])
+        columns = []
+        for name in ("table_name", "column_name", "data_type", "comment"):
+            if name in table.column_names:
+                columns.append(pc.cast(table[name], pa.string()).combine_chunks())
+            else:
+                columns.append(pa.nulls(table.num_rows, type=pa.string()))
+        return pa.table(columns, names=["table_name", "column_name", "data_type", "comment"])
+
+    @staticmethod
+    def _run_starts(values: Union[pa.Array, pa.ChunkedArray]) -> List[int]:
+        """Offsets where a new run of equal values begins."""
+        count = len(values)
+        if count == 0:
             return []
+        if isinstance(values, pa.ChunkedArray):
+            values = values.combine_chunks()
+        changed = pc.fill_null(pc.not_equal(values.slice(1), values.slice(0, count - 1)), True)
+        return [0] + (np.flatnonzero(changed.to_numpy(zero_copy_only=False)) + 1).tolist()
+
+    @classmethod
+    def _column_sections(cls, chunk: pa.Table) -> Iterator[Tuple[str, str, List[Dict[str, Any]]]]:
+        """Render the column list of every table in ``chunk`` (rows grouped by table) with Arrow compute.
 
+        Each table's column rows come along in the format of the column cache.
+        """
+        starts = cls._run_starts(chunk["table_name"])
+        if not starts:
+            return
+        column_names = pc.replace_substring(pc.fill_null(chunk["column_name"], ""), "`", "``")
+        data_types = pc.fill_null(chunk["data_type"], "STRING")
+        data_types = pc.if_else(pc.equal(data_types, ""), "STRING", data_types)
+        comments = chunk["comment"]
+        has_comment = pc.fill_null(pc.not_equal(comments, ""), False)
+        comment_sql = pc.if_else(
+            has_comment,
+            pc.binary_join_element_wise(" COMMENT '", pc.replace_substring(comments, "'", "''"), "'", ""),
+            "",
+        )
+        lines = pc.binary_join_element_wise("`", column_names, "` ", data_types, comment_sql, "")
+        if isinstance(lines, pa.ChunkedArray):
+            lines = lines.combine_chunks()
+        offsets = pa.array(starts + [chunk.num_rows], type=pa.int32())
+        sections = pc.binary_join(pa.ListArray.from_arrays(offsets, lines), ",\n  ")
+        table_names = chunk["table_name"].take(pa.array(starts, type=pa.int64()))
+        rows = chunk.to_pylist()
+        bounds = zip(starts, starts[1:] + [chunk.num_rows])
+        column_rows = [rows[start:end] for start, end in bounds]
+        yield from zip(table_names.to_pylist(), sections.to_pylist(), column_rows)
+
+    def _sync_table_definitions(
+        self, workspace: str, schema: str, tables: Optional[List[str]] = None
+    ) -> Optional[List[Dict[str, str]]]:
+        """Bring the definition snapshot of a schema up to date and return its records.
+
+        Only tables whose last-modified time, type or comment changed since the previous sync have their
+        columns re-read; tables missing from information_schema are dropped from the snapshot. Returns
+        ``None`` when the sync cannot run this time (a metadata query failed) so the caller falls back to a
+        full read; the feature is only switched off when the workspace does not expose ``LAST_MODIFIED_COLUMN``.
+        """
         info_schema = self._info_schema(workspace)
-        sql = (
-            f"SELECT column_name, data_type, comment "
-            f"FROM {info_schema}.columns "
-            f"WHERE upper(table_schema) = '{_safe_escape(schema)}' "
-            f"AND table_name = '{_safe_escape(table_name)}' "
-            f"ORDER BY column_name"
+        listing_query = (
+            f"SELECT table_name, comment, table_type, {self.LAST_MODIFIED_COLUMN} AS last_modified "
+            f"FROM {info_schema}.tables WHERE upper(table_schema) = '{_safe_escape(schema)}'"
         )
-        df = self._run_query(sql)
-        result: List[Dict[str, Any]] = []
-        for idx, item in enumerate(df.to_dict(orient="records")):
-            result.append(
-                {
-                    "cid": idx,
-                    "name": item.get("column_name"),
-                    "type": item.get("data_type"),
-                    "comment": item.get("comment"),
-                    "nullable": True,
-                    "pk": False,
-                    "default_value": None,
-                }
-            )
-        return result
+        if tables:
+            table_list = ",".join(f"'{_safe_escape(tbl)}'" for tbl in tables)
+            listing_query += f" AND table_name IN ({table_list})"
+        try:
+            listing_df = self._run_query(listing_query, hint_profile="metadata")
+        except DatusException as exc:
+            if self._mentions_column(exc, self.LAST_MODIFIED_COLUMN):
+                logger.warning(f"Incremental metadata sync unavailable, falling back to full reads: {exc}")
+                self.incremental_metadata_sync = False
+            else:
+                logger.warning(f"Incremental metadata sync failed, falling back to a full read: {exc}")
+            return None
+
+        table_items: Dict[str, Dict[str, Any]] = {}
+        fingerprints: Dict[str, List[Any]] = {}
+        for item in listing_df.to_dict(orient="records"):
+            table_name = item.get("table_name")
+            if not table_name:
+                continue
+            table_items[table_name] = item
+            fingerprints[table_name] = [
+                str(item.get("last_modified")),
+                str(item.get("table_type") or "").upper(),
+                str(item.get("comment") or ""),
+            ]
+
+        key = (self.service, self.instance, workspace, schema)
+        with self._definition_sync_lock:
+            snapshot = self._definition_snapshots.get(key)
+            changed, dropped = snapshot.diff(fingerprints, complete=not tables)
+            if tables:
+                # Tables requested explicitly but no longer present were dropped as well
+                dropped = [name for name in tables if name in snapshot.fingerprints and name not in fingerprints]
+
+            columns_map: Dict[str, List[Dict[str, Any]]] = {}
+            try:
+                for offset in range(0, len(changed), self.METADATA_IN_LIST_CHUNK):
+                    chunk = changed[offset : offset + self.METADATA_IN_LIST_CHUNK]
+                    columns_map.update(self._fetch_columns_map(workspace, schema, chunk, strict=True))
+            except DatusException as exc:
+                # Recording the new fingerprints with empty columns would keep these tables empty until they change
+                logger.warning(f"Failed to re-read columns of changed tables, falling back to a full read: {exc}")
+                return None
+
+            rebuilt = {
+                name: self._build_table_record(workspace, schema, table_items[name], columns_map.get(name, []))
+                for name in changed
+            }
+            snapshot.apply(fingerprints, rebuilt, dropped)
+            if changed or dropped:
+                self._definition_snapshots.save(key)
+            self.last_metadata_sync = {
+                "changed": len(changed),
+                "dropped": len(dropped),
+                "unchanged": len(fingerprints) - len(changed),
+            }
+            logger.debug(f"Metadata sync for {workspace}.{schema}: {self.last_metadata_sync}")
+            return [snapshot.records[name] for name in fingerprints if name in snapshot.records]
+
+    @staticmethod
+    def _mentions_column(exc: DatusException, column: str) -> bool:
+        """Whether the server error behind ``exc`` names ``column``; the SQL echoed in ``exc`` is not considered."""
+        if exc.__cause__ is not None:
+            message = str(exc.__cause__)
+        else:
+            message = str((getattr(exc, "message_args", None) or {}).get("error_message", ""))
+        return column.lower() in message.lower()
+
+    @staticmethod
+    def _column_entries(columns: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        return [
+            {
+                "cid": idx,
+                "name": item.get("column_name"),
+                "type": item.get("data_type"),
+                "comment": item.get("comment"),
+                "nullable": True,
+                "pk": False,
+                "default_value": None,
+            }
+            for idx, item in enumerate(columns)
+        ]
+
+    def get_schema(
+        self, catalog_name: str = "", database_name: str = "", schema_name: str = "", table_name: str = ""
+    ) -> List[Dict[str, Any]]:
+        if not table_name:
+            return []
+        return self.get_table_schemas(
+            [table_name], catalog_name=catalog_name, database_name=database_name, schema_name=schema_name
+        ).get(table_name, [])
+
+    def get_table_schemas(
+        self, tables: List[str], catalog_name: str = "", database_name: str = "", schema_name: str = ""
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """Return the columns of several tables, keyed by table name, in the format of :meth:`get_schema`.
+
+        Cached tables are answered locally; all others are read with one information_schema query (per
+        ``METADATA_IN_LIST_CHUNK`` tables). Tables that do not exist are left out.
+        """
+        workspace = database_name or self.database_name
+        schema = self._normalized_schema(schema_name)
+        if not tables or not workspace or not schema:
+            return {}
+        columns_map = self._cached_columns_map(workspace, schema, tables, strict=True)
+        return {
+            table_name: self._column_entries(columns_map[table_name])
+            for table_name in dict.fromkeys(tables)
+            if table_name in columns_map
+        }
 
     def get_sample_rows(
         self,
@@ -825,37 +2308,111 @@ class ClickZettaConnector:
         database_name: str = "",
         schema_name: str = "",
         table_type: TABLE_TYPE = "table",
+        max_workers: Optional[int] = None,
+        timeout: Optional[float] = None,
     ) -> List[Dict[str, Any]]:
+        """Sample ``top_n`` rows per table, running up to ``max_workers`` tables concurrently.
+
+        Each worker borrows its own pooled session. Tables that fail or exceed ``timeout`` seconds are
+        skipped, so the result may be partial; it keeps the input table order.
+        """
         workspace = database_name or self.database_name
         schema = schema_name or self.schema_name
         if not workspace or not schema:
             return []
 
         tables_to_sample = tables or self.get_tables(database_name=workspace, schema_name=schema)
-        samples: List[Dict[str, Any]] = []
-        for table_name in tables_to_sample:
+        if not tables_to_sample:
+            return []
+        timeout = self.SAMPLE_TIMEOUT_SECONDS if timeout is None else timeout
+        workers = max(1, min(max_workers or self._pool.max_size, len(tables_to_sample)))
+
+        # Shared with the workers: when each sample started, the session it holds, and which ones timed out
+        state_lock = threading.Lock()
+        started_at: Dict[int, float] = {}
+        borrowed: Dict[int, PooledSession] = {}
+        timed_out: set = set()
+
+        def sample(index: int, table_name: str) -> Optional[Dict[str, Any]]:
+            with state_lock:
+                if index in timed_out:
+                    return None
+                started_at[index] = time.monotonic()
+
+            def track(pooled: Optional[PooledSession]) -> None:
+                with state_lock:
+                    if pooled is None:
+                        borrowed.pop(index, None)
+                    elif index in timed_out:
+                        raise TimeoutError(f"Sampling {table_name} timed out before it got a session")
+                    else:
+                        borrowed[index] = pooled
+
             # Build table name parts for sample query
             escaped_workspace = _safe_escape_identifier(workspace)
             escaped_schema = _safe_escape_identifier(schema)
             escaped_table = _safe_escape_identifier(table_name)
             table_full_name = f"`{escaped_workspace}`.`{escaped_schema}`.`{escaped_table}`"
-            sql = f"SELECT * FROM {table_full_name} LIMIT {top_n}"
+            self._execution_local.session_tracker = track
             try:
-                df = self._run_query(sql)
-            except DatusException:
-                continue
+                df = self._run_query(f"SELECT * FROM {table_full_name} LIMIT {top_n}", hint_profile="sampling")
+            finally:
+                self._execution_local.session_tracker = None
             if df.empty:
-                continue
-            samples.append(
-                {
-                    "catalog_name": "",
-                    "database_name": workspace,
-                    "schema_name": schema,
-                    "table_name": table_name,
-                    "sample_rows": df.to_csv(index=False),
-                }
-            )
-        return samples
+                return None
+            return {
+                "catalog_name": "",
+                "database_name": workspace,
+                "schema_name": schema,
+                "table_name": table_name,
+                "sample_rows": df.to_csv(index=False),
+            }
+
+        results: Dict[int, Dict[str, Any]] = {}
+        executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="clickzetta-sample")
+        try:
+            pending: Dict[Future, int] = {
+                executor.submit(sample, index, table_name): index for index, table_name in enumerate(tables_to_sample)
+            }
+            while pending:
+                done, _ = wait(pending, timeout=min(timeout, 1.0), return_when=FIRST_COMPLETED)
+                for future in done:
+                    index = pending.pop(future)
+                    try:
+                        sample_result = future.result()
+                    except Exception as exc:
+                        logger.warning(f"Skipping sample rows for {tables_to_sample[index]}: {exc}")
+                        continue
+                    if sample_result:
+                        results[index] = sample_result
+                now = time.monotonic()
+                for future, index in list(pending.items()):
+                    with state_lock:
+                        if index not in started_at or now - started_at[index] <= timeout:
+                            continue
+                        timed_out.add(index)
+                        # Under the lock, so the worker cannot hand the session back while it is being dropped
+                        pooled = borrowed.pop(index, None)
+                        if pooled is not None:
+                            self._cancel_session_jobs(pooled.session)
+                            self._pool.abandon(pooled)
+                    logger.warning(f"Sampling {tables_to_sample[index]} timed out after {timeout}s, skipping")
+                    pending.pop(future)
+        finally:
+            # Timed-out samples had their jobs cancelled and their sessions released, so nothing waits on them
+            executor.shutdown(wait=False, cancel_futures=True)
+        return [results[index] for index in sorted(results)]
+
+    @staticmethod
+    def _cancel_session_jobs(session: Any) -> None:
+        """Best-effort cancel of the jobs a session still has running on the server."""
+        cancel_all = getattr(session, "cancel_all", None)
+        if not callable(cancel_all):
+            return
+        try:
+            cancel_all()
+        except Exception as exc:
+            logger.debug(f"Failed to cancel running ClickZetta jobs: {exc}")
 
     def full_name(
         self, catalog_name: str = "", database_name: str = "", schema_name: str = "", table_name: str = ""
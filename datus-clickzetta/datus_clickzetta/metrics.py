@@ -0,0 +1,48 @@
+# Copyright 2025-present DatusAI, Inc.
+# Licensed under the Apache License, Version 2.0.
+# See http://www.apache.org/licenses/LICENSE-2.0 for details.
+
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Dict, Optional
+
+
+@dataclass
+class QueryExecutionStats:
+    """Wall-clock phases and result volume of one ClickZetta statement."""
+
+    sql: str
+    hint_profile: Optional[str] = None
+    # Server job ID, when the SDK exposes it on the result or the session
+    job_id: Optional[str] = None
+    # session.sql(): building and submitting the statement
+    submit_seconds: float = 0.0
+    # Blocking fetch: vcluster queueing, server execution and result transfer (the SDK waits for the job)
+    fetch_seconds: float = 0.0
+    # Client-side conversion between pandas, Arrow, CSV and Python rows
+    conversion_seconds: float = 0.0
+    total_seconds: float = 0.0
+    rows: int = 0
+    # In-memory size of the fetched result on the client
+    result_bytes: int = 0
+    # True when max_rows cut the result short
+    truncated: bool = False
+    # True when the result came from the connector's result cache without reaching the server
+    cache_hit: bool = False
+    # True when the result outgrew spill_threshold_bytes and is memory-mapped from a spill file
+    spilled: bool = False
+    error: Optional[str] = None
+
+    @property
+    def success(self) -> bool:
+        return self.error is None
+
+    def as_dict(self) -> Dict[str, Any]:
+        payload = asdict(self)
+        payload["success"] = self.success
+        return payload
+
+
+# Receives the stats of every tracked statement once it has finished, successfully or not
+MetricsSink = Callable[[QueryExecutionStats], None]
@@ -0,0 +1,398 @@
+# Copyright 2025-present DatusAI, Inc.
+# Licensed under the Apache License, Version 2.0.
+# See http://www.apache.org/licenses/LICENSE-2.0 for details.
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional, Set
+
+from datus.utils.exceptions import DatusException, ErrorCode
+from datus.utils.loggings import get_logger
+
+logger = get_logger(__name__)
+
+
+@dataclass(eq=False)
+class PooledSession:
+    """A session owned by the pool together with its bookkeeping state."""
+
+    session: Any
+    created_at: float
+    last_used: float
+    last_checked: float
+    # Free-form per-session state owned by the pool user (e.g. the schema currently in use)
+    context: Dict[str, Any] = field(default_factory=dict)
+    generation: int = 0
+    discard: bool = False
+    # Fresh session built by the background refresher while this one was borrowed
+    replacement: Optional["PooledSession"] = None
+    # Set by ``abandon``: the slot is already free and the session closed, checkin only tidies up
+    abandoned: bool = False
+
+
+class ClickZettaSessionPool:
+    """
+    Thread-safe, bounded pool of ClickZetta sessions.
+
+    Sessions are created lazily by ``factory`` up to ``max_size``. Idle sessions above ``min_size`` are
+    evicted after ``idle_timeout`` seconds, sessions older than ``max_lifetime`` are retired, and a session
+    that has been idle longer than ``health_check_interval`` is validated with ``health_check`` before it
+    is handed out again.
+
+    When ``max_lifetime`` is set, a background thread rebuilds each session ``refresh_margin`` seconds
+    before it expires and swaps the replacement in atomically, so callers never pay for re-authentication.
+    Idle sessions are swapped immediately; borrowed ones are swapped and closed when they are returned.
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[Dict[str, Any]], Any],
+        min_size: int = 1,
+        max_size: int = 4,
+        checkout_timeout: float = 30.0,
+        idle_timeout: float = 600.0,
+        max_lifetime: Optional[float] = None,
+        health_check: Optional[Callable[[Any], None]] = None,
+        health_check_interval: float = 60.0,
+        refresh_margin: float = 300.0,
+    ):
+        if max_size < 1:
+            raise ValueError("Session pool max_size must be at least 1")
+        if min_size < 0 or min_size > max_size:
+            raise ValueError("Session pool min_size must be between 0 and max_size")
+        self._factory = factory
+        self.min_size = min_size
+        self.max_size = max_size
+        self.checkout_timeout = checkout_timeout
+        self.idle_timeout = idle_timeout
+        self.max_lifetime = max_lifetime
+        self._health_check = health_check
+        self.health_check_interval = health_check_interval
+        self.refresh_margin = refresh_margin
+
+        self._lock = threading.Condition(threading.Lock())
+        self._idle: Deque[PooledSession] = deque()
+        self._entries: Set[PooledSession] = set()
+        self._size = 0
+        self._generation = 0
+        self._stats: Dict[str, Any] = {
+            "created": 0,
+            "closed": 0,
+            "evicted": 0,
+            "failed_checks": 0,
+            "waits": 0,
+            "refreshes": 0,
+            "refresh_failures": 0,
+            "refresh_seconds_total": 0.0,
+            "last_refresh_seconds": 0.0,
+            "abandoned": 0,
+        }
+        self._refresh_durations: Deque[float] = deque(maxlen=100)
+        self._refresher: Optional[threading.Thread] = None
+        self._refresher_lock = threading.Lock()
+        self._refresher_stop = threading.Event()
+
+    # ------------------------------------------------------------------ #
+    # Checkout / checkin
+    # ------------------------------------------------------------------ #
+    @contextmanager
+    def session(self) -> Iterator[PooledSession]:
+        """Borrow a session for the duration of the ``with`` block."""
+        pooled = self.checkout()
+        try:
+            yield pooled
+        except BaseException:
+            # Force a health check before the session is trusted again
+            pooled.last_checked = 0.0
+            raise
+        finally:
+            self.checkin(pooled)
+
+    def checkout(self, timeout: Optional[float] = None) -> PooledSession:
+        timeout = self.checkout_timeout if timeout is None else timeout
+        deadline = time.monotonic() + timeout
+        while True:
+            to_close: List[PooledSession] = []
+            pooled: Optional[PooledSession] = None
+            create = False
+            timed_out = False
+            with self._lock:
+                to_close.extend(self._collect_expired_locked())
+                while self._idle:
+                    candidate = self._idle.pop()
+                    if self._is_retired(candidate):
+                        to_close.append(candidate)
+                        self._size -= 1
+                        continue
+                    pooled = candidate
+                    break
+                if pooled is None:
+                    if self._size < self.max_size:
+                        self._size += 1
+                        create = True
+                    else:
+                        remaining = deadline - time.monotonic()
+                        if remaining <= 0:
+                            timed_out = True
+                        else:
+                            self._stats["waits"] += 1
+                            self._lock.wait(remaining)
+            self._close_all(to_close)
+
+            if timed_out:
+                raise DatusException(
+                    ErrorCode.DB_CONNECTION_FAILED,
+                    message_args={
+                        "error_message": (
+                            f"Timed out after {timeout}s waiting for a ClickZetta session "
+                            f"(pool size {self.max_size})"
+                        )
+                    },
+                )
+            if create:
+                return self._create()
+            if pooled is None:
+                continue
+            if self._validate(pooled):
+                return pooled
+            with self._lock:
+                self._size -= 1
+                self._lock.notify()
+            self._close_all([pooled])
+
+    def checkin(self, pooled: PooledSession) -> None:
+        now = time.monotonic()
+        to_close: List[PooledSession] = []
+        with self._lock:
+            replacement, pooled.replacement = pooled.replacement, None
+            if pooled.abandoned:
+                # Already closed and uncounted; a successor built meanwhile has no slot to take over
+                if replacement is not None:
+                    to_close.append(replacement)
+            elif replacement is not None:
+                # The refresher already built a successor: retire the drained session and swap it in
+                to_close.append(pooled)
+                if self._is_retired(replacement):
+                    to_close.append(replacement)
+                    self._size -= 1
+                else:
+                    self._idle.append(replacement)
+            elif pooled.discard or self._is_retired(pooled):
+                to_close.append(pooled)
+                self._size -= 1
+            else:
+                pooled.last_used = now
+                self._idle.append(pooled)
+            self._lock.notify()
+        self._close_all(to_close)
+
+    def abandon(self, pooled: PooledSession) -> None:
+        """Give up a borrowed session that is stuck: free its slot now and close it.
+
+        Meant for a borrower that will not return in time (e.g. a statement that overran its deadline).
+        The borrower's eventual ``checkin`` is still expected and only finishes the cleanup.
+        """
+        with self._lock:
+            if pooled.abandoned:
+                return
+            pooled.abandoned = True
+            pooled.discard = True
+            self._size -= 1
+            self._stats["abandoned"] += 1
+            self._lock.notify()
+        self._close_all([pooled])
+
+    # ------------------------------------------------------------------ #
+    # Lifecycle
+    # ------------------------------------------------------------------ #
+    def warm(self) -> None:
+        """Pre-create sessions until ``min_size`` sessions exist."""
+        while True:
+            with self._lock:
+                if self._size >= self.min_size:
+                    return
+                self._size += 1
+            pooled = self._create()
+            self.checkin(pooled)
+
+    def close(self) -> None:
+        """Close idle sessions and retire borrowed ones on return. The pool stays usable afterwards."""
+        self._stop_refresher()
+        with self._lock:
+            self._generation += 1
+            idle = list(self._idle)
+            self._idle.clear()
+            self._size -= len(idle)
+            self._lock.notify_all()
+        self._close_all(idle)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self._stats)
+            stats.update(
+                size=self._size,
+                idle=len(self._idle),
+                in_use=self._size - len(self._idle),
+                recent_refresh_seconds=list(self._refresh_durations),
+            )
+        return stats
+
+    # ------------------------------------------------------------------ #
+    # Background refresh
+    # ------------------------------------------------------------------ #
+    def refresh_expiring(self) -> int:
+        """Replace every session that is within ``refresh_margin`` of ``max_lifetime``.
+
+        Returns the number of sessions that were replaced. Called periodically by the refresher thread.
+        """
+        if self.max_lifetime is None:
+            return 0
+        threshold = max(self.max_lifetime - self.refresh_margin, 0.0)
+        now = time.monotonic()
+        with self._lock:
+            expiring = [
+                pooled
+                for pooled in self._entries
+                if pooled.replacement is None
+                and pooled.generation == self._generation
+                and now - pooled.created_at >= threshold
+            ]
+        refreshed = 0
+        for old in expiring:
+            started = time.monotonic()
+            try:
+                new = self._build()
+            except Exception as exc:
+                logger.warning(f"Background refresh of ClickZetta session failed: {exc}")
+                with self._lock:
+                    self._stats["refresh_failures"] += 1
+                continue
+            elapsed = time.monotonic() - started
+            to_close: List[PooledSession] = []
+            with self._lock:
+                self._stats["refreshes"] += 1
+                self._stats["refresh_seconds_total"] += elapsed
+                self._stats["last_refresh_seconds"] = elapsed
+                self._refresh_durations.append(elapsed)
+                if old not in self._entries or old.abandoned or new.generation != self._generation:
+                    # The old session went away (evicted, expired or pool closed) while we were building
+                    to_close.append(new)
+                elif old in self._idle:
+                    self._idle.remove(old)
+                    self._idle.append(new)
+                    to_close.append(old)
+                else:
+                    old.replacement = new
+                self._lock.notify()
+            self._close_all(to_close)
+            refreshed += 1
+        return refreshed
+
+    def _ensure_refresher(self) -> None:
+        if self.max_lifetime is None:
+            return
+        with self._refresher_lock:
+            if self._refresher is not None and self._refresher.is_alive():
+                return
+            self._refresher_stop.clear()
+            self._refresher = threading.Thread(
+                target=self._refresh_loop, name="clickzetta-session-refresher", daemon=True
+            )
+            self._refresher.start()
+
+    def _stop_refresher(self) -> None:
+        with self._refresher_lock:
+            refresher, self._refresher = self._refresher, None
+            if refresher is None:
+                return
+            self._refresher_stop.set()
+        if refresher is not threading.current_thread():
+            refresher.join(timeout=5)
+
+    def _refresh_loop(self) -> None:
+        interval = max(min(self.refresh_margin / 4, 60.0), 0.05)
+        while not self._refresher_stop.wait(interval):
+            try:
+                self.refresh_expiring()
+            except Exception as exc:  # pragma: no cover - keep the refresher alive
+                logger.warning(f"ClickZetta session refresher error: {exc}")
+
+    # ------------------------------------------------------------------ #
+    # Internals
+    # ------------------------------------------------------------------ #
+    def _create(self) -> PooledSession:
+        """Build a session for a slot already reserved in ``_size``."""
+        try:
+            pooled = self._build()
+        except BaseException:
+            with self._lock:
+                self._size -= 1
+                self._lock.notify()
+            raise
+        self._ensure_refresher()
+        return pooled
+
+    def _build(self) -> PooledSession:
+        context: Dict[str, Any] = {}
+        with self._lock:
+            generation = self._generation
+        session = self._factory(context)
+        now = time.monotonic()
+        pooled = PooledSession(
+            session=session,
+            created_at=now,
+            last_used=now,
+            last_checked=now,
+            context=context,
+            generation=generation,
+        )
+        with self._lock:
+            self._stats["created"] += 1
+            self._entries.add(pooled)
+        return pooled
+
+    def _validate(self, pooled: PooledSession) -> bool:
+        if self._health_check is None:
+            return True
+        now = time.monotonic()
+        if now - pooled.last_checked < self.health_check_interval:
+            return True
+        try:
+            self._health_check(pooled.session)
+        except Exception as exc:
+            logger.debug(f"Discarding unhealthy ClickZetta session: {exc}")
+            with self._lock:
+                self._stats["failed_checks"] += 1
+            return False
+        pooled.last_checked = now
+        return True
+
+    def _is_retired(self, pooled: PooledSession) -> bool:
+        if pooled.generation != self._generation:
+            return True
+        return self.max_lifetime is not None and time.monotonic() - pooled.created_at > self.max_lifetime
+
+    def _collect_expired_locked(self) -> List[PooledSession]:
+        """Remove idle sessions above ``min_size`` that exceeded ``idle_timeout``. Caller holds the lock."""
+        expired: List[PooledSession] = []
+        now = time.monotonic()
+        while self._idle and self._size > self.min_size and now - self._idle[0].last_used > self.idle_timeout:
+            expired.append(self._idle.popleft())
+            self._size -= 1
+            self._stats["evicted"] += 1
+        return expired
+
+    def _close_all(self, entries: List[PooledSession]) -> None:
+        for pooled in entries:
+            try:
+                pooled.session.close()
+            except Exception as exc:  # pragma: no cover - defensive cleanup
+                logger.debug(f"Failed to close ClickZetta session cleanly: {exc}")
+            with self._lock:
+                self._entries.discard(pooled)
+                self._stats["closed"] += 1
@@ -0,0 +1,120 @@
+# Copyright 2025-present DatusAI, Inc.
+# Licensed under the Apache License, Version 2.0.
+# See http://www.apache.org/licenses/LICENSE-2.0 for details.
+
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from datus.utils.loggings import get_logger
+
+from .cache import DiskLRUCache
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class DefinitionSnapshot:
+    """Table definitions of one (workspace, schema) as of the last sync, keyed by table name."""
+
+    # table_name -> fingerprint (last-modified time, table type, comment) seen at the last sync
+    fingerprints: Dict[str, List[Any]] = field(default_factory=dict)
+    # table_name -> record as returned by get_tables_with_ddl / get_views_with_ddl
+    records: Dict[str, Dict[str, str]] = field(default_factory=dict)
+    synced_at: float = 0.0
+
+    def diff(self, current: Dict[str, List[Any]], complete: bool) -> Tuple[List[str], List[str]]:
+        """Return ``(changed, dropped)`` table names compared with ``current`` fingerprints.
+
+        ``complete`` tells whether ``current`` covers the whole schema; only then can missing tables be
+        treated as dropped.
+        """
+        changed = [name for name, fingerprint in current.items() if self.fingerprints.get(name) != fingerprint]
+        dropped = [name for name in self.fingerprints if name not in current] if complete else []
+        return changed, dropped
+
+    def apply(
+        self,
+        current: Dict[str, List[Any]],
+        records: Dict[str, Dict[str, str]],
+        dropped: List[str],
+    ) -> None:
+        for name in dropped:
+            self.fingerprints.pop(name, None)
+            self.records.pop(name, None)
+        for name, record in records.items():
+            self.fingerprints[name] = current[name]
+            self.records[name] = record
+        self.synced_at = time.time()
+
+
+class DefinitionSnapshotStore:
+    """
+    Keeps :class:`DefinitionSnapshot` objects in memory and, when ``directory`` is set, as JSON files so a
+    new process can continue incrementally from the previous sync.
+    """
+
+    def __init__(self, directory: Optional[str] = None):
+        self.directory = Path(directory).expanduser() if directory else None
+        self._lock = threading.Lock()
+        self._snapshots: Dict[Tuple[str, ...], DefinitionSnapshot] = {}
+
+    def get(self, key: Tuple[str, ...]) -> DefinitionSnapshot:
+        with self._lock:
+            snapshot = self._snapshots.get(key)
+            if snapshot is None:
+                snapshot = self._load(key) or DefinitionSnapshot()
+                self._snapshots[key] = snapshot
+            return snapshot
+
+    def save(self, key: Tuple[str, ...]) -> None:
+        if self.directory is None:
+            return
+        with self._lock:
+            snapshot = self._snapshots.get(key)
+            if snapshot is None:
+                return
+            payload = {
+                "fingerprints": snapshot.fingerprints,
+                "records": snapshot.records,
+                "synced_at": snapshot.synced_at,
+            }
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                json.dump(payload, handle, default=str)
+            os.replace(tmp_name, self._path(key))
+        except OSError as exc:
+            logger.warning(f"Failed to persist ClickZetta metadata snapshot: {exc}")
+
+    def clear(self) -> None:
+        with self._lock:
+            self._snapshots.clear()
+
+    def _path(self, key: Tuple[str, ...]) -> Path:
+        return self.directory / f"{DiskLRUCache.make_key(*key)}.json"
+
+    def _load(self, key: Tuple[str, ...]) -> Optional[DefinitionSnapshot]:
+        if self.directory is None:
+            return None
+        path = self._path(key)
+        if not path.exists():
+            return None
+        try:
+            payload = json.loads(path.read_text(encoding="utf-8"))
+            return DefinitionSnapshot(
+                fingerprints=payload.get("fingerprints", {}),
+                records=payload.get("records", {}),
+                synced_at=payload.get("synced_at", 0.0),
+            )
+        except (OSError, ValueError) as exc:
+            logger.warning(f"Ignoring unreadable ClickZetta metadata snapshot {path}: {exc}")
+            return None
@@ -0,0 +1,147 @@
+# Copyright 2025-present DatusAI, Inc.
+# Licensed under the Apache License, Version 2.0.
+# See http://www.apache.org/licenses/LICENSE-2.0 for details.
+
+"""
+Benchmark harness: times connector calls against the fake session and keeps a history of the results.
+
+Every benchmarked callable runs ``warmup`` untimed rounds, ``rounds`` timed rounds and one extra round that
+measures memory: the peak Python allocation under ``tracemalloc`` and the Arrow memory pool growth while the
+result is alive (Arrow buffers are invisible to ``tracemalloc``). At the end of the session one JSON line with
+all results is appended to ``CLICKZETTA_BENCHMARK_HISTORY`` (default ``.benchmarks/clickzetta.jsonl``) and
+the run is compared with the previous entry, so regressions show up over time.
+"""
+
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+import pyarrow as pa
+import pytest
+
+DEFAULT_HISTORY = ".benchmarks/clickzetta.jsonl"
+
+_REPORT_KEY = pytest.StashKey[str]()
+
+
+class BenchmarkRecorder:
+    """Collects timing and peak-memory results for one pytest session."""
+
+    def __init__(self, rounds: int, warmup: int):
+        self.rounds = rounds
+        self.warmup = warmup
+        self.results: List[Dict[str, Any]] = []
+
+    def __call__(self, name: str, func: Callable[[], Any], rounds: Optional[int] = None) -> Any:
+        rounds = rounds or self.rounds
+        for _ in range(self.warmup):
+            func()
+        timings = []
+        for _ in range(rounds):
+            started = time.perf_counter()
+            func()
+            timings.append(time.perf_counter() - started)
+
+        arrow_before = pa.total_allocated_bytes()
+        tracemalloc.start()
+        try:
+            value = func()
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        arrow_bytes = max(0, pa.total_allocated_bytes() - arrow_before)
+
+        timings.sort()
+        self.results.append(
+            {
+                "name": name,
+                "rounds": rounds,
+                "min_seconds": timings[0],
+                "median_seconds": statistics.median(timings),
+                "max_seconds": timings[-1],
+                "peak_bytes": peak,
+                "arrow_bytes": arrow_bytes,
+            }
+        )
+        return value
+
+
+def _git_revision() -> Optional[str]:
+    try:
+        completed = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True, timeout=10
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return completed.stdout.strip() or None
+
+
+def _previous_run(history: Path) -> Dict[str, Dict[str, Any]]:
+    if not history.exists():
+        return {}
+    lines = [line for line in history.read_text(encoding="utf-8").splitlines() if line.strip()]
+    if not lines:
+        return {}
+    try:
+        return {result["name"]: result for result in json.loads(lines[-1])["results"]}
+    except (KeyError, TypeError, ValueError):
+        return {}
+
+
+def _report(results: List[Dict[str, Any]], previous: Dict[str, Dict[str, Any]]) -> str:
+    lines = [f"{'benchmark':<40} {'median':>10} {'min':>10} {'peak MiB':>10} {'arrow MiB':>10} {'vs last':>9}"]
+    for result in results:
+        before = previous.get(result["name"])
+        change = ""
+        if before and before.get("median_seconds"):
+            change = f"{(result['median_seconds'] / before['median_seconds'] - 1) * 100:+.1f}%"
+        lines.append(
+            f"{result['name']:<40} {result['median_seconds'] * 1000:>8.2f}ms {result['min_seconds'] * 1000:>8.2f}ms "
+            f"{result['peak_bytes'] / (1024 * 1024):>10.2f} {result['arrow_bytes'] / (1024 * 1024):>10.2f} {change:>9}"
+        )
+    return "\n".join(lines)
+
+
+@pytest.fixture(scope="session")
+def benchmark_recorder(request):
+    """Provide the session-wide recorder and write the history entry once all benchmarks ran."""
+    recorder = BenchmarkRecorder(
+        rounds=int(os.getenv("CLICKZETTA_BENCHMARK_ROUNDS", "5")),
+        warmup=int(os.getenv("CLICKZETTA_BENCHMARK_WARMUP", "1")),
+    )
+    yield recorder
+    if not recorder.results:
+        return
+
+    history = Path(os.getenv("CLICKZETTA_BENCHMARK_HISTORY", DEFAULT_HISTORY))
+    previous = _previous_run(history)
+    entry = {
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "revision": _git_revision(),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "results": recorder.results,
+    }
+    history.parent.mkdir(parents=True, exist_ok=True)
+    with history.open("a", encoding="utf-8") as handle:
+        handle.write(json.dumps(entry) + "\n")
+
+    request.config.stash[
+        _REPORT_KEY
+    ] = f"ClickZetta benchmarks (history: {history})\n{_report(recorder.results, previous)}"
+
+
+def pytest_terminal_summary(terminalreporter, exitstatus, config):
+    report = config.stash.get(_REPORT_KEY, None)
+    if report:
+        terminalreporter.write_sep("=", "benchmarks")
+        for line in report.splitlines():
+            terminalreporter.write_line(line)
@@ -0,0 +1,172 @@
+# Copyright 2025-present DatusAI, Inc.
+# Licensed under the Apache License, Version 2.0.
+# See http://www.apache.org/licenses/LICENSE-2.0 for details.
+
+"""
+Connector throughput benchmarks against the in-process fake session.
+
+Skipped unless ``CLICKZETTA_BENCHMARK=1``; see ``conftest.py`` in this directory for how results are recorded.
+Latencies injected into the fake are small and fixed, so differences between runs come from client-side work
+(conversion, metadata assembly, concurrency), which is what these benchmarks are meant to track.
+"""
+
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from tests.fake_session import FakeLakehouse
+
+WIDE_ROWS = 50_000
+SCHEMA_TABLES = 200
+COLUMNS_PER_TABLE = 20
+SAMPLED_TABLES = 40
+VOLUME_FILES = 100
+USER_VOLUME = "volume:user://~"
+WIDE_QUERY = "SELECT * FROM `bench`.`PUBLIC`.`events`"
+
+
+def _build_lakehouse() -> FakeLakehouse:
+    # 2 ms per statement and 1 ms per fetch stand in for network round trips
+    lakehouse = FakeLakehouse(workspace="bench", submit_latency=0.002, fetch_latency=0.001, seed=42)
+    rng = np.random.default_rng(42)
+    lakehouse.add_table(
+        "PUBLIC",
+        "events",
+        pd.DataFrame(
+            {
+                "id": np.arange(WIDE_ROWS, dtype="int64"),
+                "user_id": rng.integers(0, 10_000, WIDE_ROWS),
+                "amount": rng.random(WIDE_ROWS) * 100,
+                "country": rng.choice(["CN", "US", "DE", "JP"], WIDE_ROWS),
+                "created_at": pd.date_range("2025-01-01", periods=WIDE_ROWS, freq="s"),
+            }
+        ),
+    )
+    for index in range(SCHEMA_TABLES):
+        columns = {f"col_{column:02d}": [column] for column in range(COLUMNS_PER_TABLE)}
+        lakehouse.add_table(
+            "ANALYTICS",
+            f"table_{index:03d}",
+            pd.DataFrame(columns),
+            comment=f"Table {index}",
+            column_comments={"col_00": "Primary key"},
+        )
+    for index in range(VOLUME_FILES):
+        lakehouse.add_volume_file(USER_VOLUME, f"models/model_{index:03d}.yaml", f"name: model_{index}\n" * 50)
+    return lakehouse
+
+
+@pytest.fixture(scope="module")
+def bench_lakehouse():
+    return _build_lakehouse()
+
+
+@pytest.fixture(scope="module")
+def bench_connector(mock_datus_modules, bench_lakehouse):
+    from datus_clickzetta.connector import ClickZettaConnector
+
+    with patch("datus_clickzetta.connector.Session", bench_lakehouse.session_class):
+        connector = ClickZettaConnector(
+            service="bench.clickzetta.com",
+            username="bench",
+            password="bench",
+            instance="bench",
+            workspace="bench",
+            schema="PUBLIC",
+            pool_max_size=8,
+            volume_cache_max_bytes=0,
+        )
+        yield connector
+        connector.close()
+
+
+class TestQueryFormats:
+    """Fetching the same 50k-row result in every supported format."""
+
+    @pytest.mark.parametrize("result_format", ["csv", "pandas", "arrow", "list"])
+    def test_execute_query(self, bench_connector, benchmark_recorder, result_format):
+        result = benchmark_recorder(
+            f"query[{result_format}]", lambda: bench_connector.execute_query(WIDE_QUERY, result_format=result_format)
+        )
+        assert result.success
+
+    def test_arrow_iterator(self, bench_connector, benchmark_recorder):
+        def consume() -> int:
+            return sum(batch.num_rows for batch in bench_connector.execute_arrow_iterator(WIDE_QUERY, max_rows=8192))
+
+        assert benchmark_recorder("query[arrow_iterator]", consume) == WIDE_ROWS
+
+    def test_max_rows(self, bench_connector, benchmark_recorder):
+        result = benchmark_recorder(
+            "query[pandas, max_rows=1000]",
+            lambda: bench_connector.execute_query(WIDE_QUERY, result_format="pandas", max_rows=1000),
+        )
+        assert result.row_count == 1000
+
+
+class TestMetadata:
+    """Schema discovery over 200 tables x 20 columns, always from a cold metadata cache."""
+
+    def _cold(self, connector, call):
+        def run():
+            connector.invalidate_metadata_cache()
+            return call()
+
+        return run
+
+    def test_get_tables(self, bench_connector, benchmark_recorder):
+        tables = benchmark_recorder(
+            "metadata[get_tables]",
+            self._cold(bench_connector, lambda: bench_connector.get_tables(schema_name="ANALYTICS")),
+        )
+        assert len(tables) == SCHEMA_TABLES
+
+    def test_get_tables_with_ddl(self, bench_connector, benchmark_recorder):
+        definitions = benchmark_recorder(
+            "metadata[get_tables_with_ddl]",
+            self._cold(bench_connector, lambda: bench_connector.get_tables_with_ddl(schema_name="ANALYTICS")),
+        )
+        assert len(definitions) == SCHEMA_TABLES
+
+    def test_get_table_schemas(self, bench_connector, benchmark_recorder):
+        names = [f"table_{index:03d}" for index in range(0, SCHEMA_TABLES, 4)]
+        schemas = benchmark_recorder(
+            "metadata[get_table_schemas x50]",
+            self._cold(bench_connector, lambda: bench_connector.get_table_schemas(names, schema_name="ANALYTICS")),
+        )
+        assert len(schemas) == len(names)
+
+
+class TestSampling:
+    """Sampling many tables, where per-statement latency dominates and concurrency pays off."""
+
+    @pytest.mark.parametrize("max_workers", [1, 8])
+    def test_get_sample_rows(self, bench_connector, benchmark_recorder, max_workers):
+        tables = [f"table_{index:03d}" for index in range(SAMPLED_TABLES)]
+        samples = benchmark_recorder(
+            f"sampling[{SAMPLED_TABLES} tables, workers={max_workers}]",
+            lambda: bench_connector.get_sample_rows(tables=tables, schema_name="ANALYTICS", max_workers=max_workers),
+        )
+        assert len(samples) == SAMPLED_TABLES
+
+
+class TestVolumeReads:
+    """Listing and downloading semantic model files from a user volume."""
+
+    def test_list_volume_files(self, bench_connector, benchmark_recorder):
+        files = benchmark_recorder("volume[list]", lambda: bench_connector.list_volume_files(USER_VOLUME, "models"))
+        assert len(files) == VOLUME_FILES
+
+    def test_read_volume_file(self, bench_connector, benchmark_recorder):
+        content = benchmark_recorder(
+            "volume[read one]", lambda: bench_connector.read_volume_file(USER_VOLUME, "models/model_000.yaml")
+        )
+        assert content.startswith("name: model_0")
+
+    def test_read_volume_files(self, bench_connector, benchmark_recorder):
+        contents = benchmark_recorder(
+            "volume[read directory]", lambda: bench_connector.read_volume_files(USER_VOLUME, "models")
+        )
+        assert len(contents) == VOLUME_FILES
@@ -0,0 +1,93 @@
+# Copyright 2025-present DatusAI, Inc.
+# Licensed under the Apache License, Version 2.0.
+# See http://www.apache.org/licenses/LICENSE-2.0 for details.
+
+"""
+Peak-memory benchmarks for materialising one large result.
+
+Skipped unless ``CLICKZETTA_BENCHMARK=1``. ``CLICKZETTA_BENCHMARK_LARGE_ROWS`` sets the result size; use
+``10000000`` to reproduce the wide fact-table measurement. Compare the ``peak MiB`` and ``arrow MiB`` columns of the
+native paths with their ``via pandas`` counterparts, which replay the former pandas round-trip.
+"""
+
+import os
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from tests.fake_session import FakeLakehouse
+
+LARGE_ROWS = int(os.getenv("CLICKZETTA_BENCHMARK_LARGE_ROWS", "1000000"))
+LARGE_QUERY = "SELECT * FROM `bench`.`PUBLIC`.`facts`"
+
+
+@pytest.fixture(scope="module")
+def large_connector(mock_datus_modules):
+    from datus_clickzetta.connector import ClickZettaConnector
+
+    lakehouse = FakeLakehouse(workspace="bench", seed=7)
+    rng = np.random.default_rng(7)
+    lakehouse.add_table(
+        "PUBLIC",
+        "facts",
+        pd.DataFrame(
+            {
+                "id": np.arange(LARGE_ROWS, dtype="int64"),
+                "store_id": rng.integers(0, 500, LARGE_ROWS),
+                "amount": rng.random(LARGE_ROWS) * 100,
+                "quantity": rng.integers(1, 20, LARGE_ROWS).astype("int32"),
+            }
+        ),
+    )
+    with patch("datus_clickzetta.connector.Session", lakehouse.session_class):
+        connector = ClickZettaConnector(
+            service="bench.clickzetta.com",
+            username="bench",
+            password="bench",
+            instance="bench",
+            workspace="bench",
+            schema="PUBLIC",
+        )
+        yield connector
+        connector.close()
+
+
+class TestResultMemory:
+    """Peak memory of materialising a large result natively in Arrow versus through a pandas round-trip."""
+
+    def test_arrow(self, large_connector, benchmark_recorder):
+        result = benchmark_recorder("large result[arrow]", lambda: large_connector.execute_arrow(LARGE_QUERY), rounds=2)
+        assert result.row_count == LARGE_ROWS
+
+    def test_arrow_via_pandas(self, large_connector, benchmark_recorder):
+        """The former path: materialise a DataFrame, then convert it back to Arrow."""
+        import pyarrow as pa
+
+        def round_trip():
+            return pa.Table.from_pandas(large_connector.execute_pandas(LARGE_QUERY).sql_return, preserve_index=False)
+
+        assert benchmark_recorder("large result[arrow via pandas]", round_trip, rounds=2).num_rows == LARGE_ROWS
+
+    def test_pandas(self, large_connector, benchmark_recorder):
+        """DataFrames are converted from the same Arrow fetch, so they add only the conversion to [arrow]."""
+        df = benchmark_recorder(
+            "large result[pandas]", lambda: large_connector.execute_query_to_df(LARGE_QUERY), rounds=2
+        )
+        assert len(df) == LARGE_ROWS
+
+    def test_csv(self, large_connector, benchmark_recorder):
+        result = benchmark_recorder(
+            "large result[csv]", lambda: large_connector.execute_query(LARGE_QUERY, result_format="csv"), rounds=2
+        )
+        assert result.row_count == LARGE_ROWS
+
+    def test_csv_via_pandas(self, large_connector, benchmark_recorder):
+        """The former CSV path: convert the Arrow result to a DataFrame and let pandas write it."""
+        csv_text = benchmark_recorder(
+            "large result[csv via pandas]",
+            lambda: large_connector.execute_arrow(LARGE_QUERY).data.to_pandas().to_csv(index=False),
+            rounds=2,
+        )
+        assert csv_text.count("\n") == LARGE_ROWS + 1
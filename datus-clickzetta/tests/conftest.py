@@ -158,6 +158,42 @@ def mock_clickzetta_session():
     return session_mock
 
 
+@pytest.fixture
+def fake_lakehouse():
+    """Provide an in-process lakehouse with a small PUBLIC schema and a user volume."""
+    import pandas as pd
+
+    from .fake_session import FakeLakehouse
+
+    lakehouse = FakeLakehouse(workspace="test_workspace")
+    lakehouse.add_table(
+        "PUBLIC",
+        "orders",
+        pd.DataFrame({"id": [1, 2, 3], "amount": [10.5, 20.0, 7.25], "status": ["new", "paid", "paid"]}),
+        comment="Customer orders",
+        column_comments={"id": "Order ID"},
+    )
+    lakehouse.add_table("PUBLIC", "customers", pd.DataFrame({"id": [1, 2], "name": ["Ada", "Linus"]}))
+    lakehouse.add_table("PUBLIC", "paid_orders", pd.DataFrame({"id": [2, 3]}), table_type="VIEW")
+    lakehouse.add_volume_file("volume:user://~", "semantic_models/orders.yaml", "name: orders\n")
+    lakehouse.add_volume_file("volume:user://~", "semantic_models/customers.yml", "name: customers\n")
+    return lakehouse
+
+
+@pytest.fixture
+def fake_connector(mock_datus_modules, fake_lakehouse, clickzetta_test_config):
+    """Provide a connector whose sessions are served by ``fake_lakehouse``."""
+    from unittest.mock import patch
+
+    from datus_clickzetta.connector import ClickZettaConnector
+
+    config = dict(clickzetta_test_config, workspace=fake_lakehouse.workspace, schema="PUBLIC")
+    with patch('datus_clickzetta.connector.Session', fake_lakehouse.session_class):
+        connector = ClickZettaConnector(**config)
+        yield connector
+        connector.close()
+
+
 def pytest_configure(config):
     """Configure pytest with custom markers."""
     config.addinivalue_line(
@@ -172,6 +208,9 @@ def pytest_configure(config):
     config.addinivalue_line(
         "markers", "slow: Mark test as slow running"
     )
+    config.addinivalue_line(
+        "markers", "benchmark: Mark test as a benchmark (run with CLICKZETTA_BENCHMARK=1)"
+    )
 
 
 def pytest_collection_modifyitems(config, items):
@@ -191,4 +230,10 @@ def pytest_collection_modifyitems(config, items):
 
         # Mark slow tests
         if "slow" in item.name or "full_" in item.name:
-            item.add_marker(pytest.mark.slow)
\ No newline at end of file
+            item.add_marker(pytest.mark.slow)
+
+        # Benchmarks are timing runs, not pass/fail checks: only run them on request
+        if "benchmarks" in str(item.fspath):
+            item.add_marker(pytest.mark.benchmark)
+            if not os.getenv("CLICKZETTA_BENCHMARK"):
+                item.add_marker(pytest.mark.skip(reason="set CLICKZETTA_BENCHMARK=1 to run benchmarks"))
\ No newline at end of file
@@ -0,0 +1,462 @@
+# Copyright 2025-present DatusAI, Inc.
+# Licensed under the Apache License, Version 2.0.
+# See http://www.apache.org/licenses/LICENSE-2.0 for details.
+
+"""
+Deterministic in-process stand-in for ``clickzetta.zettapark.session.Session``.
+
+A :class:`FakeLakehouse` holds tables and volume files and understands the statements the connector issues:
+``USE``/``SET``, ``SELECT 1``, ``SHOW CATALOGS``, ``information_schema`` queries, ``SELECT * FROM <table>``
+(optionally with ``LIMIT`` or wrapped by the connector's row limit) and ``LIST``. Any other statement is
+recorded and returns an empty result. Latency and failures can be injected per statement, which makes it
+usable both for behavioural tests and for the benchmark suite in ``tests/benchmarks``::
+
+    lakehouse = FakeLakehouse(workspace="test_workspace")
+    lakehouse.add_table("PUBLIC", "orders", pd.DataFrame({"id": [1, 2]}))
+    with patch("datus_clickzetta.connector.Session", lakehouse.session_class):
+        connector = ClickZettaConnector(**config)
+"""
+
+import random
+import re
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Pattern, Tuple, Union
+
+import pandas as pd
+import pyarrow as pa
+
+
+class FakeQueryError(RuntimeError):
+    """Raised by the fake session for injected failures and unsupported queries."""
+
+
+@dataclass
+class FakeTable:
+    schema: str
+    name: str
+    data: pd.DataFrame
+    table_type: str = "MANAGED_TABLE"
+    comment: str = ""
+    column_comments: Dict[str, str] = field(default_factory=dict)
+    data_types: Dict[str, str] = field(default_factory=dict)
+    last_modify_time: str = "2025-01-01 00:00:00"
+
+    def column_type(self, column: str) -> str:
+        if column in self.data_types:
+            return self.data_types[column]
+        dtype = self.data[column].dtype
+        if pd.api.types.is_bool_dtype(dtype):
+            return "boolean"
+        if pd.api.types.is_integer_dtype(dtype):
+            return "bigint"
+        if pd.api.types.is_float_dtype(dtype):
+            return "double"
+        if pd.api.types.is_datetime64_any_dtype(dtype):
+            return "timestamp"
+        return "string"
+
+
+@dataclass
+class _Failure:
+    pattern: Pattern[str]
+    error: Exception
+    remaining: Optional[int]
+
+
+_Latency = Union[float, Callable[[str], float]]
+
+_LIMIT_WRAPPER = re.compile(r"^SELECT \* FROM \(\s*(?P<inner>.*?)\s*\) AS \w+ LIMIT (?P<limit>\d+)$", re.S | re.I)
+_INFO_SCHEMA = re.compile(
+    r"^SELECT (?P<select>.+?) FROM (?P<workspace>\S+)\.information_schema\.(?P<view>tables|columns)\b(?P<rest>.*)$",
+    re.S | re.I,
+)
+_SCHEMA_FILTER = re.compile(r"upper\(table_schema\) = '(?P<schema>(?:[^']|'')*)'", re.I)
+_TABLE_FILTER = re.compile(r"table_name IN \((?P<names>[^)]*)\)", re.I)
+_ORDER_BY = re.compile(r"ORDER BY (?P<columns>[\w\s,]+)$", re.I)
+_SELECT_TABLE = re.compile(r"^SELECT \* FROM (?P<name>[`\w.\-]+)(?:\s+LIMIT (?P<limit>\d+))?$", re.I)
+_USE_SCHEMA = re.compile(r"^USE SCHEMA `?(?P<schema>[^`]+)`?$", re.I)
+_LIST_USER = re.compile(r"^LIST USER VOLUME(?: SUBDIRECTORY '(?P<directory>(?:[^']|'')*)')?$", re.I)
+
+
+class FakeResult:
+    """Result of :meth:`FakeSession.sql`; rows are only "transferred" (and delayed) when fetched."""
+
+    def __init__(self, lakehouse: "FakeLakehouse", sql: str, frame: pd.DataFrame, job_id: str):
+        self._lakehouse = lakehouse
+        self._sql = sql
+        self._frame = frame
+        self.job_id = job_id
+
+    def to_pandas(self) -> pd.DataFrame:
+        self._lakehouse._fetch_delay(self._sql, len(self._frame))
+        return self._frame.copy()
+
+
+class FakeArrowResult(FakeResult):
+    """Result that also offers the SDK's native Arrow methods."""
+
+    def to_arrow(self) -> pa.Table:
+        self._lakehouse._fetch_delay(self._sql, len(self._frame))
+        return pa.Table.from_pandas(self._frame, preserve_index=False)
+
+    def to_arrow_batches(self) -> Iterator[pa.RecordBatch]:
+        table = pa.Table.from_pandas(self._frame, preserve_index=False)
+        batch_rows = self._lakehouse.batch_rows
+        for offset in range(0, max(table.num_rows, 1), batch_rows):
+            chunk = table.slice(offset, batch_rows)
+            self._lakehouse._fetch_delay(self._sql, chunk.num_rows)
+            yield from chunk.to_batches()
+
+
+class FakeFileOperations:
+    """``session.file``: downloads volume files into a local directory."""
+
+    def __init__(self, lakehouse: "FakeLakehouse"):
+        self._lakehouse = lakehouse
+
+    def get(self, source_uri: str, local_dir: str) -> List[str]:
+        lakehouse = self._lakehouse
+        lakehouse._inject(f"GET {source_uri}")
+        volume, prefix = lakehouse._resolve_volume(source_uri)
+        files = lakehouse.volumes.get(volume, {})
+        if prefix in files:
+            selected = {prefix.rsplit("/", 1)[-1]: files[prefix][0]}
+        else:
+            directory = f"{prefix}/" if prefix else ""
+            selected = {
+                path[len(directory) :]: content for path, (content, _) in files.items() if path.startswith(directory)
+            }
+        if not selected:
+            raise FakeQueryError(f"No such volume file or directory: {source_uri}")
+        written = []
+        for name, content in selected.items():
+            lakehouse._fetch_delay(f"GET {source_uri}", len(content))
+            target = Path(local_dir) / name
+            target.parent.mkdir(parents=True, exist_ok=True)
+            target.write_bytes(content)
+            written.append(str(target))
+        return written
+
+
+class FakeSession:
+    """One connection to a :class:`FakeLakehouse`; tracks the current schema and session hints."""
+
+    def __init__(self, lakehouse: "FakeLakehouse", configs: Dict[str, Any]):
+        self._lakehouse = lakehouse
+        self.configs = dict(configs)
+        self.schema = configs.get("schema")
+        self.hints: Dict[str, str] = {}
+        self.file = FakeFileOperations(lakehouse)
+        self.closed = False
+        self.last_job_id: Optional[str] = None
+        self.cancelled_jobs: List[str] = []
+        # Set by cancel_all/close; interrupts the submit latency of a running statement
+        self._interrupted = threading.Event()
+
+    def sql(self, sql: str) -> FakeResult:
+        if self.closed:
+            raise FakeQueryError("Session is closed")
+        return self._lakehouse._execute(self, sql)
+
+    def cancel_all(self) -> None:
+        if self.last_job_id:
+            self.cancelled_jobs.append(self.last_job_id)
+        self._interrupted.set()
+
+    def close(self) -> None:
+        self.closed = True
+        self._interrupted.set()
+
+
+class FakeLakehouse:
+    """
+    Shared state behind every :class:`FakeSession` created from :attr:`session_class`.
+
+    ``submit_latency`` (seconds, or a callable taking the SQL) is spent in ``session.sql()`` and cut short by
+    ``cancel_all()``/``close()`` on that session,
+    ``fetch_latency`` once per fetch and ``row_latency`` per fetched row (or byte, for volume downloads).
+    ``failure_rate`` fails that fraction of statements, drawn from a generator seeded with ``seed`` so runs
+    are reproducible. ``arrow_native`` controls whether results offer ``to_arrow``/``to_arrow_batches``.
+    """
+
+    def __init__(
+        self,
+        workspace: str = "test_workspace",
+        submit_latency: _Latency = 0.0,
+        fetch_latency: _Latency = 0.0,
+        row_latency: float = 0.0,
+        failure_rate: float = 0.0,
+        seed: int = 0,
+        arrow_native: bool = True,
+        batch_rows: int = 10000,
+    ):
+        self.workspace = workspace
+        self.submit_latency = submit_latency
+        self.fetch_latency = fetch_latency
+        self.row_latency = row_latency
+        self.failure_rate = failure_rate
+        self.arrow_native = arrow_native
+        self.batch_rows = batch_rows
+        self.tables: Dict[Tuple[str, str], FakeTable] = {}
+        # volume base URI -> relative path -> (content, last modified)
+        self.volumes: Dict[str, Dict[str, Tuple[bytes, str]]] = {}
+        self.statements: List[str] = []
+        self.sessions: List[FakeSession] = []
+        self._failures: List[_Failure] = []
+        self._handlers: List[Tuple[Pattern[str], Any]] = []
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._job_counter = 0
+
+    # ------------------------------------------------------------------ #
+    # Setup
+    # ------------------------------------------------------------------ #
+    @property
+    def session_class(self) -> Any:
+        """Object exposing ``builder.configs(...).create()`` like the zettapark ``Session`` class."""
+        lakehouse = self
+
+        class _Builder:
+            def __init__(self):
+                self._configs: Dict[str, Any] = {}
+
+            def configs(self, configs: Dict[str, Any]) -> "_Builder":
+                self._configs.update(configs)
+                return self
+
+            def create(self) -> FakeSession:
+                lakehouse._inject("CONNECT")
+                session = FakeSession(lakehouse, self._configs)
+                with lakehouse._lock:
+                    lakehouse.sessions.append(session)
+                return session
+
+        class _SessionClass:
+            @property
+            def builder(self) -> _Builder:
+                return _Builder()
+
+        return _SessionClass()
+
+    def add_table(
+        self,
+        schema: str,
+        name: str,
+        data: pd.DataFrame,
+        table_type: str = "MANAGED_TABLE",
+        comment: str = "",
+        column_comments: Optional[Dict[str, str]] = None,
+        data_types: Optional[Dict[str, str]] = None,
+        last_modify_time: str = "2025-01-01 00:00:00",
+    ) -> FakeTable:
+        table = FakeTable(
+            schema=schema.upper(),
+            name=name,
+            data=data,
+            table_type=table_type,
+            comment=comment,
+            column_comments=dict(column_comments or {}),
+            data_types=dict(data_types or {}),
+            last_modify_time=last_modify_time,
+        )
+        self.tables[(table.schema, name.lower())] = table
+        return table
+
+    def add_volume_file(
+        self, volume: str, relative_path: str, content: Union[str, bytes], last_modified: str = "2025-01-01 00:00:00"
+    ) -> None:
+        if isinstance(content, str):
+            content = content.encode("utf-8")
+        self.volumes.setdefault(volume.rstrip("/"), {})[relative_path.strip("/")] = (content, last_modified)
+
+    def fail(self, pattern: str, error: Optional[Exception] = None, times: Optional[int] = None) -> None:
+        """Fail statements matching the regex ``pattern`` (``times`` times, or always)."""
+        error = error or FakeQueryError(f"Injected failure: {pattern}")
+        failure = _Failure(re.compile(pattern, re.I | re.S), error, times)
+        self._failures.append(failure)
+
+    def on(self, pattern: str, response: Union[pd.DataFrame, Callable[[str], pd.DataFrame]]) -> None:
+        """Answer statements matching the regex ``pattern`` with a fixed frame or ``response(sql)``."""
+        self._handlers.append((re.compile(pattern, re.I | re.S), response))
+
+    def statements_matching(self, pattern: str) -> List[str]:
+        regex = re.compile(pattern, re.I | re.S)
+        return [sql for sql in self.statements if regex.search(sql)]
+
+    # ------------------------------------------------------------------ #
+    # Execution
+    # ------------------------------------------------------------------ #
+    def _execute(self, session: FakeSession, sql: str) -> FakeResult:
+        sql = sql.strip().rstrip(";").strip()
+        with self._lock:
+            self.statements.append(sql)
+            self._job_counter += 1
+            job_id = f"fake-job-{self._job_counter}"
+        session.last_job_id = job_id
+        session._interrupted.clear()
+        self._inject(sql)
+        self._sleep(self.submit_latency, sql, session._interrupted)
+        frame = self._answer(session, sql)
+        result_class = FakeArrowResult if self.arrow_native else FakeResult
+        return result_class(self, sql, frame, job_id)
+
+    def _answer(self, session: FakeSession, sql: str) -> pd.DataFrame:
+        for pattern, response in self._handlers:
+            if pattern.search(sql):
+                return response(sql) if callable(response) else response.copy()
+
+        upper = sql.upper()
+        match = _USE_SCHEMA.match(sql)
+        if match:
+            session.schema = match.group("schema")
+            return pd.DataFrame()
+        if upper.startswith("USE "):
+            return pd.DataFrame()
+        if upper.startswith("SET "):
+            key, _, value = sql[4:].partition("=")
+            session.hints[key.strip()] = value.strip()
+            return pd.DataFrame()
+        if upper == "SELECT 1":
+            return pd.DataFrame({"1": [1]})
+        if upper == "SHOW CATALOGS":
+            return pd.DataFrame({"catalog_name": [self.workspace]})
+        match = _LIMIT_WRAPPER.match(sql)
+        if match:
+            return self._answer(session, match.group("inner")).head(int(match.group("limit")))
+        match = _INFO_SCHEMA.match(sql)
+        if match:
+            return self._information_schema(match)
+        match = _SELECT_TABLE.match(sql)
+        if match:
+            table = self._lookup_table(session, match.group("name"))
+            limit = match.group("limit")
+            return table.data.head(int(limit)) if limit is not None else table.data
+        if upper.startswith("LIST "):
+            return self._list(sql)
+        if upper.startswith(("SELECT ", "WITH ", "SHOW ", "DESC")):
+            raise FakeQueryError(f"Fake session cannot answer: {sql}")
+        # INSERT, UPDATE, DDL, ...: recorded in ``statements`` without effect
+        return pd.DataFrame()
+
+    def _lookup_table(self, session: FakeSession, identifier: str) -> FakeTable:
+        parts = [part.strip("`") for part in identifier.split(".")]
+        name = parts[-1].lower()
+        schema = (parts[-2] if len(parts) > 1 else session.schema or "PUBLIC").upper()
+        table = self.tables.get((schema, name))
+        if table is None:
+            raise FakeQueryError(f"Table or view not found: {identifier}")
+        return table
+
+    def _information_schema(self, match: "re.Match[str]") -> pd.DataFrame:
+        view, rest = match.group("view").lower(), match.group("rest")
+        schema_filter = _SCHEMA_FILTER.search(rest)
+        table_filter = _TABLE_FILTER.search(rest)
+        schema = schema_filter.group("schema").replace("''", "'") if schema_filter else None
+        names = None
+        if table_filter:
+            names = {name.strip().strip("'").replace("''", "'") for name in table_filter.group("names").split(",")}
+
+        rows: List[Dict[str, Any]] = []
+        for table in self.tables.values():
+            if schema is not None and table.schema != schema.upper():
+                continue
+            if names is not None and table.name not in names:
+                continue
+            if view == "tables":
+                rows.append(
+                    {
+                        "table_schema": table.schema,
+                        "table_name": table.name,
+                        "table_type": table.table_type,
+                        "comment": table.comment,
+                        "last_modify_time": table.last_modify_time,
+                    }
+                )
+            else:
+                for column in table.data.columns:
+                    rows.append(
+                        {
+                            "table_schema": table.schema,
+                            "table_name": table.name,
+                            "column_name": column,
+                            "data_type": table.column_type(column),
+                            "comment": table.column_comments.get(column, ""),
+                        }
+                    )
+        frame = pd.DataFrame(rows)
+
+        select = match.group("select").strip()
+        distinct = select.upper().startswith("DISTINCT ")
+        if distinct:
+            select = select[len("DISTINCT ") :]
+        projection: Dict[str, str] = {}
+        for item in select.split(","):
+            source, *alias = re.split(r"\s+AS\s+", item.strip(), maxsplit=1, flags=re.I)
+            projection[alias[0] if alias else source] = source
+        if frame.empty:
+            return pd.DataFrame(columns=list(projection))
+        frame = pd.DataFrame({alias: frame[source] for alias, source in projection.items()})
+        if distinct:
+            frame = frame.drop_duplicates()
+        order_by = _ORDER_BY.search(rest)
+        if order_by:
+            frame = frame.sort_values([column.strip() for column in order_by.group("columns").split(",")])
+        return frame.reset_index(drop=True)
+
+    def _resolve_volume(self, uri: str) -> Tuple[str, str]:
+        """Split a volume URI into ``(volume base, relative path)``."""
+        uri = uri.rstrip("/")
+        for volume in sorted(self.volumes, key=len, reverse=True):
+            if uri == volume or uri.startswith(f"{volume}/"):
+                return volume, uri[len(volume) :].strip("/")
+        raise FakeQueryError(f"Unknown volume: {uri}")
+
+    def _list(self, sql: str) -> pd.DataFrame:
+        match = _LIST_USER.match(sql)
+        if match:
+            volume = next((name for name in self.volumes if name.lower().startswith("volume:user://")), None)
+            if volume is None:
+                raise FakeQueryError("User volume is empty")
+            prefix = (match.group("directory") or "").replace("''", "'").strip("/")
+        else:
+            volume, prefix = self._resolve_volume(sql[len("LIST ") :].strip())
+        directory = f"{prefix}/" if prefix else ""
+        rows = [
+            {"relative_path": path, "size": len(content), "last_modified_time": last_modified}
+            for path, (content, last_modified) in sorted(self.volumes[volume].items())
+            if path.startswith(directory)
+        ]
+        return pd.DataFrame(rows, columns=["relative_path", "size", "last_modified_time"])
+
+    # ------------------------------------------------------------------ #
+    # Latency and failure injection
+    # ------------------------------------------------------------------ #
+    def _inject(self, sql: str) -> None:
+        with self._lock:
+            for failure in self._failures:
+                if failure.remaining == 0 or not failure.pattern.search(sql):
+                    continue
+                if failure.remaining is not None:
+                    failure.remaining -= 1
+                raise failure.error
+            failed = self.failure_rate > 0 and self._random.random() < self.failure_rate
+        if failed:
+            raise FakeQueryError(f"Injected random failure: {sql}")
+
+    @staticmethod
+    def _sleep(latency: _Latency, sql: str, interrupted: Optional[threading.Event] = None) -> None:
+        seconds = latency(sql) if callable(latency) else latency
+        if seconds <= 0:
+            return
+        if interrupted is None:
+            time.sleep(seconds)
+        elif interrupted.wait(seconds):
+            raise FakeQueryError(f"Job cancelled: {sql}")
+
+    def _fetch_delay(self, sql: str, units: int) -> None:
+        self._sleep(self.fetch_latency, sql)
+        if self.row_latency > 0 and units:
+            time.sleep(self.row_latency * units)
@@ -4,6 +4,9 @@
 
 """Integration tests for ClickZetta connector with mocked dependencies."""
 
+import threading
+import time
+
 import pytest
 from unittest.mock import MagicMock, patch
 import pandas as pd
@@ -48,6 +51,23 @@ class TestConnectorInitialization:
             # Should raise DatusException for missing dependency
             assert "ClickZetta connector requires" in str(exc_info.value)
 
+    def test_sdk_imported_on_first_connector(self, clickzetta_test_config):
+        """Test that zettapark is imported when the first connector is created, not at module import."""
+        import types
+
+        import datus_clickzetta.connector as connector_module
+
+        session_class = MagicMock()
+        fake_sdk = types.ModuleType("clickzetta.zettapark.session")
+        fake_sdk.Session = session_class
+
+        with patch.object(connector_module, 'Session', connector_module._UNLOADED), \
+                patch.dict('sys.modules', {'clickzetta.zettapark.session': fake_sdk}):
+            assert connector_module.Session is connector_module._UNLOADED
+            connector = connector_module.ClickZettaConnector(**clickzetta_test_config)
+            assert connector_module.Session is session_class
+            connector.close()
+
     def test_connector_missing_required_fields(self):
         """Test connector with missing required configuration fields."""
         from datus_clickzetta.connector import ClickZettaConnector
@@ -169,6 +189,33 @@ class TestConnectorOperations:
 
         connector.close()
 
+    @patch('datus_clickzetta.connector.Session')
+    def test_pooled_sessions_follow_schema_switch(self, mock_session_class, clickzetta_test_config):
+        """Test that every pooled session is moved to the schema selected by do_switch_context."""
+        from datus_clickzetta.connector import ClickZettaConnector
+
+        sessions = [MagicMock(name="session-a"), MagicMock(name="session-b")]
+        mock_session_class.builder.configs.return_value.create.side_effect = sessions
+
+        connector = ClickZettaConnector(**clickzetta_test_config, pool_min_size=0, pool_max_size=2)
+
+        # Hold one session while borrowing another so the pool has to open both
+        with connector._borrow_session():
+            with connector._borrow_session():
+                pass
+
+        connector.do_switch_context(schema_name="NEW_SCHEMA")
+        with connector._borrow_session():
+            with connector._borrow_session():
+                pass
+
+        for session in sessions:
+            session.sql.assert_any_call("USE SCHEMA `NEW_SCHEMA`")
+
+        connector.close()
+        for session in sessions:
+            session.close.assert_called_once()
+
 
 @pytest.mark.usefixtures("mock_datus_modules")
 class TestMetadataOperations:
@@ -232,6 +279,218 @@ class TestMetadataOperations:
 
         connector.close()
 
+    @patch('datus_clickzetta.connector.Session')
+    def test_table_inventory_shared_and_invalidated(self, mock_session_class, clickzetta_test_config):
+        """Test that tables, views and MVs share one inventory query until DDL invalidates it."""
+        from datus_clickzetta.connector import ClickZettaConnector
+
+        mock_session = MagicMock()
+        mock_session_class.builder.configs.return_value.create.return_value = mock_session
+        mock_session.sql.return_value.to_pandas.return_value = pd.DataFrame({
+            'table_name': ['t1', 'v1', 'mv1'],
+            'table_type': ['MANAGED_TABLE', 'VIEW', 'MATERIALIZED_VIEW']
+        })
+
+        connector = ClickZettaConnector(**clickzetta_test_config)
+
+        def inventory_queries():
+            return [c for c in mock_session.sql.call_args_list if "information_schema.tables" in c.args[0]]
+
+        assert connector.get_tables(schema_name="sales") == ['t1']
+        assert connector.get_views(schema_name="sales") == ['v1']
+        assert connector.get_materialized_views(schema_name="sales") == ['mv1']
+        assert len(inventory_queries()) == 1
+
+        # DDL in another schema leaves the cached inventory alone
+        connector.execute_ddl("CREATE TABLE other.t2 (id INT)")
+        connector.get_tables(schema_name="sales")
+        assert len(inventory_queries()) == 1
+
+        connector.execute_ddl("DROP TABLE IF EXISTS `test_workspace`.`SALES`.`t1`")
+        connector.get_tables(schema_name="sales")
+        assert len(inventory_queries()) == 2
+
+        connector.close()
+
+    @patch('datus_clickzetta.connector.Session')
+    def test_bulk_schema_shares_column_cache(self, mock_session_class, clickzetta_test_config):
+        """Test that many tables are described with one query and the DDL path reuses the cached columns."""
+        from datus_clickzetta.connector import ClickZettaConnector
+
+        column_queries = []
+
+        def sql(query):
+            result = MagicMock()
+            if "information_schema.columns" in query:
+                column_queries.append(query)
+                names = [name for name in ('t1', 't2', 't3') if f"'{name}'" in query]
+                result.to_pandas.return_value = pd.DataFrame({
+                    'table_name': [name for name in names for _ in range(2)],
+                    'column_name': ['id', 'name'] * len(names),
+                    'data_type': ['INT', 'STRING'] * len(names),
+                    'comment': [None, None] * len(names),
+                })
+            elif "information_schema.tables" in query:
+                result.to_pandas.return_value = pd.DataFrame({
+                    'table_name': ['t1', 't2'], 'comment': [None, None], 'table_type': ['MANAGED_TABLE'] * 2,
+                })
+            else:
+                result.to_pandas.return_value = pd.DataFrame()
+            return result
+
+        mock_session = MagicMock()
+        mock_session.sql.side_effect = sql
+        mock_session_class.builder.configs.return_value.create.return_value = mock_session
+
+        connector = ClickZettaConnector(**clickzetta_test_config)
+
+        schemas = connector.get_table_schemas(['t1', 't2', 't3', 'missing'], schema_name="sales")
+        assert list(schemas) == ['t1', 't2', 't3']
+        assert [column['name'] for column in schemas['t2']] == ['id', 'name']
+        assert len(column_queries) == 1
+
+        assert [column['type'] for column in connector.get_schema(schema_name="sales", table_name="t3")] == [
+            'INT', 'STRING'
+        ]
+        records = connector.get_tables_with_ddl(schema_name="sales", tables=['t1', 't2'])
+        assert all("`id` INT" in record['definition'] for record in records)
+        assert len(column_queries) == 1
+
+        connector.execute_ddl("ALTER TABLE sales.t1 ADD COLUMN extra INT")
+        connector.get_schema(schema_name="sales", table_name="t1")
+        assert len(column_queries) == 2
+
+        connector.close()
+
+    @patch('datus_clickzetta.connector.Session')
+    def test_incremental_definition_sync(self, mock_session_class, clickzetta_test_config, tmp_path):
+        """Test that only tables with a new last_modify_time have their columns re-read."""
+        from datus_clickzetta.connector import ClickZettaConnector
+
+        listing = {
+            't1': ('MANAGED_TABLE', '2025-01-01 00:00:00'),
+            't2': ('MANAGED_TABLE', '2025-01-01 00:00:00'),
+            'v1': ('VIEW', '2025-01-01 00:00:00'),
+        }
+        column_queries = []
+
+        def sql(query):
+            result = MagicMock()
+            if "information_schema.tables" in query:
+                result.to_pandas.return_value = pd.DataFrame({
+                    'table_name': list(listing),
+                    'comment': [None] * len(listing),
+                    'table_type': [kind for kind, _ in listing.values()],
+                    'last_modified': [modified for _, modified in listing.values()],
+                })
+            elif "information_schema.columns" in query:
+                column_queries.append(query)
+                names = [name for name in listing if f"'{name}'" in query] if " IN (" in query else list(listing)
+                result.to_pandas.return_value = pd.DataFrame({
+                    'table_name': names,
+                    'column_name': ['id'] * len(names),
+                    'data_type': ['INT'] * len(names),
+                    'comment': [None] * len(names),
+                })
+            else:
+                result.to_pandas.return_value = pd.DataFrame()
+            return result
+
+        mock_session = MagicMock()
+        mock_session.sql.side_effect = sql
+        mock_session_class.builder.configs.return_value.create.return_value = mock_session
+
+        connector = ClickZettaConnector(
+            **clickzetta_test_config, incremental_metadata_sync=True, metadata_snapshot_dir=str(tmp_path)
+        )
+
+        first = connector.get_tables_with_ddl(schema_name="sales")
+        assert [r['table_name'] for r in first] == ['t1', 't2']
+        assert [r['table_name'] for r in connector.get_views_with_ddl(schema_name="sales")] == ['v1']
+        assert len(column_queries) == 1
+        assert connector.last_metadata_sync == {"changed": 0, "dropped": 0, "unchanged": 3}
+
+        listing['t2'] = ('MANAGED_TABLE', '2025-02-01 00:00:00')
+        del listing['v1']
+        second = connector.get_tables_with_ddl(schema_name="sales")
+        assert [r['table_name'] for r in second] == ['t1', 't2']
+        assert second[0]['definition'] == first[0]['definition']
+        assert len(column_queries) == 2
+        assert "'t2'" in column_queries[-1] and "'t1'" not in column_queries[-1]
+        assert connector.last_metadata_sync == {"changed": 1, "dropped": 1, "unchanged": 1}
+        assert connector.get_views_with_ddl(schema_name="sales") == []
+        connector.close()
+
+        # A new connector resumes from the persisted snapshot without re-reading columns
+        restarted = ClickZettaConnector(
+            **clickzetta_test_config, incremental_metadata_sync=True, metadata_snapshot_dir=str(tmp_path)
+        )
+        assert [r['table_name'] for r in restarted.get_tables_with_ddl(schema_name="sales")] == ['t1', 't2']
+        assert len(column_queries) == 2
+        restarted.close()
+
+
+@pytest.mark.usefixtures("mock_datus_modules")
+class TestSampling:
+    """Test concurrent sample row collection."""
+
+    @staticmethod
+    def _slow_session(latency, hanging_table=None, failing_table=None):
+        session = MagicMock()
+
+        def sql(query):
+            if hanging_table and hanging_table in query:
+                time.sleep(1.0)
+            elif failing_table and failing_table in query:
+                raise RuntimeError("table is gone")
+            elif query.startswith("SELECT *"):
+                time.sleep(latency)
+            result = MagicMock()
+            result.to_pandas.return_value = pd.DataFrame({'id': [1, 2]})
+            return result
+
+        session.sql.side_effect = sql
+        return session
+
+    @patch('datus_clickzetta.connector.Session')
+    def test_sampling_runs_concurrently(self, mock_session_class, clickzetta_test_config):
+        """Test that sampling 8 tables over 4 sessions beats the serial latency sum."""
+        from datus_clickzetta.connector import ClickZettaConnector
+
+        latency = 0.1
+        mock_session_class.builder.configs.return_value.create.side_effect = (
+            lambda: self._slow_session(latency)
+        )
+        connector = ClickZettaConnector(**clickzetta_test_config, pool_max_size=4)
+        tables = [f"t{i}" for i in range(8)]
+
+        started = time.monotonic()
+        samples = connector.get_sample_rows(tables=tables, top_n=2)
+        elapsed = time.monotonic() - started
+
+        assert [sample["table_name"] for sample in samples] == tables
+        assert elapsed < latency * len(tables) * 0.75
+
+        connector.close()
+
+    @patch('datus_clickzetta.connector.Session')
+    def test_sampling_returns_partial_results(self, mock_session_class, clickzetta_test_config):
+        """Test that failing and timed-out tables are skipped without failing the whole call."""
+        from datus_clickzetta.connector import ClickZettaConnector
+
+        mock_session_class.builder.configs.return_value.create.side_effect = (
+            lambda: self._slow_session(0, hanging_table="slow", failing_table="broken")
+        )
+        connector = ClickZettaConnector(**clickzetta_test_config, pool_max_size=3)
+
+        started = time.monotonic()
+        samples = connector.get_sample_rows(tables=["ok1", "slow", "broken", "ok2"], timeout=0.2)
+
+        assert time.monotonic() - started < 0.9
+        assert [sample["table_name"] for sample in samples] == ["ok1", "ok2"]
+
+        connector.close()
+
 
 @pytest.mark.usefixtures("mock_datus_modules")
 class TestVolumeOperations:
@@ -267,6 +526,135 @@ class TestVolumeOperations:
 
         connector.close()
 
+    @patch('datus_clickzetta.connector.Session')
+    def test_read_volume_file_uses_local_cache(self, mock_session_class, clickzetta_test_config, tmp_path):
+        """Test that unchanged volume files are served from the cache without a download."""
+        from pathlib import Path
+        from datus_clickzetta.connector import ClickZettaConnector
+
+        mock_session = MagicMock()
+        mock_session_class.builder.configs.return_value.create.return_value = mock_session
+        listing = {'modified': '2025-01-01 00:00:00'}
+
+        def sql(query):
+            result = MagicMock()
+            result.to_pandas.return_value = pd.DataFrame({
+                'relative_path': ['models/orders.yaml'],
+                'size': [11],
+                'last_modified_time': [listing['modified']],
+            })
+            return result
+
+        def file_get(source_uri, target_dir):
+            (Path(target_dir) / "orders.yaml").write_text("name: order", encoding="utf-8")
+
+        mock_session.sql.side_effect = sql
+        mock_session.file.get.side_effect = file_get
+
+        connector = ClickZettaConnector(**clickzetta_test_config, volume_cache_dir=str(tmp_path))
+
+        assert connector.read_volume_file("volume:user://~", "models/orders.yaml") == "name: order"
+        assert connector.read_volume_file("volume:user://~", "models/orders.yaml") == "name: order"
+        assert mock_session.file.get.call_count == 1
+
+        # A new last-modified time invalidates the cached copy
+        listing['modified'] = '2025-02-01 00:00:00'
+        connector.read_volume_file("volume:user://~", "models/orders.yaml")
+        assert mock_session.file.get.call_count == 2
+
+        connector.close()
+
+    @staticmethod
+    def _volume_session(files):
+        """Build a session whose LIST/GET serve ``files`` (name -> text) from a fake volume directory."""
+        from pathlib import Path
+
+        session = MagicMock()
+
+        def sql(query):
+            result = MagicMock()
+            result.to_pandas.return_value = pd.DataFrame({
+                'relative_path': [f"models/{name}" for name in files],
+                'size': [len(text) for text in files.values()],
+                'last_modified_time': ['2025-01-01'] * len(files),
+            })
+            return result
+
+        def file_get(source_uri, target_dir):
+            requested = source_uri.rstrip("/").split("/")[-1]
+            names = [requested] if requested in files else list(files)
+            for name in names:
+                (Path(target_dir) / name).write_text(files[name], encoding="utf-8")
+
+        session.sql.side_effect = sql
+        session.file.get.side_effect = file_get
+        return session
+
+    @patch('datus_clickzetta.connector.Session')
+    def test_read_volume_files_single_directory_get(self, mock_session_class, clickzetta_test_config, tmp_path):
+        """Test that a directory of model files is fetched with one GET and served from cache afterwards."""
+        from pathlib import Path
+        from datus_clickzetta.connector import ClickZettaConnector
+
+        files = {'orders.yaml': 'name: orders', 'users.yml': 'name: users', 'big.yaml': 'x' * 64}
+        session = self._volume_session(files)
+        mock_session_class.builder.configs.return_value.create.return_value = session
+
+        connector = ClickZettaConnector(**clickzetta_test_config, volume_cache_dir=str(tmp_path / "cache"))
+        contents = connector.read_volume_files(
+            "volume:user://~", "models", target_dir=str(tmp_path / "out"), stream_threshold_bytes=32
+        )
+
+        assert contents['orders.yaml'] == 'name: orders'
+        assert contents['users.yml'] == 'name: users'
+        assert isinstance(contents['big.yaml'], Path)
+        assert contents['big.yaml'].read_text() == 'x' * 64
+        assert session.file.get.call_count == 1
+
+        again = connector.read_volume_files("volume:user://~", "models", stream_threshold_bytes=32)
+        assert again['orders.yaml'] == 'name: orders'
+        assert session.file.get.call_count == 1
+
+        connector.close()
+
+    @patch('datus_clickzetta.connector.Session')
+    def test_read_volume_files_parallel_per_file(self, mock_session_class, clickzetta_test_config, tmp_path):
+        """Test that a small subset of a large directory is fetched file by file."""
+        from datus_clickzetta.connector import ClickZettaConnector
+
+        files = {f"data_{i}.csv": "1,2" for i in range(6)}
+        files.update({'a.yaml': 'a: 1', 'b.yaml': 'b: 2'})
+        session = self._volume_session(files)
+        mock_session_class.builder.configs.return_value.create.return_value = session
+
+        connector = ClickZettaConnector(**clickzetta_test_config, volume_cache_max_bytes=0)
+        contents = connector.read_volume_files("volume:user://~", "models", max_workers=2)
+
+        assert contents == {'a.yaml': 'a: 1', 'b.yaml': 'b: 2'}
+        fetched = sorted(call.args[0] for call in session.file.get.call_args_list)
+        assert fetched == ["volume:user://~/models/a.yaml", "volume:user://~/models/b.yaml"]
+
+        connector.close()
+
+    @patch('datus_clickzetta.connector.Session')
+    def test_read_volume_files_directory_get_by_bytes(self, mock_session_class, clickzetta_test_config):
+        """Test that one large wanted file among many small ones is fetched with a directory GET."""
+        from datus_clickzetta.connector import ClickZettaConnector
+
+        files = {f"data_{i}.csv": "1,2" for i in range(6)}
+        files['model.yaml'] = 'name: ' + 'x' * 100
+        session = self._volume_session(files)
+        mock_session_class.builder.configs.return_value.create.return_value = session
+
+        connector = ClickZettaConnector(**clickzetta_test_config, volume_cache_max_bytes=0)
+        contents = connector.read_volume_files("volume:user://~", "models")
+
+        assert contents == {'model.yaml': files['model.yaml']}
+        session.file.get.assert_called_once()
+        assert session.file.get.call_args.args[0] == "volume:user://~/models"
+
+        connector.close()
+
 
 @pytest.mark.usefixtures("mock_datus_modules")
 class TestNewMethods:
@@ -349,6 +737,60 @@ class TestNewMethods:
 
         connector.close()
 
+    @patch('datus_clickzetta.connector.parse_sql_type')
+    @patch('datus_clickzetta.connector.Session')
+    def test_execute_queries_concurrent_with_barriers(self, mock_session_class, mock_parse, clickzetta_test_config):
+        """Test that SELECTs overlap while DML runs alone, in order, with results in input order."""
+        from datus_clickzetta.connector import ClickZettaConnector
+
+        latency = 0.1
+        events = []
+        lock = threading.Lock()
+
+        def sql(query):
+            result = MagicMock()
+            if query.startswith(("USE", "SET")):
+                return result
+            with lock:
+                events.append(("start", query))
+            time.sleep(latency)
+            with lock:
+                events.append(("end", query))
+            result.to_pandas.return_value = pd.DataFrame({'q': [query]})
+            return result
+
+        def make_session():
+            session = MagicMock()
+            session.sql.side_effect = sql
+            return session
+
+        mock_session_class.builder.configs.return_value.create.side_effect = lambda: make_session()
+        mock_parse.side_effect = lambda query, dialect: "INSERT" if query.startswith("INSERT") else "SELECT"
+
+        connector = ClickZettaConnector(**clickzetta_test_config, pool_max_size=4)
+        queries = ["SELECT 1", "SELECT 2", "SELECT 3", "INSERT INTO t VALUES (1)", "SELECT 4", "SELECT 5"]
+
+        started = time.monotonic()
+        results = connector.execute_queries_arrow(queries, max_workers=4)
+        elapsed = time.monotonic() - started
+
+        assert [r.data.column('q').to_pylist()[0] for r in results if r.data is not None] == [
+            "SELECT 1", "SELECT 2", "SELECT 3", "SELECT 4", "SELECT 5"
+        ]
+        assert elapsed < latency * len(queries) * 0.75
+
+        insert_start = events.index(("start", "INSERT INTO t VALUES (1)"))
+        insert_end = events.index(("end", "INSERT INTO t VALUES (1)"))
+        assert {("end", f"SELECT {i}") for i in (1, 2, 3)} <= set(events[:insert_start])
+        assert {("start", f"SELECT {i}") for i in (4, 5)} <= set(events[insert_end:])
+
+        timings = connector.last_batch_timings
+        assert [t.index for t in timings] == list(range(len(queries)))
+        assert [t.concurrent for t in timings] == [True, True, True, False, True, True]
+        assert all(t.seconds >= latency * 0.9 for t in timings)
+
+        connector.close()
+
     @patch('datus_clickzetta.connector.Session')
     def test_execute_query_to_df(self, mock_session_class, clickzetta_test_config):
         """Test direct DataFrame query execution."""
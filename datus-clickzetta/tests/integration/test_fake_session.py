@@ -0,0 +1,311 @@
+# Copyright 2025-present DatusAI, Inc.
+# Licensed under the Apache License, Version 2.0.
+# See http://www.apache.org/licenses/LICENSE-2.0 for details.
+
+"""Integration tests running the connector end to end against the in-process fake session."""
+
+from unittest.mock import patch
+
+import pandas as pd
+import pytest
+
+
+@pytest.mark.usefixtures("mock_datus_modules")
+class TestFakeSession:
+    """Exercise the connector through FakeLakehouse instead of MagicMock sessions."""
+
+    def test_result_formats_agree(self, fake_connector):
+        """Test that every result format returns the same rows."""
+        sql = "SELECT * FROM `test_workspace`.`PUBLIC`.`orders`"
+
+        df = fake_connector.execute_pandas(sql).sql_return
+        table = fake_connector.execute_arrow(sql).data
+        rows = list(fake_connector.execute_csv_iterator(sql, max_rows=2))
+        limited = fake_connector.execute_query(sql, result_format="pandas", max_rows=2)
+
+        assert df["id"].tolist() == [1, 2, 3]
+        assert table.column("amount").to_pylist() == [10.5, 20.0, 7.25]
+        assert rows[0] == ("id", "amount", "status")
+        assert [row[0] for row in rows[1:]] == [1, 2, 3]
+        assert limited.row_count == 2 and limited.execution_stats["truncated"]
+
+    def test_metadata_and_sampling(self, fake_connector, fake_lakehouse):
+        """Test metadata calls, DDL building and sampling against the fake information_schema."""
+        assert sorted(fake_connector.get_tables()) == ["customers", "orders"]
+        assert fake_connector.get_views() == ["paid_orders"]
+
+        schema = fake_connector.get_schema(table_name="orders")
+        assert [(column["name"], column["type"]) for column in schema] == [
+            ("amount", "double"),
+            ("id", "bigint"),
+            ("status", "string"),
+        ]
+
+        definitions = {item["table_name"]: item["definition"] for item in fake_connector.get_tables_with_ddl()}
+        assert "COMMENT = 'Customer orders'" in definitions["orders"]
+        assert "`id` bigint COMMENT 'Order ID'" in definitions["orders"]
+
+        samples = fake_connector.get_sample_rows(tables=["orders", "missing"], top_n=2)
+        assert [sample["table_name"] for sample in samples] == ["orders"]
+        assert fake_lakehouse.statements_matching(r"LIMIT 2$")
+
+    def test_pandas_row_cap_stops_fetch_for_unwrappable_statement(self, fake_lakehouse, clickzetta_test_config):
+        """Test that max_rows stops the pandas fetch at the source when the statement cannot take a LIMIT."""
+        from datus_clickzetta.connector import ClickZettaConnector
+        from tests.fake_session import FakeArrowResult, FakeResult
+
+        fake_lakehouse.batch_rows = 10
+        fake_lakehouse.add_table("PUBLIC", "events", pd.DataFrame({"id": range(1000)}))
+        fully_fetched = []
+
+        def to_pandas(result):
+            fully_fetched.append(result._sql)
+            return FakeResult.to_pandas(result)
+
+        config = dict(clickzetta_test_config, workspace=fake_lakehouse.workspace, schema="PUBLIC")
+        with patch("datus_clickzetta.connector.Session", fake_lakehouse.session_class):
+            connector = ClickZettaConnector(**config)
+            with patch("datus_clickzetta.connector.parse_sql_type", return_value="SHOW"), patch.object(
+                FakeArrowResult, "to_pandas", autospec=True, side_effect=to_pandas
+            ):
+                df = connector.execute_query_to_df("SELECT * FROM events", max_rows=5)
+
+            assert df["id"].tolist() == [0, 1, 2, 3, 4]
+            assert df.attrs["truncated"]
+            # Sent as written, and never fetched whole
+            assert fake_lakehouse.statements_matching(r"^SELECT \* FROM events$")
+            assert not [sql for sql in fully_fetched if "events" in sql]
+            connector.close()
+
+    def test_whole_schema_ddl_fills_column_cache(self, fake_connector, fake_lakehouse):
+        """Test that get_table_schemas runs no query after a whole-schema get_tables_with_ddl."""
+        fake_connector.get_tables_with_ddl()
+        issued = len(fake_lakehouse.statements)
+
+        schemas = fake_connector.get_table_schemas(["orders", "customers"])
+
+        assert len(fake_lakehouse.statements) == issued
+        assert sorted(schemas) == ["customers", "orders"]
+        assert [(column["name"], column["comment"]) for column in schemas["orders"]] == [
+            ("amount", ""),
+            ("id", "Order ID"),
+            ("status", ""),
+        ]
+
+    def test_incremental_sync_falls_back_on_failed_queries(self, fake_lakehouse, clickzetta_test_config, tmp_path):
+        """Test that failed sync queries cost one full read, not the feature or the changed tables' columns."""
+        from datus_clickzetta.connector import ClickZettaConnector
+        from tests.fake_session import FakeQueryError
+
+        config = dict(clickzetta_test_config, workspace=fake_lakehouse.workspace, schema="PUBLIC")
+        with patch("datus_clickzetta.connector.Session", fake_lakehouse.session_class):
+            connector = ClickZettaConnector(
+                **config, incremental_metadata_sync=True, metadata_snapshot_dir=str(tmp_path)
+            )
+
+            def orders_definition() -> str:
+                records = {item["table_name"]: item for item in connector.get_tables_with_ddl()}
+                return records["orders"]["definition"]
+
+            assert "`id` bigint" in orders_definition()
+
+            # A transient listing failure falls back to a full read and keeps the feature on
+            fake_lakehouse.fail(r"last_modify_time", FakeQueryError("Session expired"), times=1)
+            assert "`id` bigint" in orders_definition()
+            assert connector.incremental_metadata_sync
+
+            # Columns of a changed table that cannot be re-read are not recorded as empty
+            fake_lakehouse.tables[("PUBLIC", "orders")].last_modify_time = "2025-02-01 00:00:00"
+            fake_lakehouse.fail(r"information_schema\.columns.*IN \(", FakeQueryError("Job timed out"), times=1)
+            assert "`id` bigint" in orders_definition()
+            assert "`id` bigint" in orders_definition()
+            assert connector.last_metadata_sync["changed"] == 1
+
+            # A workspace without the column turns the feature off
+            fake_lakehouse.fail(r"last_modify_time", FakeQueryError("Column 'last_modify_time' cannot be resolved"))
+            assert "`id` bigint" in orders_definition()
+            assert not connector.incremental_metadata_sync
+            connector.close()
+
+    def test_sampling_timeout_cancels_job_and_frees_session(self, fake_lakehouse, clickzetta_test_config):
+        """Test that a timed-out sample has its job cancelled and its pool slot released right away."""
+        import time
+
+        from datus_clickzetta.connector import ClickZettaConnector
+
+        fake_lakehouse.add_table("PUBLIC", "slow", pd.DataFrame({"id": [1]}))
+        fake_lakehouse.submit_latency = lambda sql: 30.0 if "`slow`" in sql else 0.0
+        config = dict(clickzetta_test_config, workspace=fake_lakehouse.workspace, schema="PUBLIC")
+        with patch("datus_clickzetta.connector.Session", fake_lakehouse.session_class):
+            connector = ClickZettaConnector(**config, pool_min_size=0, pool_max_size=1, pool_timeout=1.0)
+
+            started = time.monotonic()
+            samples = connector.get_sample_rows(tables=["slow", "orders"], timeout=0.2)
+            # The only session is released on timeout, so the queued table still gets sampled
+            assert [sample["table_name"] for sample in samples] == ["orders"]
+            assert connector.get_sample_rows(tables=["orders"])[0]["table_name"] == "orders"
+            assert time.monotonic() - started < 5
+
+            [cancelled] = [session for session in fake_lakehouse.sessions if session.cancelled_jobs]
+            assert cancelled.closed
+            assert connector._pool.stats()["abandoned"] == 1
+            connector.close()
+
+    def test_session_settings_follow_to_other_pooled_sessions(self, fake_lakehouse, clickzetta_test_config):
+        """Test that SET and USE VCLUSTER through execute_content_set reach sessions other than the one they ran on."""
+        from datus_clickzetta.connector import ClickZettaConnector
+
+        config = dict(clickzetta_test_config, workspace=fake_lakehouse.workspace, schema="PUBLIC")
+        with patch("datus_clickzetta.connector.Session", fake_lakehouse.session_class):
+            connector = ClickZettaConnector(**config, pool_min_size=0, pool_max_size=2)
+            assert connector.execute_content_set("SET cz.sql.timezone = 'UTC'").success
+            assert connector.execute_content_set("USE VCLUSTER etl_vc").success
+            assert connector.vcluster == "etl_vc"
+
+            # Hold the session the statements ran on, so the query needs a second one
+            with connector._borrow_session():
+                assert connector.execute_pandas("SELECT * FROM orders").success
+
+            assert len(fake_lakehouse.sessions) == 2
+            for session in fake_lakehouse.sessions:
+                assert session.hints["cz.sql.timezone"] == "'UTC'"
+            # The second session is opened on the new virtual cluster
+            assert fake_lakehouse.statements_matching(r"^USE VCLUSTER `ETL_VC`$")
+            connector.close()
+
+    def test_volume_reads(self, fake_connector):
+        """Test LIST and GET of volume files."""
+        assert fake_connector.list_volume_files("volume:user://~", "semantic_models") == [
+            "customers.yml",
+            "orders.yaml",
+        ]
+        assert fake_connector.read_volume_file("volume:user://~", "semantic_models/orders.yaml") == "name: orders\n"
+        contents = fake_connector.read_volume_files("volume:user://~", "semantic_models")
+        assert contents == {"orders.yaml": "name: orders\n", "customers.yml": "name: customers\n"}
+
+    def test_volume_cache_revalidates_by_full_path(self, fake_lakehouse, clickzetta_test_config, tmp_path):
+        """Test that the cache checks a file's own LIST entry, not a same-named file in a subdirectory."""
+        from datus_clickzetta.connector import ClickZettaConnector
+
+        fake_lakehouse.add_volume_file("volume:user://~", "models/archive/orders.yaml", "name: old_orders\n")
+        fake_lakehouse.add_volume_file("volume:user://~", "models/orders.yaml", "name: orders\n")
+        config = dict(clickzetta_test_config, workspace=fake_lakehouse.workspace, schema="PUBLIC")
+        with patch("datus_clickzetta.connector.Session", fake_lakehouse.session_class):
+            connector = ClickZettaConnector(**config, volume_cache_dir=str(tmp_path))
+            assert connector.read_volume_file("volume:user://~", "models/orders.yaml") == "name: orders\n"
+
+            fake_lakehouse.add_volume_file(
+                "volume:user://~", "models/orders.yaml", "name: orders_v2\n", last_modified="2025-02-01 00:00:00"
+            )
+            assert connector.read_volume_file("volume:user://~", "models/orders.yaml") == "name: orders_v2\n"
+            connector.close()
+
+    def test_injected_failure_and_latency(self, fake_connector, fake_lakehouse):
+        """Test that injected failures surface as failed results and latency shows up in the stats."""
+        fake_lakehouse.fail(r"FROM `?customers", times=1)
+        failed = fake_connector.execute_pandas("SELECT * FROM customers")
+        assert not failed.success
+        assert "Injected failure" in failed.execution_stats["error"]
+
+        fake_lakehouse.submit_latency = 0.05
+        retried = fake_connector.execute_pandas("SELECT * FROM customers")
+        assert retried.success and retried.row_count == 2
+        assert retried.execution_stats["submit_seconds"] >= 0.05
+        assert retried.execution_stats["job_id"].startswith("fake-job-")
+
+    def test_result_cache(self, fake_lakehouse, clickzetta_test_config):
+        """Test that repeated SELECTs are served from the result cache until a write touches their table."""
+        from datus_clickzetta.connector import ClickZettaConnector
+
+        config = dict(clickzetta_test_config, workspace=fake_lakehouse.workspace, schema="PUBLIC")
+        with patch("datus_clickzetta.connector.Session", fake_lakehouse.session_class):
+            connector = ClickZettaConnector(**config, result_cache_max_bytes=1024 * 1024)
+            orders_sql = "SELECT * FROM orders"
+
+            first = connector.execute_arrow(orders_sql)
+            second = connector.execute_arrow("SELECT *   FROM orders;")
+            df = connector.execute_pandas(orders_sql).sql_return
+            connector.execute_pandas("SELECT * FROM customers")
+
+            assert not first.execution_stats["cache_hit"] and second.execution_stats["cache_hit"]
+            assert second.data.equals(first.data)
+            assert df["status"].tolist() == ["new", "paid", "paid"]
+            assert len(fake_lakehouse.statements_matching(r"FROM orders$")) == 1  # pandas and Arrow share the entry
+
+            with patch("datus_clickzetta.connector.parse_sql_type", return_value="INSERT"):
+                connector.execute_insert("INSERT INTO `PUBLIC`.`orders` VALUES (4, 1.0, 'new')")
+            connector.execute_arrow(orders_sql)
+            connector.execute_pandas("SELECT * FROM customers")
+
+            assert len(fake_lakehouse.statements_matching(r"FROM orders$")) == 2
+            assert len(fake_lakehouse.statements_matching(r"FROM customers$")) == 1
+            stats = connector.result_cache_stats()
+            assert stats["hits"] == 3 and stats["invalidations"] == 1
+            connector.close()
+
+    def test_large_result_spills_to_memory_map(self, fake_lakehouse, clickzetta_test_config, tmp_path):
+        """Test that results above the spill threshold come back memory-mapped from an IPC file."""
+        from datus_clickzetta.connector import ClickZettaConnector
+
+        fake_lakehouse.batch_rows = 1000
+        fake_lakehouse.add_table("PUBLIC", "events", pd.DataFrame({"id": range(10000), "value": [0.5] * 10000}))
+        config = dict(clickzetta_test_config, workspace=fake_lakehouse.workspace, schema="PUBLIC")
+        spill_dir = tmp_path / "spill"
+        with patch("datus_clickzetta.connector.Session", fake_lakehouse.session_class):
+            connector = ClickZettaConnector(**config, spill_threshold_bytes=40 * 1024, spill_dir=str(spill_dir))
+
+            large = connector.execute_arrow("SELECT * FROM events")
+            small = connector.execute_arrow("SELECT * FROM orders")
+
+            assert large.execution_stats["spilled"] and not small.execution_stats["spilled"]
+            assert large.data.num_rows == 10000
+            assert large.data.column("id").to_pylist() == list(range(10000))
+            assert small.data.num_rows == 3
+            # The spill file is unlinked once mapped; the table stays readable through the mapping
+            assert list(spill_dir.iterdir()) == []
+            connector.close()
+
+    def test_export_parquet(self, fake_connector, fake_lakehouse, tmp_path):
+        """Test plain and partitioned client-side Parquet export."""
+        import pyarrow.parquet as pq
+
+        export = fake_connector.export_parquet("SELECT * FROM orders", str(tmp_path / "orders"))
+        assert export.rows == 3 and not export.server_side
+        assert [path.name for path in export.files] == ["part-0.parquet"]
+        assert pq.read_table(export.files[0]).column("status").to_pylist() == ["new", "paid", "paid"]
+
+        partitioned = fake_connector.export_parquet(
+            "SELECT * FROM orders", str(tmp_path / "by_status"), partition_by=["status"]
+        )
+        assert partitioned.rows == 3
+        assert sorted(path.parent.name for path in partitioned.files) == ["status=new", "status=paid"]
+
+        with pytest.raises(FileExistsError):
+            fake_connector.export_parquet("SELECT * FROM orders", str(tmp_path / "orders"))
+        assert fake_connector.export_parquet("SELECT * FROM orders", str(tmp_path / "orders"), overwrite=True).rows == 3
+
+    def test_export_parquet_server_side_unload(self, fake_connector, fake_lakehouse, tmp_path):
+        """Test that server-side unload runs COPY INTO, downloads the directory and removes it from the volume."""
+        import io
+        import re
+
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        def unload(sql):
+            directory = re.search(r"SUBDIRECTORY '([^']+)'", sql).group(1)
+            buffer = io.BytesIO()
+            pq.write_table(pa.table({"id": [1, 2, 3]}), buffer)
+            fake_lakehouse.add_volume_file("volume:user://~", f"{directory}part-0.parquet", buffer.getvalue())
+            return pd.DataFrame()
+
+        fake_lakehouse.on(r"^COPY INTO USER VOLUME", unload)
+        export = fake_connector.export_parquet(
+            "SELECT id FROM orders", str(tmp_path / "unloaded"), unload_volume="volume:user://~"
+        )
+
+        assert export.server_side and export.rows == 3
+        [copy_sql] = fake_lakehouse.statements_matching(r"^COPY INTO")
+        assert "FROM (\nSELECT id FROM orders\n) FILE_FORMAT = (TYPE = PARQUET)" in copy_sql
+        assert fake_lakehouse.statements_matching(r"^REMOVE USER VOLUME SUBDIRECTORY 'datus_export/")
+        assert not fake_lakehouse.statements_matching(r"^SELECT id FROM orders$")
@@ -12,6 +12,7 @@ This script provides different test execution modes:
 - All tests
 - Quick tests (unit + fast integration)
 - Coverage report
+- Benchmarks against the in-process fake session
 """
 
 import sys
@@ -39,7 +40,7 @@ def run_command(cmd, description=""):
 
 def main():
     parser = argparse.ArgumentParser(description='Run ClickZetta adapter tests')
-    parser.add_argument('--mode', choices=['unit', 'integration', 'all', 'quick', 'coverage'],
+    parser.add_argument('--mode', choices=['unit', 'integration', 'all', 'quick', 'coverage', 'benchmark'],
                        default='all', help='Test mode to run')
     parser.add_argument('--verbose', '-v', action='store_true', help='Verbose output')
     parser.add_argument('--markers', '-m', help='Pytest markers to run (e.g., "not slow")')
@@ -132,6 +133,11 @@ def main():
         exit_codes.append(run_command(cmd, "HTML Coverage Report"))
         print("\n📊 HTML coverage report generated in: htmlcov/index.html")
 
+    elif args.mode == 'benchmark':
+        os.environ['CLICKZETTA_BENCHMARK'] = '1'
+        cmd = base_cmd + ['./benchmarks/']
+        exit_codes.append(run_command(cmd, "Benchmarks"))
+
     else:  # all
         # Run all tests
         cmd = base_cmd + ['./']
@@ -0,0 +1,155 @@
+# Copyright 2025-present DatusAI, Inc.
+# Licensed under the Apache License, Version 2.0.
+# See http://www.apache.org/licenses/LICENSE-2.0 for details.
+
+"""Unit tests for the ClickZetta adapter caches."""
+
+import time
+
+import pytest
+
+
+@pytest.mark.usefixtures("mock_datus_modules")
+class TestTTLCache:
+    """Test suite for TTLCache."""
+
+    def test_lru_eviction(self):
+        """Test that the least recently used entry is evicted first."""
+        from datus_clickzetta.cache import TTLCache
+
+        cache = TTLCache(maxsize=2, ttl=0)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        assert cache.get("a") == 1  # "a" becomes most recently used
+        cache.put("c", 3)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+        assert cache.stats()["evictions"] == 1
+
+    def test_ttl_expiry(self):
+        """Test that entries expire after ttl seconds."""
+        from datus_clickzetta.cache import TTLCache
+
+        cache = TTLCache(maxsize=4, ttl=0.01)
+        cache.put("a", 1)
+        time.sleep(0.02)
+        assert cache.get("a") is None
+        assert len(cache) == 0
+
+    def test_get_or_load_and_invalidate(self):
+        """Test that get_or_load only calls the loader on a miss."""
+        from datus_clickzetta.cache import TTLCache
+
+        cache = TTLCache(maxsize=4, ttl=60)
+        calls = []
+
+        def loader():
+            calls.append(1)
+            return ["t1"]
+
+        assert cache.get_or_load(("ws", "S1"), loader) == ["t1"]
+        assert cache.get_or_load(("ws", "S1"), loader) == ["t1"]
+        assert len(calls) == 1
+
+        cache.put(("ws", "S2"), [])
+        assert cache.invalidate_where(lambda key: key[1] == "S1") == 1
+        assert cache.get(("ws", "S2")) == []
+        cache.get_or_load(("ws", "S1"), loader)
+        assert len(calls) == 2
+        assert cache.stats()["hits"] >= 2
+
+
+@pytest.mark.usefixtures("mock_datus_modules")
+class TestResultCache:
+    """Test suite for ResultCache."""
+
+    def test_byte_budget_and_ttl(self):
+        """Test LRU eviction by total size, oversized results and expiry."""
+        from datus_clickzetta.cache import ResultCache
+
+        cache = ResultCache(max_bytes=10, ttl=0)
+        assert cache.put("a", "A", size=4)
+        assert cache.put("b", "B", size=4)
+        assert cache.get("a") == "A"  # "a" becomes most recently used
+        assert cache.put("c", "C", size=4)
+        assert not cache.put("huge", "H", size=11)
+
+        assert cache.get("b") is None
+        assert cache.stats()["bytes"] == 8
+        assert cache.stats()["evictions"] == 1
+
+        expiring = ResultCache(max_bytes=10, ttl=0.01)
+        expiring.put("a", "A", size=1)
+        time.sleep(0.02)
+        assert expiring.get("a") is None
+        assert expiring.stats()["bytes"] == 0
+
+    def test_invalidate_tables(self):
+        """Test that invalidation drops entries read from the tables and entries with unknown sources."""
+        from datus_clickzetta.cache import ResultCache
+
+        cache = ResultCache(max_bytes=100)
+        cache.put("orders", 1, size=1, tables={"orders"})
+        cache.put("join", 2, size=1, tables={"orders", "customers"})
+        cache.put("customers", 3, size=1, tables={"customers"})
+        cache.put("unknown", 4, size=1)
+
+        assert cache.invalidate_tables(["orders"]) == 3
+        assert cache.get("customers") == 3
+        assert len(cache) == 1
+        assert not ResultCache(max_bytes=0).put("a", 1, size=1)
+
+
+@pytest.mark.usefixtures("mock_datus_modules")
+class TestDiskLRUCache:
+    """Test suite for DiskLRUCache."""
+
+    def test_put_get_and_byte_budget(self, tmp_path):
+        """Test that the least recently used files are evicted once the byte budget is exceeded."""
+        from datus_clickzetta.cache import DiskLRUCache
+
+        cache = DiskLRUCache(tmp_path, max_bytes=10)
+        cache.put("a", b"1234")
+        cache.put("b", b"5678")
+        assert cache.get("a") == b"1234"  # "a" becomes most recently used
+        cache.put("c", b"9012")
+
+        assert cache.get("b") is None
+        assert cache.get("a") == b"1234"
+        assert cache.get("c") == b"9012"
+        assert cache.stats()["bytes"] == 8
+        assert not cache.path_for("b").exists()
+
+    def test_index_survives_new_instance(self, tmp_path):
+        """Test that a new cache instance picks up entries already on disk."""
+        from datus_clickzetta.cache import DiskLRUCache
+
+        key = DiskLRUCache.make_key("volume:user://v/model.yaml", 42, "2025-01-01")
+        DiskLRUCache(tmp_path).put(key, b"content")
+
+        reopened = DiskLRUCache(tmp_path)
+        assert reopened.get(key) == b"content"
+        assert reopened.stats()["entries"] == 1
+
+    def test_disabled_cache(self, tmp_path):
+        """Test that a zero byte budget disables caching."""
+        from datus_clickzetta.cache import DiskLRUCache
+
+        cache = DiskLRUCache(tmp_path / "cache", max_bytes=0)
+        cache.put("a", b"1")
+        assert cache.get("a") is None
+        assert not (tmp_path / "cache").exists()
+
+    def test_unwritable_directory_is_best_effort(self, tmp_path):
+        """Test that failing to create the cache directory skips caching instead of raising."""
+        from datus_clickzetta.cache import DiskLRUCache
+
+        blocker = tmp_path / "blocker"
+        blocker.write_bytes(b"not a directory")
+        cache = DiskLRUCache(blocker / "cache")
+
+        cache.put("a", b"1")
+        assert cache.put_file("b", blocker) is None
+        assert cache.get("a") is None
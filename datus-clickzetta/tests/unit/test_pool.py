@@ -0,0 +1,230 @@
+# Copyright 2025-present DatusAI, Inc.
+# Licensed under the Apache License, Version 2.0.
+# See http://www.apache.org/licenses/LICENSE-2.0 for details.
+
+"""Unit tests for the ClickZetta session pool."""
+
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+
+def _make_factory(created):
+    def factory(context):
+        session = MagicMock(name=f"session-{len(created)}")
+        created.append(session)
+        return session
+
+    return factory
+
+
+@pytest.mark.usefixtures("mock_datus_modules")
+class TestSessionPool:
+    """Test suite for ClickZettaSessionPool."""
+
+    def test_reuses_idle_session(self):
+        """Test that a returned session is handed out again instead of creating a new one."""
+        from datus_clickzetta.pool import ClickZettaSessionPool
+
+        created = []
+        pool = ClickZettaSessionPool(factory=_make_factory(created), min_size=0, max_size=2)
+
+        with pool.session() as first:
+            pass
+        with pool.session() as second:
+            pass
+
+        assert first.session is second.session
+        assert len(created) == 1
+        assert pool.stats()["idle"] == 1
+
+    def test_bounded_concurrency_and_timeout(self):
+        """Test that checkout blocks at max_size and times out with a DatusException."""
+        from datus.utils.exceptions import DatusException
+
+        from datus_clickzetta.pool import ClickZettaSessionPool
+
+        created = []
+        pool = ClickZettaSessionPool(factory=_make_factory(created), min_size=0, max_size=2, checkout_timeout=0.05)
+
+        a = pool.checkout()
+        b = pool.checkout()
+        assert a.session is not b.session
+
+        with pytest.raises(DatusException):
+            pool.checkout()
+
+        released = threading.Timer(0.05, pool.checkin, args=(a,))
+        released.start()
+        c = pool.checkout(timeout=2)
+        released.join()
+        assert c.session is a.session
+        assert len(created) == 2
+
+    def test_concurrent_borrowers_never_exceed_max_size(self):
+        """Test that many threads share at most max_size sessions."""
+        from datus_clickzetta.pool import ClickZettaSessionPool
+
+        created = []
+        pool = ClickZettaSessionPool(factory=_make_factory(created), min_size=0, max_size=3)
+        in_use = []
+        peak = []
+        lock = threading.Lock()
+
+        def worker():
+            with pool.session():
+                with lock:
+                    in_use.append(1)
+                    peak.append(len(in_use))
+                time.sleep(0.01)
+                with lock:
+                    in_use.pop()
+
+        threads = [threading.Thread(target=worker) for _ in range(12)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert max(peak) <= 3
+        assert len(created) <= 3
+
+    def test_idle_eviction_keeps_min_size(self):
+        """Test that idle sessions above min_size are closed after idle_timeout."""
+        from datus_clickzetta.pool import ClickZettaSessionPool
+
+        created = []
+        pool = ClickZettaSessionPool(factory=_make_factory(created), min_size=1, max_size=3, idle_timeout=0.01)
+
+        a, b = pool.checkout(), pool.checkout()
+        pool.checkin(a)
+        pool.checkin(b)
+        time.sleep(0.02)
+
+        with pool.session():
+            pass
+
+        assert pool.stats()["size"] == 1
+        assert pool.stats()["evicted"] == 1
+        a.session.close.assert_called_once()
+
+    def test_unhealthy_session_is_replaced(self):
+        """Test that a session failing its health check is closed and replaced."""
+        from datus_clickzetta.pool import ClickZettaSessionPool
+
+        created = []
+        health_check = MagicMock(side_effect=RuntimeError("session expired"))
+        pool = ClickZettaSessionPool(
+            factory=_make_factory(created),
+            min_size=0,
+            max_size=1,
+            health_check=health_check,
+            health_check_interval=0,
+        )
+
+        first = pool.checkout()
+        pool.checkin(first)
+        second = pool.checkout()
+
+        assert second.session is not first.session
+        first.session.close.assert_called_once()
+        assert pool.stats()["failed_checks"] == 1
+
+    def test_close_retires_borrowed_sessions(self):
+        """Test that close() drains idle sessions and retires borrowed ones when returned."""
+        from datus_clickzetta.pool import ClickZettaSessionPool
+
+        created = []
+        pool = ClickZettaSessionPool(factory=_make_factory(created), min_size=0, max_size=2)
+
+        idle, borrowed = pool.checkout(), pool.checkout()
+        pool.checkin(idle)
+        pool.close()
+        idle.session.close.assert_called_once()
+
+        pool.checkin(borrowed)
+        borrowed.session.close.assert_called_once()
+        assert pool.stats()["size"] == 0
+
+        with pool.session() as fresh:
+            assert fresh.session not in (idle.session, borrowed.session)
+
+    def test_abandon_frees_slot_of_borrowed_session(self):
+        """Test that abandon() closes a stuck session and frees its slot before the borrower returns it."""
+        from datus_clickzetta.pool import ClickZettaSessionPool
+
+        created = []
+        pool = ClickZettaSessionPool(factory=_make_factory(created), min_size=0, max_size=1, checkout_timeout=0.05)
+
+        stuck = pool.checkout()
+        pool.abandon(stuck)
+        stuck.session.close.assert_called_once()
+
+        with pool.session() as fresh:
+            assert fresh.session is not stuck.session
+        pool.checkin(stuck)
+        stuck.session.close.assert_called_once()
+        assert pool.stats()["size"] == 1 and pool.stats()["idle"] == 1
+
+    def test_refresh_swaps_idle_session(self):
+        """Test that an expiring idle session is replaced and closed without blocking callers."""
+        from datus_clickzetta.pool import ClickZettaSessionPool
+
+        created = []
+        pool = ClickZettaSessionPool(
+            factory=_make_factory(created), min_size=0, max_size=1, max_lifetime=60, refresh_margin=60
+        )
+
+        old = pool.checkout()
+        pool.checkin(old)
+        assert pool.refresh_expiring() == 1
+
+        old.session.close.assert_called_once()
+        with pool.session() as fresh:
+            assert fresh.session is created[1]
+
+        stats = pool.stats()
+        assert stats["refreshes"] == 1
+        assert stats["size"] == 1
+        assert len(stats["recent_refresh_seconds"]) == 1
+        pool.close()
+
+    def test_refresh_drains_borrowed_session(self):
+        """Test that a borrowed expiring session is closed only after it is returned."""
+        from datus_clickzetta.pool import ClickZettaSessionPool
+
+        created = []
+        pool = ClickZettaSessionPool(
+            factory=_make_factory(created), min_size=0, max_size=1, max_lifetime=60, refresh_margin=60
+        )
+
+        borrowed = pool.checkout()
+        assert pool.refresh_expiring() == 1
+        borrowed.session.close.assert_not_called()
+
+        pool.checkin(borrowed)
+        borrowed.session.close.assert_called_once()
+        with pool.session() as fresh:
+            assert fresh.session is created[1]
+        assert pool.stats()["size"] == 1
+        pool.close()
+
+    def test_background_refresher_runs(self):
+        """Test that the refresher thread replaces sessions before max_lifetime."""
+        from datus_clickzetta.pool import ClickZettaSessionPool
+
+        created = []
+        pool = ClickZettaSessionPool(
+            factory=_make_factory(created), min_size=1, max_size=1, max_lifetime=0.3, refresh_margin=0.25
+        )
+        pool.warm()
+
+        deadline = time.monotonic() + 2
+        while pool.stats()["refreshes"] == 0 and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        assert pool.stats()["refreshes"] >= 1
+        created[0].close.assert_called_once()
+        pool.close()
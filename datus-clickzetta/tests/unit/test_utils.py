@@ -328,6 +328,379 @@ class TestNewMethods:
 
         connector.close()
 
+    @patch('datus_clickzetta.connector.Session')
+    def test_execute_query_native_arrow(self, mock_session_class):
+        """Test that a native Arrow result is used without a pandas round-trip."""
+        from datus_clickzetta.connector import ClickZettaConnector
+        import pyarrow as pa
+
+        mock_session = MagicMock()
+        mock_session_class.builder.configs.return_value.create.return_value = mock_session
+
+        native_table = pa.table({'id': [1, 2, 3], 'name': ['a', 'b', 'c']})
+        mock_session.sql.return_value.to_arrow.return_value = native_table
+
+        connector = ClickZettaConnector(
+            service="service", username="user", password="pass",
+            instance="instance", workspace="workspace"
+        )
+
+        arrow_result = connector.execute_query("SELECT * FROM t", result_format="arrow")
+        assert arrow_result.sql_return is native_table
+        assert arrow_result.row_count == 3
+
+        list_result = connector.execute_query("SELECT * FROM t", result_format="list")
+        assert list_result.sql_return[0] == {'id': 1, 'name': 'a'}
+
+        csv_result = connector.execute_query("SELECT * FROM t", result_format="csv")
+        assert csv_result.sql_return.splitlines()[0] == "id,name"
+
+        mock_session.sql.return_value.to_pandas.assert_not_called()
+
+        connector.close()
+
+    @patch('datus_clickzetta.connector.Session')
+    def test_execute_pandas_without_native_arrow(self, mock_session_class):
+        """Test that pandas results skip the Arrow round-trip when the SDK has no native Arrow fetch."""
+        from datus_clickzetta.connector import ClickZettaConnector
+
+        mock_session = MagicMock()
+        mock_session_class.builder.configs.return_value.create.return_value = mock_session
+
+        sdk_frame = pd.DataFrame({'id': [1, 2, 3]})
+        mock_session.sql.return_value = MagicMock(spec=["to_pandas"])
+        mock_session.sql.return_value.to_pandas.return_value = sdk_frame
+
+        connector = ClickZettaConnector(
+            service="service", username="user", password="pass",
+            instance="instance", workspace="workspace"
+        )
+
+        df = connector.execute_query_to_df("SELECT * FROM t")
+
+        # The SDK's frame is returned as is, with no conversion time booked
+        assert df is sdk_frame
+        assert connector.last_execution_stats.conversion_seconds == 0
+
+        connector.close()
+
+    def test_arrow_to_csv(self, mock_datus_modules):
+        """Test that CSV is written by Arrow's writer, with a pandas fallback for nested types."""
+        from datus_clickzetta.connector import ClickZettaConnector
+        import pyarrow as pa
+
+        table = pa.table({'id': [1, None], 'note': ['a,b', 'x']})
+        with patch('pandas.DataFrame.to_csv') as to_csv:
+            text = ClickZettaConnector._arrow_to_csv(table)
+        to_csv.assert_not_called()
+        lines = text.splitlines()
+        assert lines[0] == "id,note"
+        assert lines[1] == '1,"a,b"'
+        assert lines[2].startswith(",")
+
+        assert ClickZettaConnector._arrow_to_csv(table.slice(0, 0)) == "id,note\n"
+        nested = ClickZettaConnector._arrow_to_csv(pa.table({'tags': [[1, 2]]}))
+        assert nested.splitlines()[0] == "tags"
+
+
+@pytest.mark.usefixtures("mock_datus_modules")
+class TestStreaming:
+    """Test suite for the streaming iterator API."""
+
+    @patch('datus_clickzetta.connector.Session')
+    def test_arrow_iterator_streams_bounded_batches(self, mock_session_class):
+        """Test that SDK batches are re-sliced to max_rows and consumed lazily."""
+        from datus_clickzetta.connector import ClickZettaConnector
+        import pyarrow as pa
+
+        mock_session = MagicMock()
+        mock_session_class.builder.configs.return_value.create.return_value = mock_session
+
+        produced = []
+
+        def to_arrow_batches():
+            for start in range(0, 25, 10):
+                produced.append(start)
+                yield pa.record_batch({'id': list(range(start, min(start + 10, 25)))})
+
+        mock_session.sql.return_value.to_arrow_batches.side_effect = to_arrow_batches
+
+        connector = ClickZettaConnector(
+            service="service", username="user", password="pass",
+            instance="instance", workspace="workspace"
+        )
+
+        iterator = connector.execute_arrow_iterator("SELECT id FROM t", max_rows=4)
+        first = next(iterator)
+        assert first.num_rows == 4
+        assert produced == [0]  # only the first server batch has been pulled
+
+        rest = list(iterator)
+        assert all(batch.num_rows <= 4 for batch in rest)
+        assert sum(batch.num_rows for batch in [first] + rest) == 25
+        mock_session.sql.return_value.to_pandas.assert_not_called()
+
+        connector.close()
+
+    @patch('datus_clickzetta.connector.Session')
+    def test_csv_iterator_falls_back_without_batch_api(self, mock_session_class):
+        """Test the CSV iterator header/rows when the SDK only offers to_pandas."""
+        from datus_clickzetta.connector import ClickZettaConnector
+
+        mock_session = MagicMock()
+        mock_session_class.builder.configs.return_value.create.return_value = mock_session
+        mock_session.sql.return_value.to_pandas.return_value = pd.DataFrame({'id': [1, 2, 3], 'name': ['a', 'b', 'c']})
+
+        connector = ClickZettaConnector(
+            service="service", username="user", password="pass",
+            instance="instance", workspace="workspace"
+        )
+
+        rows = list(connector.execute_csv_iterator("SELECT * FROM t", max_rows=2))
+        assert rows == [('id', 'name'), (1, 'a'), (2, 'b'), (3, 'c')]
+
+        empty_df = pd.DataFrame({'id': pd.Series([], dtype='int64')})
+        mock_session.sql.return_value.to_pandas.return_value = empty_df
+        assert list(connector.execute_csv_iterator("SELECT id FROM t WHERE 1 = 0")) == [('id',)]
+
+        connector.close()
+
+
+@pytest.mark.usefixtures("mock_datus_modules")
+class TestHintProfiles:
+    """Test suite for per-statement workload hint profiles."""
+
+    @patch('datus_clickzetta.connector.parse_sql_type')
+    @patch('datus_clickzetta.connector.Session')
+    def test_profiles_switch_per_statement(self, mock_session_class, mock_parse):
+        """Test that hints are SET only when a statement's profile differs from the session's."""
+        from datus_clickzetta.connector import ClickZettaConnector
+
+        mock_session = MagicMock()
+        mock_session_class.builder.configs.return_value.create.return_value = mock_session
+        mock_session.sql.return_value.to_pandas.return_value = pd.DataFrame({'id': [1]})
+        mock_parse.side_effect = lambda sql, dialect: "INSERT" if sql.startswith("INSERT") else "SELECT"
+
+        connector = ClickZettaConnector(
+            service="service", username="user", password="pass",
+            instance="instance", workspace="workspace",
+            hint_profiles={"sampling": {"sdk.job.timeout": 15}},
+        )
+
+        def set_statements():
+            statements = [c.args[0] for c in mock_session.sql.call_args_list if c.args[0].startswith("SET")]
+            mock_session.sql.reset_mock()
+            return statements
+
+        # Plain SELECTs run with the connection defaults
+        connector.execute_query("SELECT * FROM t")
+        assert set_statements() == []
+
+        connector.get_sample_rows(tables=["t"], schema_name="s")
+        connector.get_sample_rows(tables=["t"], schema_name="s")
+        assert set_statements().count("SET sdk.job.timeout = 15") == 1
+
+        connector.execute_insert("INSERT INTO t VALUES (1)")
+        assert "SET sdk.job.timeout = 1800" in set_statements()
+
+        # Explicit per-call override wins over classification
+        connector.execute_query("SELECT * FROM t", hint_profile="metadata")
+        assert "SET sdk.job.timeout = 60" in set_statements()
+
+        connector.execute_query("SELECT * FROM t")
+        assert "SET sdk.job.timeout = 300" in set_statements()
+
+        result = connector.execute_query("SELECT * FROM t", hint_profile="unknown")
+        assert not result.success
+
+        connector.close()
+
+
+@pytest.mark.usefixtures("mock_datus_modules")
+class TestDefinitionStreaming:
+    """Test suite for columnar DDL construction."""
+
+    @patch('datus_clickzetta.connector.Session')
+    def test_streamed_definitions_match_row_builder(self, mock_session_class):
+        """Test that Arrow-built definitions equal _build_definition, also when a table spans batches."""
+        from datus_clickzetta.connector import ClickZettaConnector
+
+        columns = pd.DataFrame({
+            'table_name': ['a', 'a', 'a', 'b', 'c', 'c'],
+            'column_name': ['id', 'we`ird', 'note', 'id', 'x', 'y'],
+            'data_type': ['INT', None, 'STRING', '', 'DOUBLE', 'DATE'],
+            'comment': ["it's", None, '', 'key', None, 'day'],
+        })
+        listing = pd.DataFrame({
+            'table_name': ['a', 'b', 'c', 'v', 'empty'],
+            'comment': [None, 'B table', None, None, None],
+            'table_type': ['MANAGED_TABLE', 'MANAGED_TABLE', 'EXTERNAL_TABLE', 'VIEW', 'MANAGED_TABLE'],
+        })
+
+        def sql(query):
+            result = MagicMock()
+            result.to_pandas.return_value = columns if "information_schema.columns" in query else listing
+            return result
+
+        mock_session = MagicMock()
+        mock_session.sql.side_effect = sql
+        mock_session_class.builder.configs.return_value.create.return_value = mock_session
+
+        connector = ClickZettaConnector(
+            service="service", username="user", password="pass",
+            instance="instance", workspace="workspace"
+        )
+        connector.DDL_BATCH_ROWS = 2  # table 'a' straddles the first two batches
+
+        records = connector.iter_tables_with_ddl(schema_name="s")
+        first = next(records)
+        assert first['table_name'] == 'a'
+        streamed = {first['table_name']: first['definition']}
+        streamed.update((record['table_name'], record['definition']) for record in records)
+
+        assert sorted(streamed) == ['a', 'b', 'c', 'empty']
+        for table_name, comment in (('a', None), ('b', 'B table'), ('c', None), ('empty', None)):
+            rows = columns[columns['table_name'] == table_name].to_dict(orient="records")
+            rows = [{key: (None if pd.isna(value) else value) for key, value in row.items()} for row in rows]
+            expected = connector._build_definition("workspace", "S", table_name, rows, table_comment=comment)
+            assert streamed[table_name] == expected
+
+        assert "`we``ird` STRING" in streamed['a'] and "COMMENT 'it''s'" in streamed['a']
+        assert connector.get_tables_with_ddl(schema_name="s")[0]['definition'] == streamed['a']
+
+        connector.close()
+
+
+@pytest.mark.usefixtures("mock_datus_modules")
+class TestRowLimit:
+    """Test suite for max_rows pushdown."""
+
+    @patch('datus_clickzetta.connector.Session')
+    def test_select_wrapped_with_limit(self, mock_session_class):
+        """Test that SELECTs get a server-side LIMIT and every format reports truncation."""
+        from datus_clickzetta.connector import ClickZettaConnector
+
+        mock_session = MagicMock()
+        mock_session_class.builder.configs.return_value.create.return_value = mock_session
+        mock_session.sql.return_value.to_pandas.return_value = pd.DataFrame({'id': range(6)})
+
+        connector = ClickZettaConnector(
+            service="service", username="user", password="pass",
+            instance="instance", workspace="workspace"
+        )
+
+        result = connector.execute_query("SELECT id FROM big -- preview;", result_format="list", max_rows=5)
+        submitted = mock_session.sql.call_args.args[0]
+        assert submitted.startswith("SELECT * FROM (\nSELECT id FROM big -- preview\n)")
+        assert submitted.endswith("LIMIT 6")
+        assert len(result.sql_return) == 5
+        assert result.execution_stats["truncated"] and result.row_count == 5
+
+        assert connector.execute_arrow("SELECT id FROM big", max_rows=5).data.num_rows == 5
+        assert connector.execute_query("SELECT id FROM big", max_rows=10).execution_stats["truncated"] is False
+
+        df = connector.execute_query_to_df("SELECT id FROM big", max_rows=3)
+        assert len(df) == 3 and df.attrs["truncated"]
+
+        connector.close()
+
+    @patch('datus_clickzetta.connector.parse_sql_type', return_value="METADATA_SHOW")
+    @patch('datus_clickzetta.connector.Session')
+    def test_unwrappable_statement_stops_fetching(self, mock_session_class, _mock_parse):
+        """Test that statements that cannot take a LIMIT stop pulling batches at the cap."""
+        from datus_clickzetta.connector import ClickZettaConnector
+        import pyarrow as pa
+
+        mock_session = MagicMock()
+        mock_session_class.builder.configs.return_value.create.return_value = mock_session
+        pulled = []
+
+        def to_arrow_batches():
+            for start in range(0, 1000, 10):
+                pulled.append(start)
+                yield pa.record_batch({'name': [f"t{i}" for i in range(start, start + 10)]})
+
+        mock_session.sql.return_value.to_arrow_batches.side_effect = to_arrow_batches
+
+        connector = ClickZettaConnector(
+            service="service", username="user", password="pass",
+            instance="instance", workspace="workspace"
+        )
+
+        result = connector.execute_query("SHOW TABLES", result_format="arrow", max_rows=15)
+        assert mock_session.sql.call_args.args[0] == "SHOW TABLES"
+        assert result.sql_return.num_rows == 15 and result.execution_stats["truncated"]
+        assert pulled == [0, 10]
+
+        connector.close()
+
+
+@pytest.mark.usefixtures("mock_datus_modules")
+class TestExecutionStats:
+    """Test suite for per-statement execution statistics."""
+
+    @patch('datus_clickzetta.connector.Session')
+    def test_stats_on_result_and_sink(self, mock_session_class):
+        """Test that phases, job ID and volume reach both the result and the metrics sink."""
+        from datus_clickzetta.connector import ClickZettaConnector
+
+        mock_session = MagicMock()
+        mock_session_class.builder.configs.return_value.create.return_value = mock_session
+        result_handle = mock_session.sql.return_value
+        result_handle.job_id = "job-42"
+        result_handle.to_pandas.return_value = pd.DataFrame({'id': [1, 2, 3]})
+
+        reported = []
+        connector = ClickZettaConnector(
+            service="service", username="user", password="pass",
+            instance="instance", workspace="workspace",
+            metrics_sink=reported.append,
+        )
+
+        result = connector.execute_query("SELECT id FROM t", result_format="list")
+        stats = result.execution_stats
+        assert isinstance(stats, dict)
+        assert [item.as_dict() for item in reported] == [stats]
+        assert stats["job_id"] == "job-42"
+        assert stats["rows"] == 3 and stats["result_bytes"] > 0
+        assert stats["hint_profile"] == "analytical"
+        assert stats["success"]
+        assert stats["total_seconds"] >= stats["submit_seconds"] + stats["fetch_seconds"]
+
+        result_handle.to_pandas.side_effect = RuntimeError("vcluster unavailable")
+        failed = connector.execute_query("SELECT id FROM t")
+        assert not failed.success
+        assert len(reported) == 2
+        assert not reported[-1].success and "vcluster unavailable" in reported[-1].error
+
+        # A failing sink never breaks query execution
+        connector.metrics_sink = MagicMock(side_effect=RuntimeError("sink down"))
+        result_handle.to_pandas.side_effect = None
+        assert connector.execute_query("SELECT id FROM t").success
+
+        connector.close()
+
+
+class TestRealResultModel:
+    """Check stats attachment against the real datus result model, when datus is installed."""
+
+    def test_execution_stats_attach_as_dict(self):
+        """Test that the stats land on ExecuteSQLResult as the dict its field declares."""
+        node_models = pytest.importorskip("datus.schemas.node_models")
+        if not hasattr(node_models.ExecuteSQLResult, "model_fields"):
+            pytest.skip("datus modules are mocked in this session")
+        from datus_clickzetta.connector import ClickZettaConnector
+        from datus_clickzetta.metrics import QueryExecutionStats
+
+        stats = QueryExecutionStats(sql="SELECT 1", rows=5, truncated=True)
+        result = ClickZettaConnector._attach_execution_stats(
+            node_models.ExecuteSQLResult(success=True, sql_query="SELECT 1"), stats
+        )
+
+        assert isinstance(result.execution_stats, dict)
+        assert result.execution_stats["truncated"] is True
+        assert result.model_dump()["execution_stats"]["rows"] == 5
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
\ No newline at end of file
@@ -2,7 +2,7 @@
 # Licensed under the Apache License, Version 2.0.
 # See http://www.apache.org/licenses/LICENSE-2.0 for details.
 
-from typing import Optional
+from typing import Any, Dict, Optional
 
 from pydantic import BaseModel, ConfigDict, Field
 
@@ -20,3 +20,22 @@ class SnowflakeConfig(BaseModel):
     schema_name: Optional[str] = Field(default=None, alias="schema", description="Default schema name")
     role: Optional[str] = Field(default=None, description="Snowflake role to use")
     timeout_seconds: int = Field(default=30, description="Connection timeout in seconds")
+    fetch_concurrency: int = Field(
+        default=4, ge=1, description="Threads downloading result chunks of a query in parallel; 1 fetches serially"
+    )
+    max_concurrent_queries: int = Field(
+        default=1,
+        ge=1,
+        description="Independent SELECTs execute_queries keeps in flight at once; 1 (default) runs batches in order",
+    )
+    ddl_batch_size: int = Field(
+        default=100, ge=1, description="GET_DDL calls combined into one SELECT when fetching DDL for many objects"
+    )
+    connect_on_init: bool = Field(
+        default=False, description="Log in when the connector is created instead of on its first operation"
+    )
+    session_parameters: Dict[str, Any] = Field(
+        default_factory=dict,
+        description="Session parameters applied once at login, e.g. {'QUERY_TAG': 'datus'}. "
+        "PYTHON_CONNECTOR_QUERY_RESULT_FORMAT defaults to ARROW",
+    )
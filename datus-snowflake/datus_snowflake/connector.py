@@ -2,7 +2,13 @@
 # Licensed under the Apache License, Version 2.0.
 # See http://www.apache.org/licenses/LICENSE-2.0 for details.
 
-from typing import Any, Dict, List, Literal, Optional, Sequence, Set, Union, override
+import re
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Any, Deque, Dict, Iterator, List, Literal, Optional, Sequence, Set, Union, override
 
 import pyarrow as pa
 import pyarrow.compute as pc
@@ -17,6 +23,7 @@ from datus.utils.loggings import get_logger
 from datus.utils.sql_utils import parse_context_switch
 from pandas import DataFrame
 from snowflake.connector import Connect, SnowflakeConnection
+from snowflake.connector.cursor import SnowflakeCursor
 from snowflake.connector.errors import (
     DatabaseError,
     DataError,
@@ -35,6 +42,39 @@ from .config import SnowflakeConfig
 
 logger = get_logger(__name__)
 
+# Applied at login; fetch_arrow_all and fetch_pandas_all need Arrow-formatted results
+DEFAULT_SESSION_PARAMETERS: Dict[str, Any] = {"PYTHON_CONNECTOR_QUERY_RESULT_FORMAT": "ARROW"}
+
+# Read-only queries that can run concurrently, unless they refer to session state (see _SESSION_REFERENCE_PATTERN)
+_ASYNC_QUERY_PATTERN = re.compile(r"^\s*\(?\s*(SELECT|WITH)\b", re.IGNORECASE)
+# Results of earlier statements and session variables depend on the order statements run in
+_SESSION_REFERENCE_PATTERN = re.compile(r"\b(LAST_QUERY_ID|RESULT_SCAN)\b|(?<![\w$])\$[A-Za-z_]", re.IGNORECASE)
+
+# Errors meaning the server no longer knows the session; a new login (with the session parameters) is needed
+_SESSION_GONE_ERRNOS = {390111, 390112, 390114}
+
+# Backoff bounds, in seconds, when polling the status of asynchronously submitted queries
+ASYNC_POLL_INTERVAL_MIN = 0.05
+ASYNC_POLL_INTERVAL_MAX = 1.0
+
+
+def _concat_arrow_tables(tables: List[pa.Table]) -> pa.Table:
+    """Concatenate result batches; Snowflake may encode a NUMBER column with different widths per chunk."""
+    try:
+        return pa.concat_tables(tables)
+    except pa.ArrowInvalid:
+        return pa.concat_tables(tables, promote_options="permissive")
+
+
+class _FetchedBatch:
+    """Result batch stand-in for a result that was already fetched."""
+
+    def __init__(self, table: pa.Table):
+        self._table = table
+
+    def to_arrow(self) -> pa.Table:
+        return self._table
+
 
 def _handle_snowflake_exception(e: Exception, sql: str = "") -> DatusException:
     """Handle Snowflake exceptions and map to appropriate Datus ErrorCode."""
@@ -95,10 +135,63 @@ class SnowflakeConnector(BaseSqlConnector, SchemaNamespaceMixin, MaterializedVie
             raise TypeError(f"config must be SnowflakeConfig or dict, got {type(config)}")
 
         self.snowflake_config = config
+        # Logging in is deferred to the first operation, see the connection property. Set up before the base
+        # class initialiser, which resets ``self.connection`` through the property setter.
+        self._connection: Optional[SnowflakeConnection] = None
+        self._connection_lock = threading.Lock()
 
         conn_config = ConnectionConfig(timeout_seconds=config.timeout_seconds)
         super().__init__(config=conn_config, dialect=DBType.SNOWFLAKE)
-        self.connection: SnowflakeConnection = Connect(
+        self.session_parameters: Dict[str, Any] = {**DEFAULT_SESSION_PARAMETERS, **config.session_parameters}
+        self.database_name = config.database or ""
+        self.schema_name = config.schema_name or ""
+        if config.connect_on_init:
+            self.warm()
+
+    @property
+    def connection(self) -> SnowflakeConnection:
+        """The Snowflake connection, logging in on first access."""
+        connection = self._connection
+        if connection is None:
+            with self._connection_lock:
+                if self._connection is None:
+                    self._connection = self._connect()
+                connection = self._connection
+        return connection
+
+    @connection.setter
+    def connection(self, connection: Optional[SnowflakeConnection]):
+        with self._connection_lock:
+            self._connection = connection
+
+    @property
+    def is_connected(self) -> bool:
+        """Whether a login has happened and the session is still open."""
+        connection = self._connection
+        return connection is not None and not connection.is_closed()
+
+    @override
+    def connect(self):
+        """Log in to Snowflake now instead of on the first operation."""
+        try:
+            _ = self.connection
+        except Exception as e:
+            raise _handle_snowflake_exception(e) from e
+
+    def warm(self) -> "SnowflakeConnector":
+        """Eagerly log in, for deployments that prefer paying the login cost up front. Returns the connector."""
+        self.connect()
+        return self
+
+    def _connect(self) -> SnowflakeConnection:
+        """
+        Log in to Snowflake; session parameters travel with the login request, so they cost no round-trip.
+
+        The current database/schema context is restored when it differs from the configured one (after a
+        reconnect). Caller holds the connection lock.
+        """
+        config = self.snowflake_config
+        connection = Connect(
             account=config.account,
             user=config.username,
             password=config.password,
@@ -108,13 +201,50 @@ class SnowflakeConnector(BaseSqlConnector, SchemaNamespaceMixin, MaterializedVie
             login_timeout=config.timeout_seconds,
             network_timeout=config.timeout_seconds,
             socket_timeout=config.timeout_seconds,
+            session_parameters=dict(self.session_parameters),
         )
-        self.database_name = config.database or ""
-        self.schema_name = config.schema_name or ""
+        if (self.database_name, self.schema_name) != (config.database or "", config.schema_name or ""):
+            sql = self._use_context_sql(self.database_name, self.schema_name)
+            if sql:
+                with connection.cursor() as cursor:
+                    cursor.execute(sql)
+        return connection
+
+    def _session(self) -> SnowflakeConnection:
+        """
+        Return an open connection, logging in again if the session was closed or reset.
+
+        Session parameters are only sent with a login, so a statement that alters them keeps its effect until the
+        session is re-established.
+        """
+        connection = self._connection
+        if connection is not None and connection.is_closed():
+            logger.info("Snowflake session was closed, reconnecting")
+            self._drop_connection(connection)
+        return self.connection
+
+    def _drop_connection(self, connection: SnowflakeConnection):
+        """Forget ``connection`` so the next access logs in again, unless another thread already replaced it."""
+        with self._connection_lock:
+            if self._connection is connection:
+                self._connection = None
+
+    @contextmanager
+    def _cursor(self) -> Iterator[SnowflakeCursor]:
+        """Open a cursor on a live session; every statement the connector runs goes through here."""
+        connection = self._session()
+        try:
+            with connection.cursor() as cursor:
+                yield cursor
+        except Exception as e:
+            if getattr(e, "errno", None) in _SESSION_GONE_ERRNOS:
+                logger.info(f"Snowflake session is gone ({e}), logging in again on next use")
+                self._drop_connection(connection)
+            raise
 
     def test_connection(self) -> Dict[str, Any]:
         """Test the database connection."""
-        with self.connection.cursor() as cursor:
+        with self._cursor() as cursor:
             cursor.execute("SELECT 1")
             cursor.fetchall()
             return {
@@ -124,8 +254,11 @@ class SnowflakeConnector(BaseSqlConnector, SchemaNamespaceMixin, MaterializedVie
             }
 
     def close(self):
-        """Close the database connection."""
-        self.connection.close()
+        """Close the database connection, if one was opened."""
+        with self._connection_lock:
+            connection, self._connection = self._connection, None
+        if connection is not None:
+            connection.close()
 
     def get_type(self) -> str:
         """Return the database type."""
@@ -141,20 +274,22 @@ class SnowflakeConnector(BaseSqlConnector, SchemaNamespaceMixin, MaterializedVie
 
     def do_switch_context(self, catalog_name: str = "", database_name: str = "", schema_name: str = ""):
         """Switch database or schema context."""
+        sql = self._use_context_sql(database_name, schema_name)
+        if not sql:
+            return
         try:
-            with self.connection.cursor() as cursor:
-                if not schema_name:
-                    if not database_name:
-                        return
-                    sql = f'USE DATABASE "{database_name}"'
-                else:
-                    sql = (
-                        f'USE SCHEMA "{schema_name}"' if not database_name else f'USE "{database_name}"."{schema_name}"'
-                    )
+            with self._cursor() as cursor:
                 cursor.execute(sql)
         except Exception as e:
             raise _handle_snowflake_exception(e, sql) from e
 
+    @staticmethod
+    def _use_context_sql(database_name: str = "", schema_name: str = "") -> str:
+        """Build the USE statement for a database/schema context, or an empty string when neither is set."""
+        if not schema_name:
+            return f'USE DATABASE "{database_name}"' if database_name else ""
+        return f'USE SCHEMA "{schema_name}"' if not database_name else f'USE "{database_name}"."{schema_name}"'
+
     def validate_input(self, input_params: Dict[str, Any]):
         """Validate input parameters."""
         super().validate_input(input_params)
@@ -167,26 +302,103 @@ class SnowflakeConnector(BaseSqlConnector, SchemaNamespaceMixin, MaterializedVie
     ) -> tuple[pa.Table, int]:
         """Execute SQL query and return results in Apache Arrow format."""
         try:
-            with self.connection.cursor() as cursor:
-                cursor.execute("ALTER SESSION SET PYTHON_CONNECTOR_QUERY_RESULT_FORMAT='ARROW'")
+            with self._cursor() as cursor:
                 cursor.execute(sql_query, params)
-                return cursor.fetch_arrow_all(force_return_table=True), cursor.rowcount
+                return self._fetch_arrow(cursor)
         except Exception as e:
             raise _handle_snowflake_exception(e, sql_query)
 
+    def _fetch_arrow(self, cursor) -> tuple[pa.Table, int]:
+        """Fetch the whole result as one Arrow table, downloading chunks concurrently when there are several."""
+        batches = cursor.get_result_batches() if self._fetch_concurrency() > 1 else None
+        if not batches or len(batches) == 1:
+            return cursor.fetch_arrow_all(force_return_table=True), cursor.rowcount
+        return _concat_arrow_tables(list(self._fetch_result_batches(batches))), cursor.rowcount
+
+    def execute_arrow_iterator(
+        self,
+        sql: str,
+        params: Optional[Sequence[Any] | dict[Any, Any]] = None,
+        concurrency: Optional[int] = None,
+    ) -> Iterator[pa.RecordBatch]:
+        """
+        Execute a query and stream its result as Arrow record batches, in result order.
+
+        Result chunks are downloaded by up to ``concurrency`` threads (default ``fetch_concurrency`` from the
+        config) while earlier batches are consumed, so at most that many chunks are held in memory. At least
+        one (possibly empty) batch is always yielded so callers can read the result schema.
+        """
+        try:
+            with self._cursor() as cursor:
+                cursor.execute(sql, params)
+                batches = cursor.get_result_batches()
+                if not batches:
+                    batches = [_FetchedBatch(cursor.fetch_arrow_all(force_return_table=True))]
+        except Exception as e:
+            raise _handle_snowflake_exception(e, sql) from e
+
+        schema = None
+        yielded = False
+        try:
+            for table in self._fetch_result_batches(batches, concurrency):
+                schema = table.schema
+                for record_batch in table.to_batches():
+                    yielded = True
+                    yield record_batch
+        except Exception as e:
+            raise _handle_snowflake_exception(e, sql) from e
+        if not yielded and schema is not None:
+            yield pa.RecordBatch.from_pylist([], schema=schema)
+
+    def _fetch_concurrency(self, concurrency: Optional[int] = None) -> int:
+        return max(1, concurrency if concurrency is not None else self.snowflake_config.fetch_concurrency)
+
+    def _fetch_result_batches(self, batches: Sequence[Any], concurrency: Optional[int] = None) -> Iterator[pa.Table]:
+        """
+        Download result batches as Arrow tables, yielding them in order.
+
+        Up to ``concurrency`` downloads run ahead of the consumer on a bounded thread pool; pending downloads
+        are cancelled if the consumer stops early.
+        """
+        concurrency = self._fetch_concurrency(concurrency)
+        if concurrency <= 1 or len(batches) <= 1:
+            for batch in batches:
+                yield batch.to_arrow()
+            return
+
+        remaining = iter(batches)
+        pending: Deque[Future] = deque()
+        with ThreadPoolExecutor(
+            max_workers=min(concurrency, len(batches)), thread_name_prefix="snowflake-fetch"
+        ) as executor:
+            try:
+                for batch in remaining:
+                    pending.append(executor.submit(batch.to_arrow))
+                    if len(pending) >= concurrency:
+                        break
+                while pending:
+                    table = pending.popleft().result()
+                    next_batch = next(remaining, None)
+                    if next_batch is not None:
+                        pending.append(executor.submit(next_batch.to_arrow))
+                    yield table
+            finally:
+                for future in pending:
+                    future.cancel()
+
     def execute_query_to_df(
         self,
         sql: str,
         params: Sequence[Any] | dict[Any, Any] | None = None,
     ) -> DataFrame:
         """Execute query and return pandas DataFrame."""
-        with self.connection.cursor() as cursor:
+        with self._cursor() as cursor:
             cursor.execute(sql, params)
             return cursor.fetch_pandas_all()
 
     def execute_query_to_dict(self, sql: str) -> List[Dict[str, Any]]:
         """Execute query and return list of dictionaries."""
-        with self.connection.cursor() as cursor:
+        with self._cursor() as cursor:
             cursor.execute(sql)
             query_result = cursor.fetchall()
             if not query_result or isinstance(query_result[0], dict):
@@ -208,7 +420,7 @@ class SnowflakeConnector(BaseSqlConnector, SchemaNamespaceMixin, MaterializedVie
     def execute_insert(self, sql: str) -> ExecuteSQLResult:
         """Execute INSERT statement."""
         try:
-            with self.connection.cursor() as cursor:
+            with self._cursor() as cursor:
                 cursor.execute(sql)
                 rowcount = cursor.rowcount
                 last_rowid = cursor.sfqid
@@ -241,7 +453,7 @@ class SnowflakeConnector(BaseSqlConnector, SchemaNamespaceMixin, MaterializedVie
     def _execute_update_or_delete(self, sql: str) -> ExecuteSQLResult:
         """Execute UPDATE or DELETE statement."""
         try:
-            with self.connection.cursor() as cursor:
+            with self._cursor() as cursor:
                 cursor.execute(sql)
                 rowcount = cursor.rowcount
 
@@ -264,7 +476,7 @@ class SnowflakeConnector(BaseSqlConnector, SchemaNamespaceMixin, MaterializedVie
     def execute_content_set(self, sql_query: str) -> ExecuteSQLResult:
         """Execute context switch statement (USE DATABASE/SCHEMA)."""
         try:
-            with self.connection.cursor() as cursor:
+            with self._cursor() as cursor:
                 cursor.execute(sql_query)
             switch_context = parse_context_switch(sql=sql_query, dialect=self.dialect)
             if switch_context:
@@ -311,7 +523,7 @@ class SnowflakeConnector(BaseSqlConnector, SchemaNamespaceMixin, MaterializedVie
         """Execute SHOW command with special handling."""
         sql = sql.strip()
         try:
-            with self.connection.cursor() as cursor:
+            with self._cursor() as cursor:
                 cursor.execute(sql)
                 result = cursor.fetchall()
                 col_names = [col[0] for col in cursor.description][:7]
@@ -345,55 +557,164 @@ class SnowflakeConnector(BaseSqlConnector, SchemaNamespaceMixin, MaterializedVie
         """Execute query and return Arrow table."""
         try:
             arrow_table, row_count = self._do_execute_arrow(sql)
-            if arrow_table is None:
-                logger.debug(f"Arrow table is None for query. Row count: {row_count}")
-                row_count = 0
-                arrow_table = None
-            else:
-                row_count = arrow_table.num_rows
-
-            return ExecuteSQLResult(
-                sql_query=sql,
-                row_count=row_count,
-                sql_return=arrow_table,
-                success=True,
-                error=None,
-                result_format="arrow",
-            )
+            return self._arrow_result(sql, arrow_table, row_count)
         except DatusException as e:
             return ExecuteSQLResult(success=False, sql_query=sql, error=str(e))
 
+    @staticmethod
+    def _arrow_result(sql: str, arrow_table: Optional[pa.Table], row_count: int) -> ExecuteSQLResult:
+        if arrow_table is None:
+            logger.debug(f"Arrow table is None for query. Row count: {row_count}")
+            row_count = 0
+        else:
+            row_count = arrow_table.num_rows
+
+        return ExecuteSQLResult(
+            sql_query=sql,
+            row_count=row_count,
+            sql_return=arrow_table,
+            success=True,
+            error=None,
+            result_format="arrow",
+        )
+
     def execute_pandas(self, sql: str) -> ExecuteSQLResult:
         """Execute query and return pandas DataFrame."""
         try:
             df = self.execute_query_to_df(sql)
-            return ExecuteSQLResult(
-                sql_query=sql,
-                row_count=len(df),
-                sql_return=df,
-                success=True,
-                error=None,
-                result_format="pandas",
-            )
+            return self._pandas_result(sql, df)
         except Exception as e:
             ex = _handle_snowflake_exception(e, sql)
             return ExecuteSQLResult(success=False, sql_query=sql, result_format="pandas", error=str(ex))
 
+    @staticmethod
+    def _pandas_result(sql: str, df: DataFrame) -> ExecuteSQLResult:
+        return ExecuteSQLResult(
+            sql_query=sql,
+            row_count=len(df),
+            sql_return=df,
+            success=True,
+            error=None,
+            result_format="pandas",
+        )
+
     def execute_csv(self, query: str) -> ExecuteSQLResult:
         """Execute query and return CSV string."""
-        result = self.execute_pandas(query)
+        return self._pandas_to_csv_result(self.execute_pandas(query))
+
+    @staticmethod
+    def _pandas_to_csv_result(result: ExecuteSQLResult) -> ExecuteSQLResult:
         result.result_format = "csv"
         if result.success and result.row_count > 0:
             result.sql_return = result.sql_return.to_csv(index=False)
         return result
 
     def execute_queries(self, queries: List[str]) -> List[ExecuteSQLResult]:
-        """Execute multiple queries."""
-        return [self.execute_query(sql) for sql in queries]
+        """
+        Execute multiple queries and return CSV results in input order.
+
+        With ``max_concurrent_queries`` above 1, a batch made only of independent SELECT/WITH queries is submitted
+        asynchronously and run concurrently, see ``_execute_queries_async``. Any other batch runs one by one.
+        """
+        if not self._can_run_concurrently(queries):
+            return [self.execute_query(sql) for sql in queries]
+        return self._execute_queries_async(queries, "csv")
 
     def execute_queries_arrow(self, queries: List[str]) -> List[ExecuteSQLResult]:
-        """Execute multiple queries and return Arrow results."""
-        return [self.execute_arrow(sql) for sql in queries]
+        """Execute multiple queries and return Arrow results in input order; see ``execute_queries``."""
+        if not self._can_run_concurrently(queries):
+            return [self.execute_arrow(sql) for sql in queries]
+        return self._execute_queries_async(queries, "arrow")
+
+    def _max_concurrent_queries(self) -> int:
+        return max(1, self.snowflake_config.max_concurrent_queries)
+
+    def _can_run_concurrently(self, queries: List[str]) -> bool:
+        """
+        Whether ``queries`` may run concurrently: enabled, more than one, and every statement a SELECT/WITH query
+        that does not refer to the results of earlier statements or to session variables.
+        """
+        if self._max_concurrent_queries() <= 1 or len(queries) <= 1:
+            return False
+        return all(_ASYNC_QUERY_PATTERN.match(sql) and not _SESSION_REFERENCE_PATTERN.search(sql) for sql in queries)
+
+    def _execute_queries_async(
+        self, queries: List[str], result_format: Literal["csv", "arrow"]
+    ) -> List[ExecuteSQLResult]:
+        """
+        Run ``queries`` with up to ``max_concurrent_queries`` of them in flight at once.
+
+        Queries are submitted with ``execute_async`` and their query IDs polled together; each result is fetched as
+        soon as its query completes and stored at the query's position. Callers check ``_can_run_concurrently``
+        first, so every query here is independent of the others.
+        """
+        limit = self._max_concurrent_queries()
+        results: List[Optional[ExecuteSQLResult]] = [None] * len(queries)
+        in_flight: Dict[str, tuple[int, str]] = {}
+
+        def wait_until(max_in_flight: int):
+            interval = ASYNC_POLL_INTERVAL_MIN
+            while len(in_flight) > max_in_flight:
+                completed = False
+                for query_id, (index, sql) in list(in_flight.items()):
+                    try:
+                        status = self.connection.get_query_status(query_id)
+                        if self.connection.is_still_running(status):
+                            continue
+                    except Exception as e:
+                        logger.debug(f"Failed to poll Snowflake query {query_id}: {e}")
+                    del in_flight[query_id]
+                    results[index] = self._collect_async_result(query_id, sql, result_format)
+                    completed = True
+                if completed:
+                    interval = ASYNC_POLL_INTERVAL_MIN
+                elif len(in_flight) > max_in_flight:
+                    time.sleep(interval)
+                    interval = min(interval * 2, ASYNC_POLL_INTERVAL_MAX)
+
+        try:
+            for index, sql in enumerate(queries):
+                wait_until(limit - 1)
+                try:
+                    with self._cursor() as cursor:
+                        cursor.execute_async(sql)
+                        in_flight[cursor.sfqid] = (index, sql)
+                except Exception as e:
+                    results[index] = self._failed_result(sql, result_format, e)
+            wait_until(0)
+        finally:
+            for query_id in in_flight:
+                self._abort_query(query_id)
+        return results
+
+    def _collect_async_result(
+        self, query_id: str, sql: str, result_format: Literal["csv", "arrow"]
+    ) -> ExecuteSQLResult:
+        """Fetch the result of a finished asynchronous query; failed queries raise here and become failed results."""
+        try:
+            with self._cursor() as cursor:
+                cursor.get_results_from_sfqid(query_id)
+                if result_format == "arrow":
+                    arrow_table, row_count = self._fetch_arrow(cursor)
+                    return self._arrow_result(sql, arrow_table, row_count)
+                return self._pandas_to_csv_result(self._pandas_result(sql, cursor.fetch_pandas_all()))
+        except Exception as e:
+            return self._failed_result(sql, result_format, e)
+
+    @staticmethod
+    def _failed_result(sql: str, result_format: Literal["csv", "arrow"], e: Exception) -> ExecuteSQLResult:
+        ex = e if isinstance(e, DatusException) else _handle_snowflake_exception(e, sql)
+        if result_format == "arrow":
+            return ExecuteSQLResult(success=False, sql_query=sql, error=str(ex))
+        return ExecuteSQLResult(success=False, sql_query=sql, result_format=result_format, error=str(ex))
+
+    def _abort_query(self, query_id: str):
+        """Best-effort cancel of a query left running because the batch was interrupted."""
+        try:
+            with self._cursor() as cursor:
+                cursor.execute(f"SELECT SYSTEM$CANCEL_QUERY('{query_id}')")
+        except Exception as e:
+            logger.debug(f"Failed to cancel Snowflake query {query_id}: {e}")
 
     @override
     def get_databases(self, catalog_name: str = "", include_sys: bool = False) -> List[str]:
@@ -421,7 +742,7 @@ class SnowflakeConnector(BaseSqlConnector, SchemaNamespaceMixin, MaterializedVie
             sql = "SHOW SCHEMAS"
 
         try:
-            with self.connection.cursor() as cursor:
+            with self._cursor() as cursor:
                 cursor.execute(sql)
                 results = cursor.fetchall()
 
@@ -657,7 +978,7 @@ class SnowflakeConnector(BaseSqlConnector, SchemaNamespaceMixin, MaterializedVie
         describe_sql = f"DESCRIBE {describe_target} {full_name}"
 
         try:
-            with self.connection.cursor() as cursor:
+            with self._cursor() as cursor:
                 cursor.execute(describe_sql)
                 describe_results = cursor.fetchall()
                 column_names = [col[0].lower() for col in cursor.description]
@@ -713,7 +1034,7 @@ class SnowflakeConnector(BaseSqlConnector, SchemaNamespaceMixin, MaterializedVie
 
     def _fetch_object_ddl(self, object_type: str, full_name: str) -> str:
         """Retrieve DDL for a database object."""
-        with self.connection.cursor() as cursor:
+        with self._cursor() as cursor:
             sql = f"SELECT GET_DDL('{object_type}', '{full_name}', true)"
             try:
                 cursor.execute(sql)
@@ -724,6 +1045,45 @@ class SnowflakeConnector(BaseSqlConnector, SchemaNamespaceMixin, MaterializedVie
                 ddl = f"-- DDL not available for {object_type.lower()} {full_name}: {e}"
         return ddl
 
+    def _fetch_object_ddls(self, object_type: str, full_names: List[str]) -> List[str]:
+        """
+        Retrieve DDL for many objects of one type, ``ddl_batch_size`` GET_DDL expressions per SELECT.
+
+        A batch that fails (for example because one object was dropped or is not accessible) is retried one
+        object at a time, so a single bad object only costs its own DDL.
+        """
+        ddls: List[str] = []
+        batch_size = max(1, self.snowflake_config.ddl_batch_size)
+        for start in range(0, len(full_names), batch_size):
+            batch = full_names[start : start + batch_size]
+            if len(batch) == 1:
+                ddls.append(self._fetch_object_ddl(object_type, batch[0]))
+                continue
+            sql = "SELECT " + ", ".join(f"GET_DDL('{object_type}', '{full_name}', true)" for full_name in batch)
+            try:
+                with self._cursor() as cursor:
+                    cursor.execute(sql)
+                    row = cursor.fetchone()
+                ddls.extend(row if row else [""] * len(batch))
+            except Exception as e:
+                logger.warning(f"Failed to get DDL for {len(batch)} objects in one query, fetching one by one: {e}")
+                ddls.extend(self._fetch_object_ddl(object_type, full_name) for full_name in batch)
+        return ddls
+
+    def _attach_ddl(self, entries: List[Dict[str, str]], object_type: str) -> List[Dict[str, str]]:
+        """Set ``definition`` on each metadata entry."""
+        full_names = [
+            (
+                f'{_to_sql_literal(entry["database_name"])}.'
+                f'{_to_sql_literal(entry["schema_name"])}.'
+                f'{_to_sql_literal(entry["table_name"])}'
+            ).strip()
+            for entry in entries
+        ]
+        for entry, ddl in zip(entries, self._fetch_object_ddls(object_type, full_names)):
+            entry["definition"] = ddl
+        return entries
+
     @override
     def get_tables_with_ddl(
         self,
@@ -744,15 +1104,7 @@ class SnowflakeConnector(BaseSqlConnector, SchemaNamespaceMixin, MaterializedVie
         if not table_entries:
             return []
 
-        for entry in table_entries:
-            full_name = (
-                f'{_to_sql_literal(entry["database_name"])}.'
-                f'{_to_sql_literal(entry["schema_name"])}.'
-                f'{_to_sql_literal(entry["table_name"])}'
-            ).strip()
-            entry["definition"] = self._fetch_object_ddl("TABLE", full_name)
-
-        return table_entries
+        return self._attach_ddl(table_entries, "TABLE")
 
     def get_views_with_ddl(
         self, catalog_name: str = "", database_name: str = "", schema_name: str = ""
@@ -768,15 +1120,7 @@ class SnowflakeConnector(BaseSqlConnector, SchemaNamespaceMixin, MaterializedVie
         if not view_entries:
             return []
 
-        for entry in view_entries:
-            full_name = (
-                f'{_to_sql_literal(entry["database_name"])}.'
-                f'{_to_sql_literal(entry["schema_name"])}.'
-                f'{_to_sql_literal(entry["table_name"])}'
-            ).strip()
-            entry["definition"] = self._fetch_object_ddl("VIEW", full_name)
-
-        return view_entries
+        return self._attach_ddl(view_entries, "VIEW")
 
     def get_materialized_views_with_ddl(
         self, catalog_name: str = "", database_name: str = "", schema_name: str = ""
@@ -792,15 +1136,7 @@ class SnowflakeConnector(BaseSqlConnector, SchemaNamespaceMixin, MaterializedVie
         if not mv_entries:
             return []
 
-        for entry in mv_entries:
-            full_name = (
-                f'{_to_sql_literal(entry["database_name"])}.'
-                f'{_to_sql_literal(entry["schema_name"])}.'
-                f'{_to_sql_literal(entry["table_name"])}'
-            ).strip()
-            entry["definition"] = self._fetch_object_ddl("MATERIALIZED VIEW", full_name)
-
-        return mv_entries
+        return self._attach_ddl(mv_entries, "MATERIALIZED VIEW")
 
     @override
     def get_sample_rows(
@@ -818,7 +1154,7 @@ class SnowflakeConnector(BaseSqlConnector, SchemaNamespaceMixin, MaterializedVie
         database_name = database_name or self.database_name
         schema_name = schema_name or self.schema_name
 
-        with self.connection.cursor() as cursor:
+        with self._cursor() as cursor:
             if tables:
                 for table in tables:
                     full_name = self.full_name(
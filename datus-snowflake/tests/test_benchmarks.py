@@ -0,0 +1,155 @@
+# Copyright 2025-present DatusAI, Inc.
+# Licensed under the Apache License, Version 2.0.
+# See http://www.apache.org/licenses/LICENSE-2.0 for details.
+
+"""
+Latency benchmarks against a live Snowflake account.
+
+Skipped unless Snowflake credentials are provided and ``SNOWFLAKE_BENCHMARK=1``; run with ``pytest -s`` to see
+the timings. ``SNOWFLAKE_BENCHMARK_ROUNDS`` sets the number of timed calls per benchmark (default 20).
+"""
+
+import os
+import statistics
+import time
+from typing import Callable, Generator, List
+
+import pytest
+from datus_snowflake import SnowflakeConfig, SnowflakeConnector
+
+pytestmark = pytest.mark.skipif(
+    not all(
+        [
+            os.getenv("SNOWFLAKE_ACCOUNT"),
+            os.getenv("SNOWFLAKE_USER"),
+            os.getenv("SNOWFLAKE_PASSWORD"),
+            os.getenv("SNOWFLAKE_WAREHOUSE"),
+            os.getenv("SNOWFLAKE_BENCHMARK") == "1",
+        ]
+    ),
+    reason="Snowflake benchmarks need credentials and SNOWFLAKE_BENCHMARK=1",
+)
+
+ROUNDS = int(os.getenv("SNOWFLAKE_BENCHMARK_ROUNDS", "20"))
+SMALL_QUERY = "SELECT 1 AS num"
+LARGE_ROWS = int(os.getenv("SNOWFLAKE_BENCHMARK_LARGE_ROWS", "5000000"))
+LARGE_QUERY = (
+    "SELECT SEQ8() AS id, LPAD(TO_VARCHAR(SEQ8()), 200, 'x') AS payload "
+    f"FROM TABLE(GENERATOR(ROWCOUNT => {LARGE_ROWS}))"
+)
+
+
+@pytest.fixture(scope="module")
+def config() -> SnowflakeConfig:
+    return SnowflakeConfig(
+        account=os.getenv("SNOWFLAKE_ACCOUNT", ""),
+        username=os.getenv("SNOWFLAKE_USER", ""),
+        password=os.getenv("SNOWFLAKE_PASSWORD", ""),
+        warehouse=os.getenv("SNOWFLAKE_WAREHOUSE", ""),
+        database=os.getenv("SNOWFLAKE_DATABASE"),
+        schema=os.getenv("SNOWFLAKE_SCHEMA"),
+    )
+
+
+@pytest.fixture(scope="module")
+def connector(config: SnowflakeConfig) -> Generator[SnowflakeConnector, None, None]:
+    conn = SnowflakeConnector(config).warm()
+    yield conn
+    conn.close()
+
+
+def _time_calls(name: str, func: Callable[[], object], rounds: int = ROUNDS) -> List[float]:
+    """Call ``func`` once untimed, then ``rounds`` timed times, and print the median and minimum."""
+    func()
+    timings = []
+    for _ in range(rounds):
+        started = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - started)
+    print(f"\n{name:<40} median {statistics.median(timings) * 1000:8.2f}ms  min {min(timings) * 1000:8.2f}ms")
+    return timings
+
+
+def test_small_query_latency(connector: SnowflakeConnector):
+    """Small Arrow queries cost one round-trip; the per-query ALTER SESSION they used to run is shown for reference."""
+
+    def per_query_alter_session():
+        with connector.connection.cursor() as cursor:
+            cursor.execute("ALTER SESSION SET PYTHON_CONNECTOR_QUERY_RESULT_FORMAT='ARROW'")
+            cursor.execute(SMALL_QUERY)
+            return cursor.fetch_arrow_all(force_return_table=True)
+
+    def execute_arrow():
+        result = connector.execute_arrow(SMALL_QUERY)
+        assert result.success
+        return result
+
+    baseline = _time_calls("small query [ALTER SESSION per query]", per_query_alter_session)
+    current = _time_calls("small query [execute_arrow]", execute_arrow)
+    assert statistics.median(current) < statistics.median(baseline)
+
+
+def test_connector_construction(config: SnowflakeConfig):
+    """Creating connectors for several namespaces stays cheap because nobody logs in until first use."""
+    namespaces = 5
+
+    def construct():
+        for _ in range(namespaces):
+            SnowflakeConnector(config)
+
+    def construct_and_warm():
+        for _ in range(namespaces):
+            SnowflakeConnector(config).warm().close()
+
+    lazy = _time_calls(f"construct {namespaces} connectors [lazy]", construct, rounds=5)
+    eager = _time_calls(f"construct {namespaces} connectors [warm]", construct_and_warm, rounds=3)
+    assert statistics.median(lazy) < statistics.median(eager)
+
+
+@pytest.mark.parametrize("fetch_concurrency", [1, 8])
+def test_large_result_fetch(config: SnowflakeConfig, fetch_concurrency: int):
+    """Downloading a multi-chunk result serially and with a pool of fetch threads."""
+    conn = SnowflakeConnector(config.model_copy(update={"fetch_concurrency": fetch_concurrency}))
+    try:
+        # After the untimed first round the query is answered from the result cache, so timings measure the download
+        def fetch():
+            result = conn.execute_arrow(LARGE_QUERY)
+            assert result.row_count == LARGE_ROWS
+            return result
+
+        _time_calls(f"large result [fetch_concurrency={fetch_concurrency}]", fetch, rounds=3)
+    finally:
+        conn.close()
+
+
+@pytest.mark.parametrize("max_concurrent_queries", [1, 8])
+def test_query_batch(config: SnowflakeConfig, max_concurrent_queries: int):
+    """Evaluating a batch of slow candidate queries serially and with several in flight."""
+    conn = SnowflakeConnector(config.model_copy(update={"max_concurrent_queries": max_concurrent_queries}))
+    queries = [f"SELECT SYSTEM$WAIT(1) AS waited, {i} AS candidate" for i in range(16)]
+    try:
+
+        def run_batch():
+            results = conn.execute_queries_arrow(queries)
+            assert all(result.success for result in results)
+            return results
+
+        _time_calls(f"16 x 1s queries [max_concurrent_queries={max_concurrent_queries}]", run_batch, rounds=2)
+    finally:
+        conn.close()
+
+
+@pytest.mark.parametrize("ddl_batch_size", [1, 100])
+def test_get_tables_with_ddl(config: SnowflakeConfig, ddl_batch_size: int):
+    """Fetching DDL for every table of the configured schema, one GET_DDL per query and batched."""
+    if not (config.database and config.schema_name):
+        pytest.skip("needs SNOWFLAKE_DATABASE and SNOWFLAKE_SCHEMA")
+    conn = SnowflakeConnector(config.model_copy(update={"ddl_batch_size": ddl_batch_size}))
+    try:
+        _time_calls(
+            f"get_tables_with_ddl [ddl_batch_size={ddl_batch_size}]",
+            lambda: conn.get_tables_with_ddl(database_name=config.database, schema_name=config.schema_name),
+            rounds=3,
+        )
+    finally:
+        conn.close()
@@ -83,6 +83,53 @@ def test_connection_with_dict():
     conn.close()
 
 
+def test_connection_is_lazy(config: SnowflakeConfig):
+    """Test that logging in is deferred to the first operation and repeated after close."""
+    conn = SnowflakeConnector(config)
+    assert not conn.is_connected
+
+    assert conn.test_connection()["success"] is True
+    assert conn.is_connected
+
+    conn.close()
+    assert not conn.is_connected
+    assert conn.execute_query("SELECT 1 as num", result_format="list").sql_return == [{"num": 1}]
+    conn.close()
+
+
+def test_warm_logs_in_eagerly(config: SnowflakeConfig):
+    """Test warm() and connect_on_init log in before any query runs."""
+    conn = SnowflakeConnector(config).warm()
+    assert conn.is_connected
+    conn.close()
+
+    conn = SnowflakeConnector(config.model_copy(update={"connect_on_init": True}))
+    assert conn.is_connected
+    conn.close()
+
+
+def _session_query_tag(connector: SnowflakeConnector) -> str:
+    result = connector.execute_query("SHOW PARAMETERS LIKE 'QUERY_TAG' IN SESSION", result_format="list")
+    return result.sql_return[0]["value"]
+
+
+def test_session_parameters_applied_at_login(config: SnowflakeConfig):
+    """Test that configured session parameters are in effect, left alone by ALTER SESSION and restored on login."""
+    conn = SnowflakeConnector(config.model_copy(update={"session_parameters": {"QUERY_TAG": "datus-test"}}))
+    try:
+        assert _session_query_tag(conn) == "datus-test"
+
+        assert conn.execute_ddl("ALTER SESSION SET QUERY_TAG = 'caller'").success
+        assert conn.execute_query("SELECT 1 as num", result_format="arrow").success
+        assert _session_query_tag(conn) == "caller"
+
+        # SHOW goes through the same session check as every other statement and logs in again
+        conn.connection.close()
+        assert _session_query_tag(conn) == "datus-test"
+    finally:
+        conn.close()
+
+
 # ==================== Database Tests ====================
 
 
@@ -144,6 +191,37 @@ def test_get_tables_with_ddl(connector: SnowflakeConnector, config: SnowflakeCon
             assert "identifier" in table
 
 
+def test_get_tables_with_ddl_batched(config: SnowflakeConfig):
+    """Test that DDL fetched in batches matches DDL fetched one object at a time."""
+    if not (config.database and config.schema_name):
+        pytest.skip("needs SNOWFLAKE_DATABASE and SNOWFLAKE_SCHEMA")
+    batched = SnowflakeConnector(config.model_copy(update={"ddl_batch_size": 3}))
+    single = SnowflakeConnector(config.model_copy(update={"ddl_batch_size": 1}))
+    try:
+        tables = batched.get_tables_with_ddl(database_name=config.database, schema_name=config.schema_name)
+        expected = single.get_tables_with_ddl(database_name=config.database, schema_name=config.schema_name)
+        assert [t["definition"] for t in tables] == [t["definition"] for t in expected]
+    finally:
+        batched.close()
+        single.close()
+
+
+def test_fetch_object_ddls_falls_back_per_object(connector: SnowflakeConnector, config: SnowflakeConfig):
+    """Test that one missing object does not cost the DDL of the rest of its batch."""
+    if not (config.database and config.schema_name):
+        pytest.skip("needs SNOWFLAKE_DATABASE and SNOWFLAKE_SCHEMA")
+    tables = connector.get_tables(database_name=config.database, schema_name=config.schema_name)
+    if not tables:
+        pytest.skip("the configured schema has no tables")
+    existing = f'"{config.database}"."{config.schema_name}"."{tables[0]}"'
+    missing = f'"{config.database}"."{config.schema_name}"."NONEXISTENT_TABLE_XYZ"'
+
+    ddls = connector._fetch_object_ddls("TABLE", [existing, missing])
+
+    assert "create" in ddls[0].lower()
+    assert ddls[1].startswith("-- DDL not available")
+
+
 # ==================== View Tests ====================
 
 
@@ -277,6 +355,80 @@ def test_execute_show_schemas(connector: SnowflakeConnector, config: SnowflakeCo
         assert isinstance(result.sql_return, list)
 
 
+MULTI_CHUNK_ROWS = 200_000
+MULTI_CHUNK_QUERY = (
+    f"SELECT SEQ4() AS id, RANDSTR(64, RANDOM()) AS payload FROM TABLE(GENERATOR(ROWCOUNT => {MULTI_CHUNK_ROWS})) "
+    "ORDER BY id"
+)
+
+
+def test_execute_arrow_parallel_fetch(connector: SnowflakeConnector, config: SnowflakeConfig):
+    """Test that concurrently fetched result chunks are concatenated in result order."""
+    parallel = connector.execute_arrow(MULTI_CHUNK_QUERY)
+    assert parallel.success
+    assert parallel.row_count == MULTI_CHUNK_ROWS
+    assert parallel.sql_return.column("ID").to_pylist() == list(range(MULTI_CHUNK_ROWS))
+
+    serial_conn = SnowflakeConnector(config.model_copy(update={"fetch_concurrency": 1}))
+    try:
+        serial = serial_conn.execute_arrow(MULTI_CHUNK_QUERY)
+        assert serial.sql_return.column("ID").equals(parallel.sql_return.column("ID"))
+    finally:
+        serial_conn.close()
+
+
+def test_execute_arrow_iterator(connector: SnowflakeConnector):
+    """Test streaming record batches, including the schema-only batch of an empty result."""
+    ids = []
+    for batch in connector.execute_arrow_iterator(MULTI_CHUNK_QUERY, concurrency=8):
+        ids.extend(batch.column(0).to_pylist())
+    assert ids == list(range(MULTI_CHUNK_ROWS))
+
+    empty = list(connector.execute_arrow_iterator("SELECT 1 AS num WHERE 1 = 0"))
+    assert len(empty) == 1 and empty[0].num_rows == 0
+    assert empty[0].schema.names == ["NUM"]
+
+
+def test_execute_queries_async(config: SnowflakeConfig):
+    """Test that concurrently run queries come back in input order, with failures in place."""
+    conn = SnowflakeConnector(config.model_copy(update={"max_concurrent_queries": 4}))
+    try:
+        # Later queries finish first, so completion order is the reverse of input order
+        queries = [f"SELECT SYSTEM$WAIT({3 - i}) AS waited, {i} AS num" for i in range(4)]
+        queries.insert(2, "SELECT * FROM nonexistent_table_xyz")
+
+        results = conn.execute_queries_arrow(queries)
+
+        assert len(results) == len(queries)
+        assert not results[2].success and results[2].error
+        nums = [r.sql_return.column("NUM").to_pylist() for i, r in enumerate(results) if i != 2]
+        assert nums == [[0], [1], [2], [3]]
+
+        csv_results = conn.execute_queries(["SELECT 1 AS num", "SELECT 2 AS num"])
+        assert [r.sql_return.splitlines()[1] for r in csv_results] == ["1", "2"]
+    finally:
+        conn.close()
+
+
+def test_execute_queries_keeps_session_dependent_batches_in_order(config: SnowflakeConfig):
+    """Test that batches with non-SELECT statements or session references run one by one, in order."""
+    conn = SnowflakeConnector(config.model_copy(update={"max_concurrent_queries": 4}))
+    try:
+        results = conn.execute_queries(
+            [
+                "SET datus_test_var = 41",
+                "SELECT $datus_test_var + 1 AS answer",
+                "SELECT 7 AS num",
+                'SELECT "NUM" + 1 AS next_num FROM TABLE(RESULT_SCAN(LAST_QUERY_ID()))',
+            ]
+        )
+        assert all(r.success for r in results)
+        assert results[1].sql_return.splitlines()[1] == "42"
+        assert results[3].sql_return.splitlines()[1] == "8"
+    finally:
+        conn.close()
+
+
 # ==================== Error Handling Tests ====================
 
 
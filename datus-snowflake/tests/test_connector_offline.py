@@ -0,0 +1,317 @@
+# Copyright 2025-present DatusAI, Inc.
+# Licensed under the Apache License, Version 2.0.
+# See http://www.apache.org/licenses/LICENSE-2.0 for details.
+
+"""
+Tests of SnowflakeConnector that need no Snowflake account.
+
+``Connect`` is patched, so every connection and cursor is a mock; the tests check what the connector sends and how
+it reacts to what comes back.
+"""
+
+import re
+import threading
+import time
+from typing import Dict, Generator, List
+from unittest.mock import MagicMock, patch
+
+import pyarrow as pa
+import pytest
+from datus_snowflake import SnowflakeConfig, SnowflakeConnector
+from snowflake.connector.errors import DatabaseError, ProgrammingError
+
+
+@pytest.fixture
+def config() -> SnowflakeConfig:
+    return SnowflakeConfig(
+        account="test_account",
+        username="test_user",
+        password="test_password",
+        warehouse="TEST_WH",
+        database="TEST_DB",
+        schema="PUBLIC",
+    )
+
+
+@pytest.fixture
+def connect() -> Generator[MagicMock, None, None]:
+    """Patched ``Connect``; every login returns the same open mock connection."""
+    with patch("datus_snowflake.connector.Connect") as connect:
+        connect.return_value.is_closed.return_value = False
+        yield connect
+
+
+def _cursor(connect: MagicMock) -> MagicMock:
+    """The cursor handed out by ``with connection.cursor() as cursor``."""
+    return connect.return_value.cursor.return_value.__enter__.return_value
+
+
+# ==================== Lazy Connection Tests ====================
+
+
+def test_construction_does_not_log_in(config: SnowflakeConfig, connect: MagicMock):
+    """Test that building a connector, from a config object or a dict, does not log in."""
+    conn = SnowflakeConnector(config)
+    assert not conn.is_connected
+
+    SnowflakeConnector(config.model_dump(by_alias=True))
+    connect.assert_not_called()
+
+
+def test_first_operation_logs_in_once(config: SnowflakeConfig, connect: MagicMock):
+    """Test that the first operation logs in and later ones reuse the session."""
+    _cursor(connect).fetchall.return_value = [(1,)]
+    conn = SnowflakeConnector(config)
+
+    assert conn.test_connection()["success"] is True
+    assert conn.test_connection()["success"] is True
+    assert conn.is_connected
+    connect.assert_called_once()
+
+
+def test_close_then_reuse_logs_in_again(config: SnowflakeConfig, connect: MagicMock):
+    """Test that close() drops the session and the next operation logs in again."""
+    _cursor(connect).fetchall.return_value = [(1,)]
+    conn = SnowflakeConnector(config)
+    conn.test_connection()
+
+    conn.close()
+    connect.return_value.close.assert_called_once()
+    assert not conn.is_connected
+
+    conn.test_connection()
+    assert connect.call_count == 2
+
+
+def test_warm_logs_in_eagerly(config: SnowflakeConfig, connect: MagicMock):
+    """Test that warm() logs in right away and returns the connector."""
+    conn = SnowflakeConnector(config)
+    assert conn.warm() is conn
+    assert conn.is_connected
+    connect.assert_called_once()
+
+
+def test_connect_on_init_logs_in_eagerly(config: SnowflakeConfig, connect: MagicMock):
+    """Test that connect_on_init logs in while the connector is built."""
+    conn = SnowflakeConnector(config.model_copy(update={"connect_on_init": True}))
+    assert conn.is_connected
+    connect.assert_called_once()
+
+
+# ==================== Session Parameter Tests ====================
+
+
+def test_session_parameters_sent_with_login(config: SnowflakeConfig, connect: MagicMock):
+    """Test that configured session parameters, plus the Arrow result format, travel with the login request."""
+    _cursor(connect).fetchall.return_value = [(1,)]
+    conn = SnowflakeConnector(config.model_copy(update={"session_parameters": {"QUERY_TAG": "datus-test"}}))
+    conn.test_connection()
+
+    assert connect.call_args.kwargs["session_parameters"] == {
+        "PYTHON_CONNECTOR_QUERY_RESULT_FORMAT": "ARROW",
+        "QUERY_TAG": "datus-test",
+    }
+    executed = [c.args[0] for c in _cursor(connect).execute.call_args_list]
+    assert not any("ALTER SESSION" in sql for sql in executed)
+
+
+@pytest.mark.parametrize("errno", [390111, 390112, 390114])
+def test_cursor_logs_in_again_when_session_is_gone(config: SnowflakeConfig, connect: MagicMock, errno: int):
+    """Test that an error saying the server dropped the session makes the next statement log in again."""
+    cursor = _cursor(connect)
+    cursor.execute.side_effect = [DatabaseError(msg="Session no longer exists", errno=errno), None]
+    cursor.fetchall.return_value = [(1,)]
+    conn = SnowflakeConnector(config)
+
+    with pytest.raises(DatabaseError):
+        conn.test_connection()
+    assert not conn.is_connected
+
+    assert conn.test_connection()["success"] is True
+    assert connect.call_count == 2
+
+
+def test_cursor_keeps_session_on_other_errors(config: SnowflakeConfig, connect: MagicMock):
+    """Test that an ordinary statement error does not cost the session."""
+    cursor = _cursor(connect)
+    cursor.execute.side_effect = [DatabaseError(msg="Object does not exist", errno=2003), None]
+    cursor.fetchall.return_value = [(1,)]
+    conn = SnowflakeConnector(config)
+
+    with pytest.raises(DatabaseError):
+        conn.test_connection()
+    conn.test_connection()
+    connect.assert_called_once()
+
+
+# ==================== Result Batch Fetch Tests ====================
+
+
+class _SlowBatch:
+    """Result batch whose download takes longer the earlier it is in the result, so batches finish out of order."""
+
+    ROWS = 10
+
+    def __init__(self, index: int, count: int, finished: List[int], lock: threading.Lock):
+        self.index = index
+        self.count = count
+        self.finished = finished
+        self.lock = lock
+
+    def to_arrow(self) -> pa.Table:
+        time.sleep(0.02 * (self.count - self.index))
+        with self.lock:
+            self.finished.append(self.index)
+        start = self.index * self.ROWS
+        return pa.table({"ID": list(range(start, start + self.ROWS))})
+
+
+def _slow_batches(count: int) -> tuple[List[_SlowBatch], List[int]]:
+    finished: List[int] = []
+    lock = threading.Lock()
+    return [_SlowBatch(index, count, finished, lock) for index in range(count)], finished
+
+
+def test_parallel_fetch_keeps_batch_order(config: SnowflakeConfig, connect: MagicMock):
+    """Test that result batches downloaded concurrently and finishing out of order are concatenated in order."""
+    batches, finished = _slow_batches(6)
+    _cursor(connect).get_result_batches.return_value = batches
+    conn = SnowflakeConnector(config.model_copy(update={"fetch_concurrency": 4}))
+
+    result = conn.execute_arrow("SELECT id FROM big_table")
+
+    assert result.success
+    assert result.row_count == 6 * _SlowBatch.ROWS
+    assert result.sql_return.column("ID").to_pylist() == list(range(6 * _SlowBatch.ROWS))
+    assert finished != sorted(finished)
+    _cursor(connect).fetch_arrow_all.assert_not_called()
+
+
+def test_arrow_iterator_yields_every_batch_in_order(config: SnowflakeConfig, connect: MagicMock):
+    """Test that the streaming iterator yields every batch, in result order, while downloading ahead."""
+    batches, finished = _slow_batches(5)
+    _cursor(connect).get_result_batches.return_value = batches
+    conn = SnowflakeConnector(config)
+
+    record_batches = list(conn.execute_arrow_iterator("SELECT id FROM big_table", concurrency=3))
+
+    assert len(record_batches) == 5
+    ids = [value for batch in record_batches for value in batch.column(0).to_pylist()]
+    assert ids == list(range(5 * _SlowBatch.ROWS))
+    assert sorted(finished) == list(range(5))
+
+
+# ==================== Asynchronous Query Batch Tests ====================
+
+
+class _FakeAsyncServer:
+    """
+    Stands in for the Snowflake calls behind asynchronous execution.
+
+    Query ``i`` of ``n`` stays running for ``n - i`` status polls, so later queries finish first; a query whose SQL
+    mentions ``missing_table`` fails when its result is fetched.
+    """
+
+    def __init__(self, connect: MagicMock, query_count: int):
+        self.cursor = _cursor(connect)
+        self.query_count = query_count
+        self.sql_by_id: Dict[str, str] = {}
+        self.polls_left: Dict[str, int] = {}
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.current_id = ""
+        self.cursor.execute_async.side_effect = self.execute_async
+        self.cursor.get_results_from_sfqid.side_effect = self.get_results_from_sfqid
+        self.cursor.fetch_arrow_all.side_effect = self.fetch_arrow_all
+        connect.return_value.get_query_status.side_effect = self.polls_left_after_poll
+        connect.return_value.is_still_running.side_effect = lambda polls_left: polls_left > 0
+
+    def execute_async(self, sql: str):
+        query_id = f"query-{len(self.sql_by_id)}"
+        self.sql_by_id[query_id] = sql
+        self.polls_left[query_id] = self.query_count - len(self.polls_left)
+        self.cursor.sfqid = query_id
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+
+    def polls_left_after_poll(self, query_id: str) -> int:
+        self.polls_left[query_id] -= 1
+        return self.polls_left[query_id]
+
+    def get_results_from_sfqid(self, query_id: str):
+        assert self.polls_left[query_id] <= 0, "result fetched while the query was still running"
+        self.in_flight -= 1
+        self.current_id = query_id
+        if "missing_table" in self.sql_by_id[query_id]:
+            raise ProgrammingError(msg="Object 'MISSING_TABLE' does not exist", errno=2003)
+
+    def fetch_arrow_all(self, force_return_table: bool = False) -> pa.Table:
+        # Answers "SELECT <n> AS num" with <n>
+        return pa.table({"NUM": [int(self.sql_by_id[self.current_id].split()[1])]})
+
+
+@pytest.fixture
+def fast_polling(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr("datus_snowflake.connector.ASYNC_POLL_INTERVAL_MIN", 0.001)
+    monkeypatch.setattr("datus_snowflake.connector.ASYNC_POLL_INTERVAL_MAX", 0.005)
+
+
+def test_execute_queries_async_limits_in_flight_and_keeps_order(
+    config: SnowflakeConfig, connect: MagicMock, fast_polling
+):
+    """Test that at most max_concurrent_queries run at once and results come back in input order."""
+    queries = [f"SELECT {i} AS num" for i in range(4)]
+    queries.insert(2, "SELECT * FROM missing_table")
+    server = _FakeAsyncServer(connect, len(queries))
+    conn = SnowflakeConnector(config.model_copy(update={"max_concurrent_queries": 2, "fetch_concurrency": 1}))
+
+    results = conn.execute_queries_arrow(queries)
+
+    assert server.max_in_flight == 2
+    assert len(results) == len(queries)
+    assert not results[2].success and results[2].error
+    assert [r.sql_return.column("NUM").to_pylist() for i, r in enumerate(results) if i != 2] == [[0], [1], [2], [3]]
+    assert all(r.success for i, r in enumerate(results) if i != 2)
+    server.cursor.execute.assert_not_called()
+
+
+def test_execute_queries_session_dependent_batch_runs_serially(config: SnowflakeConfig, connect: MagicMock):
+    """Test that a batch referring to session state never goes through asynchronous submission."""
+    _cursor(connect).fetch_pandas_all.return_value = pa.table({"NUM": [1]}).to_pandas()
+    conn = SnowflakeConnector(config.model_copy(update={"max_concurrent_queries": 4}))
+
+    results = conn.execute_queries(["SET v = 1", "SELECT $v AS num"])
+
+    assert len(results) == 2
+    _cursor(connect).execute_async.assert_not_called()
+
+
+# ==================== Batched DDL Tests ====================
+
+
+def test_fetch_object_ddls_falls_back_per_object(config: SnowflakeConfig, connect: MagicMock):
+    """Test that a failed multi-object GET_DDL query is retried one object at a time and stays aligned."""
+    cursor = _cursor(connect)
+    executed: List[str] = []
+
+    def execute(sql: str, *args):
+        executed.append(sql)
+        names = re.findall(r"GET_DDL\('TABLE', '([^']+)', true\)", sql)
+        if any("MISSING" in name for name in names):
+            raise ProgrammingError(msg="Object does not exist", errno=2003)
+        cursor.fetchone.return_value = tuple(f"create or replace TABLE {name}" for name in names)
+
+    cursor.execute.side_effect = execute
+    conn = SnowflakeConnector(config.model_copy(update={"ddl_batch_size": 3}))
+    full_names = [f'"TEST_DB"."PUBLIC"."{name}"' for name in ["A", "MISSING", "C", "D", "E"]]
+
+    ddls = conn._fetch_object_ddls("TABLE", full_names)
+
+    assert len(ddls) == len(full_names)
+    for full_name, ddl in zip(full_names, ddls):
+        if "MISSING" in full_name:
+            assert ddl.startswith("-- DDL not available")
+        else:
+            assert ddl == f"create or replace TABLE {full_name}"
+    # One failed query for the first batch, three single-object retries, one query for the second batch
+    assert [sql.count("GET_DDL") for sql in executed] == [3, 1, 1, 1, 2]